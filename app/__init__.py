@@ -1,10 +1,12 @@
+import os
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_bcrypt import Bcrypt
 from flask_jwt_extended import JWTManager
-from flask_restx import Api
 from flask_migrate import Migrate
-from .config import Config
+from werkzeug.middleware.proxy_fix import ProxyFix
+from .config import config_by_name
+from .utils.openapi import CachedSpecApi
 
 # Inicializamos las extensiones globalmente para luego asociarlas a la app en la función create_app
 db = SQLAlchemy()  # Para la interacción con la base de datos usando SQLAlchemy
@@ -12,21 +14,53 @@ migrate = Migrate()  # Para gestionar las migraciones de la base de datos
 bcrypt = Bcrypt()  # Para el hash y verificación de contraseñas de los usuarios
 jwt = JWTManager()  # Para la gestión de tokens JWT en la autenticación
 
-def create_app():
-    """Función factory para crear la aplicación Flask y configurar sus componentes."""
+def create_app(config_object=None):
+    """Función factory para crear la aplicación Flask y configurar sus componentes.
+
+    Args:
+        config_object (str | type, opcional): Nombre de la configuración (`development`,
+            `testing`, `production` o `default`) o clase de configuración. Por defecto se
+            usa la variable de entorno APP_CONFIG, o `default` si no está definida.
+
+    Raises:
+        ValueError: Si el nombre de la configuración no existe.
+    """
+    if config_object is None:
+        config_object = os.environ.get('APP_CONFIG', 'default')
+    if isinstance(config_object, str):
+        if config_object not in config_by_name:
+            raise ValueError(f'Unknown configuration: {config_object}')
+        config_object = config_by_name[config_object]
     
     # Creamos una instancia de la aplicación Flask
     app = Flask(__name__)
     
     # Cargamos la configuración de la aplicación desde el archivo de configuración
-    app.config.from_object(Config)
+    app.config.from_object(config_object)
+
+    # Detrás de proxies de confianza, la IP del cliente (`request.remote_addr`) sale de X-Forwarded-For
+    if app.config['PROXY_FIX_X_FOR']:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=app.config['PROXY_FIX_X_FOR'])
 
     # Inicializamos las extensiones con la aplicación
     db.init_app(app)  # Inicializar SQLAlchemy con la app
+
+    # PRAGMA de SQLite en cada conexión (solo si la base de datos es SQLite), antes de abrir ninguna
+    from .utils.sqlite_pragmas import init_sqlite_pragmas
+    init_sqlite_pragmas(app)
+
     bcrypt.init_app(app)  # Inicializar Bcrypt con la app
     jwt.init_app(app)  # Inicializar JWTManager con la app
     migrate.init_app(app, db)  # Inicializar Migrate con la app y la base de datos
 
+    # Perfilador SQL por solicitud (solo si SQL_PROFILER_ENABLED está activo)
+    from .utils.sql_profiler import init_sql_profiler
+    init_sql_profiler(app)
+
+    # Comandos de mantenimiento de la CLI (por ejemplo, `flask reconcile-task-stats`)
+    from .commands import register_commands
+    register_commands(app)
+
     # Autorizador JWT para integrar con la documentación Swagger
     authorizations = {
         'Bearer': {
@@ -38,26 +72,44 @@ def create_app():
     }
 
     # Configuramos la API Flask-RESTX, que nos ayuda a crear endpoints RESTful con documentación Swagger integrada
-    api = Api(
+    # Con API_DOCS_ENABLED desactivado no se registran Swagger UI ni /swagger.json
+    docs_enabled = app.config['API_DOCS_ENABLED']
+    api = CachedSpecApi(
         app,  # La aplicación Flask en la que registramos la API
         title='API - Gestión de Tareas',  # Título para la documentación Swagger
         version='1.0',  # Versión de la API
         description='API para gestión de usuarios, tareas y prioridades de las tareas',  # Descripción de la API
         authorizations=authorizations,  # Añadimos la configuración de JWT a la API
-        security='Bearer'  # Define que los endpoints por defecto usan el esquema de seguridad JWT
+        security='Bearer',  # Define que los endpoints por defecto usan el esquema de seguridad JWT
+        doc='/' if docs_enabled else False,  # Ruta de Swagger UI
+        add_specs=docs_enabled,  # Ruta /swagger.json
+        spec_file=app.config['API_SPEC_FILE']  # Especificación precalculada con `flask export-openapi`
     )
+    app.extensions['restx_api'] = api  # Para exportar la especificación desde la CLI
 
     # Importamos los controladores y namespaces que organizan las rutas/endpoints de la API
     from .controllers.user_controller import user_ns  # Controlador para la gestión de usuarios
     from .controllers.auth_controller import auth_ns  # Controlador para la autenticación
     from .controllers.priority_controller import priority_ns  # Controlador para la gestión de prioridades
     from .controllers.task_controller import task_ns  # Controlador para la gestión de tareas
+    from .controllers.category_controller import category_ns  # Controlador para la gestión de categorías
+    from .controllers.health_controller import health_ns  # Controlador para los chequeos de salud
+    from .controllers.batch_controller import batch_ns  # Controlador para las operaciones por lotes
 
     # Registramos cada namespace (grupo de rutas) en la API
     api.add_namespace(user_ns, path='/users')  # Registrar el namespace de usuarios en /users
     api.add_namespace(auth_ns, path='/auth')  # Registrar el namespace de autenticación en /auth
     api.add_namespace(priority_ns, path='/priorities')  # Registrar el namespace de prioridades en /priorities
     api.add_namespace(task_ns, path='/tasks')  # Registrar el namespace de tareas en /tasks
+    api.add_namespace(category_ns, path='/categories')  # Registrar el namespace de categorías en /categories
+    api.add_namespace(health_ns, path='/health')  # Registrar el namespace de salud en /health
+    api.add_namespace(batch_ns, path='/batch')  # Registrar el namespace de lotes en /batch
+
+    # Precargamos en memoria las tablas de consulta (prioridades y categorías)
+    if app.config['LOOKUP_CACHE_ENABLED'] and app.config['LOOKUP_CACHE_PRELOAD']:
+        from .utils.lookup_cache import preload_lookup_caches
+        with app.app_context():
+            preload_lookup_caches()
 
     # Retornamos la aplicación ya configurada
     return app
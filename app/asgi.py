@@ -0,0 +1,295 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from asgiref.sync import sync_to_async
+from asgiref.wsgi import WsgiToAsgiInstance
+from flask import Response, current_app, request
+from flask_jwt_extended import verify_jwt_in_request
+from flask_jwt_extended.exceptions import JWTExtendedException
+from flask_restx import marshal
+from flask_restx.representations import output_json
+from jwt import PyJWTError
+from sqlalchemy import select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
+from werkzeug.exceptions import HTTPException
+
+from app.controllers.category_controller import category_response_model
+from app.controllers.priority_controller import priority_response_model
+from app.controllers.task_controller import get_task_filters, task_response_model
+from app.models.task import Task
+from app.services.table_version_service import REQUEST_VERSIONS_KEY, TableVersionService
+from app.services.task_service import TaskService
+from app.utils.etag import build_etag
+from app.utils.lookup_cache import category_cache, priority_cache
+from app.utils.pagination import get_page_args, keyset, make_page, page_headers, paginate_items
+from app.utils.sparse_fields import get_fields, restrict
+from app.utils.sqlite_pragmas import apply_sqlite_pragmas
+
+# Driver asíncrono que corresponde a cada dialecto de la URI síncrona
+ASYNC_DRIVERS = {
+    'mysql': 'mysql+aiomysql',
+    'sqlite': 'sqlite+aiosqlite'
+}
+
+
+def async_database_uri(config):
+    """Obtener la URI de la base de datos para el engine asíncrono.
+
+    Args:
+        config (Config): Configuración de la aplicación.
+
+    Returns:
+        str: `ASYNC_SQLALCHEMY_DATABASE_URI` si está definida; si no, la URI síncrona con
+        el driver asíncrono del mismo dialecto (aiomysql o aiosqlite).
+
+    Raises:
+        ValueError: Si el dialecto no tiene un driver asíncrono conocido.
+    """
+    if config.get('ASYNC_SQLALCHEMY_DATABASE_URI'):
+        return config['ASYNC_SQLALCHEMY_DATABASE_URI']
+    url = make_url(config['SQLALCHEMY_DATABASE_URI'])
+    dialect = url.get_backend_name()
+    if dialect not in ASYNC_DRIVERS:
+        raise ValueError(f'No async driver configured for {dialect}')
+    return url.set(drivername=ASYNC_DRIVERS[dialect]).render_as_string(hide_password=False)
+
+
+def is_memory_database(uri):
+    """Indicar si una URI apunta a una base de datos SQLite en memoria.
+
+    Args:
+        uri (str): URI de la base de datos.
+
+    Returns:
+        bool: True si es `sqlite://`, `:memory:` o una URI con `mode=memory`.
+    """
+    url = make_url(uri)
+    return url.get_backend_name() == 'sqlite' and (
+        url.database in (None, '', ':memory:') or url.query.get('mode') == 'memory'
+    )
+
+
+async def _read_body(receive):
+    # Cuerpo completo de la solicitud, o None si el cliente se desconecta antes de enviarlo
+    body = BytesIO()
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            return None
+        body.write(message.get('body', b''))
+        if not message.get('more_body', False):
+            body.seek(0)
+            return body
+
+
+def _build_environ(scope, body):
+    # Entorno WSGI de la solicitud ASGI, construido igual que en `WsgiToAsgi`
+    instance = WsgiToAsgiInstance(None)
+    instance.scope = scope
+    return instance.build_environ(scope, body)
+
+
+async def _send_response(send, status, headers, body):
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [(name.lower().encode('latin1'), value.encode('latin1')) for name, value in headers]
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+class AsyncReadApp:
+    """Aplicación ASGI que atiende las lecturas de tareas, categorías y prioridades con asyncio.
+
+    Los GET de listado y detalle de `/tasks/`, `/categories/` y `/priorities/` consultan la
+    base de datos con el engine asíncrono de SQLAlchemy, de modo que un solo proceso puede
+    tener muchas consultas en curso sin bloquear un hilo por solicitud. La autenticación,
+    la validación de parámetros, los ETags y la serialización reutilizan el código de la
+    aplicación Flask dentro de un contexto de solicitud, por lo que las respuestas son las
+    mismas que las de la ruta síncrona.
+
+    El resto de rutas, y cualquier solicitud de lectura que termine en error (token
+    inválido, parámetros incorrectos, recurso inexistente), se delegan en la aplicación
+    Flask síncrona, que genera la respuesta de error habitual.
+
+    Atributos:
+        flask_app (Flask): Aplicación creada con `create_app`.
+        engine (AsyncEngine): Engine asíncrono de SQLAlchemy.
+    """
+
+    def __init__(self, flask_app):
+        self.flask_app = flask_app
+        config = flask_app.config
+
+        # Mismas opciones de pool que el engine síncrono, con la versión asíncrona de QueuePool;
+        # una base de datos en memoria solo existe en su conexión: se conserva una única con StaticPool
+        database_uri = async_database_uri(config)
+        poolclass = StaticPool if is_memory_database(database_uri) else AsyncAdaptedQueuePool
+        engine_options = dict(config['SQLALCHEMY_ENGINE_OPTIONS'], poolclass=poolclass)
+        self.engine = create_async_engine(database_uri, echo=config['SQLALCHEMY_ECHO'], **engine_options)
+        apply_sqlite_pragmas(self.engine.sync_engine, config.get('SQLITE_PRAGMAS'))
+        self.sessionmaker = async_sessionmaker(self.engine, expire_on_commit=False)
+
+        self.executor = ThreadPoolExecutor(max_workers=config['ASGI_WSGI_THREADS'], thread_name_prefix='wsgi')
+        self.run_wsgi = sync_to_async(self.call_wsgi, thread_sensitive=False, executor=self.executor)
+        self.routes = [
+            (re.compile(r'^/tasks/$'), self.list_tasks, ('tasks', 'categories'), True),
+            (re.compile(r'^/tasks/(?P<task_id>\d+)$'), self.get_task, ('tasks', 'categories'), True),
+            (re.compile(r'^/categories/$'), self.list_categories, ('categories',), True),
+            (re.compile(r'^/categories/(?P<category_id>\d+)$'), self.get_category, ('categories',), True),
+            (re.compile(r'^/priorities/$'), self.list_priorities, ('priorities',), False),
+            (re.compile(r'^/priorities/(?P<priority_id>\d+)$'), self.get_priority, ('priorities',), False),
+        ]
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            return await self.lifespan(receive, send)
+        if scope['type'] == 'http' and scope['method'] == 'GET':
+            for pattern, handler, table_names, auth in self.routes:
+                match = pattern.match(scope['path'])
+                if match:
+                    return await self.handle(scope, receive, send, handler, table_names, auth, match.groupdict())
+        return await self.wsgi(scope, receive, send)
+
+    async def wsgi(self, scope, receive, send, body=None):
+        """Atender la solicitud con la aplicación Flask síncrona en el pool de hilos.
+
+        A diferencia de `WsgiToAsgi`, que ejecuta todas las solicitudes en un mismo hilo,
+        las rutas síncronas se atienden en paralelo en `ASGI_WSGI_THREADS` hilos.
+        """
+        if body is None:
+            body = await _read_body(receive)
+            if body is None:
+                return
+        status, headers, content = await self.run_wsgi(_build_environ(scope, body))
+        await _send_response(send, status, headers, content)
+
+    def call_wsgi(self, environ):
+        """Ejecutar la aplicación Flask con un entorno WSGI y devolver la respuesta completa.
+
+        Args:
+            environ (dict): Entorno WSGI de la solicitud.
+
+        Returns:
+            tuple: Código de estado, lista de cabeceras y cuerpo (bytes).
+        """
+        started = []
+
+        def start_response(status, headers, exc_info=None):
+            started[:] = [status, headers]
+
+        app_iter = self.flask_app.wsgi_app(environ, start_response)
+        try:
+            content = b''.join(app_iter)
+        finally:
+            if hasattr(app_iter, 'close'):
+                app_iter.close()
+        status, headers = started
+        return int(status.split(' ', 1)[0]), headers, content
+
+    async def lifespan(self, receive, send):
+        """Atender el ciclo de vida del servidor: al apagarse cierra el engine asíncrono y el pool de hilos."""
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await self.engine.dispose()
+                self.executor.shutdown(wait=False)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def handle(self, scope, receive, send, handler, table_names, auth, params):
+        """Atender una lectura con el engine asíncrono o delegarla si termina en error."""
+        # Entorno WSGI equivalente, para reutilizar el contexto de solicitud de Flask; el cuerpo
+        # se lee antes por si la solicitud acaba delegándose en la aplicación Flask
+        body = await _read_body(receive)
+        if body is None:
+            return
+        environ = _build_environ(scope, body)
+        response = None
+        with self.flask_app.request_context(environ):
+            try:
+                if auth:
+                    verify_jwt_in_request()
+                async with self.sessionmaker() as session:
+                    versions = TableVersionService.to_versions(
+                        table_names, await session.execute(TableVersionService.statement(table_names))
+                    )
+                    TableVersionService.remember_versions(versions)
+                    etag = build_etag(versions)
+                    if request.if_none_match.contains_weak(etag):
+                        response = Response(status=304)
+                    else:
+                        response = await handler(session, **{name: int(value) for name, value in params.items()})
+                if response is not None:
+                    response.set_etag(etag, weak=True)
+            except (HTTPException, JWTExtendedException, PyJWTError, ValueError):
+                response = None
+
+        if response is None:
+            body.seek(0)
+            return await self.wsgi(scope, receive, send, body)
+        await _send_response(send, response.status_code, response.headers.items(), response.get_data())
+
+    @staticmethod
+    def _render(data, model, headers=None):
+        # Misma serialización que `marshal_fields_with` + `output_json` en la aplicación Flask
+        return output_json(marshal(data, restrict(model, get_fields(model))), 200, headers)
+
+    @staticmethod
+    async def _lookup_entries(session, cache):
+        # Las tablas de consulta se sirven desde la caché en memoria; si está vacía o su versión
+        # no es la de `table_versions` (leída por `handle` para el ETag) se carga aquí. Con
+        # `LOOKUP_CACHE_ENABLED` desactivado la propia caché lee la tabla en cada consulta
+        table_version = request.environ[REQUEST_VERSIONS_KEY][cache.table_name]
+        if current_app.config['LOOKUP_CACHE_ENABLED'] and not cache.is_current(table_version):
+            version = cache.version
+            cache.store((await session.execute(cache.statement())).all(), version, table_version)
+        return cache
+
+    async def list_tasks(self, session):
+        after_id, limit = get_page_args()
+        options = TaskService._read_options(get_fields(task_response_model))
+        statement = TaskService._apply_filters(select(Task).options(*options), **get_task_filters())
+        rows = (await session.scalars(keyset(statement, Task.id, after_id, limit))).all()
+        page = make_page(rows, limit)
+        return self._render(page.items, task_response_model, page_headers(page))
+
+    async def get_task(self, session, task_id):
+        options = TaskService._read_options(get_fields(task_response_model))
+        task = (await session.scalars(select(Task).options(*options).where(Task.id == task_id))).first()
+        return self._render(task, task_response_model) if task else None
+
+    async def list_categories(self, session):
+        after_id, limit = get_page_args()
+        page = paginate_items((await self._lookup_entries(session, category_cache)).all(), after_id, limit)
+        return self._render(page.items, category_response_model, page_headers(page))
+
+    async def get_category(self, session, category_id):
+        category = (await self._lookup_entries(session, category_cache)).get(category_id)
+        return self._render(category, category_response_model) if category else None
+
+    async def list_priorities(self, session):
+        after_id, limit = get_page_args()
+        page = paginate_items((await self._lookup_entries(session, priority_cache)).all(), after_id, limit)
+        return self._render(page.items, priority_response_model, page_headers(page))
+
+    async def get_priority(self, session, priority_id):
+        priority = (await self._lookup_entries(session, priority_cache)).get(priority_id)
+        return self._render(priority, priority_response_model) if priority else None
+
+
+def create_asgi_app(flask_app):
+    """Crear la aplicación ASGI a partir de una aplicación Flask ya configurada.
+
+    Args:
+        flask_app (Flask): Aplicación creada con `create_app`.
+
+    Returns:
+        AsyncReadApp: Aplicación ASGI (por ejemplo, para `uvicorn asgi:app`).
+    """
+    return AsyncReadApp(flask_app)
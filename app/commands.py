@@ -0,0 +1,30 @@
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+@click.command('reconcile-task-stats')
+@with_appcontext
+def reconcile_task_stats_command():
+    """Recalcular desde cero los contadores de estadísticas de tareas."""
+    from app.services.task_counter_service import TaskCounterService
+    rows = TaskCounterService.reconcile()
+    click.echo(f'Task counters rebuilt: {rows} rows')
+
+@click.command('export-openapi')
+@click.argument('path', default='openapi.json')
+@with_appcontext
+def export_openapi_command(path):
+    """Generar la especificación OpenAPI y guardarla en PATH (por defecto openapi.json)."""
+    from app.utils.openapi import export_spec
+    with current_app.test_request_context():
+        spec = export_spec(current_app.extensions['restx_api'], path)
+    click.echo(f'OpenAPI spec written to {path} ({len(spec["paths"])} paths)')
+
+def register_commands(app):
+    """Registrar los comandos de mantenimiento en la CLI de Flask (`flask <comando>`).
+
+    Args:
+        app (Flask): La aplicación en la que se registran los comandos.
+    """
+    app.cli.add_command(reconcile_task_stats_command)
+    app.cli.add_command(export_openapi_command)
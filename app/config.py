@@ -1,5 +1,7 @@
 import os
 from dotenv import load_dotenv
+from sqlalchemy.pool import StaticPool
+from app.utils.db_pool import InstrumentedQueuePool
 
 # Cargar el archivo .env en las variables de entorno
 load_dotenv()
@@ -15,9 +17,51 @@ class Config:
     Atributos:
         SQLALCHEMY_DATABASE_URI (str): URI para la conexión a la base de datos MySQL.
         SQLALCHEMY_TRACK_MODIFICATIONS (bool): Deshabilita el seguimiento de modificaciones de objetos en SQLAlchemy para optimizar el rendimiento.
-        SQLALCHEMY_ECHO (bool): Activa la impresión de todas las consultas SQL ejecutadas por la aplicación en la consola, útil para depuración.
+        SQLALCHEMY_ECHO (bool): Activa la impresión de todas las consultas SQL en la consola; solo para depuración, desactivado por defecto.
+        SQLALCHEMY_ENGINE_OPTIONS (dict): Configuración del pool de conexiones (tamaño, desborde, timeout, reciclado y pre-ping).
         SECRET_KEY (str): Clave secreta para firmar cookies y otras funcionalidades de seguridad de Flask.
         JWT_SECRET_KEY (str): Clave secreta utilizada para generar y verificar tokens JWT.
+        PAGINATION_DEFAULT_LIMIT (int): Tamaño de página usado cuando el cliente no envía `limit`.
+        PAGINATION_MAX_LIMIT (int): Tamaño máximo de página permitido por el servidor.
+        TASK_EXPORT_BATCH_SIZE (int): Filas leídas por lote al exportar las tareas.
+        TASK_BULK_MAX_ITEMS (int): Número máximo de tareas aceptadas por `POST /tasks/bulk`.
+        BATCH_MAX_OPERATIONS (int): Número máximo de operaciones aceptadas por `POST /batch`.
+        IDEMPOTENCY_BACKEND (str): Almacén de las respuestas con `Idempotency-Key` ('memory' o ruta de importación de un almacén compartido).
+        IDEMPOTENCY_CACHE_SIZE (int): Número máximo de respuestas guardadas por el almacén en memoria.
+        IDEMPOTENCY_TTL (int): Segundos que se guarda cada respuesta para repetirla en los reintentos.
+        IDEMPOTENCY_WAIT_TIMEOUT (float): Segundos que un reintento espera a la solicitud original en curso (luego 409).
+        PROXY_FIX_X_FOR (int): Proxies de confianza delante de la aplicación; la IP del cliente se toma de su `X-Forwarded-For` (0 usa la dirección de la conexión).
+        RATE_LIMIT_BACKEND (str): Almacén de los cubos de fichas ('memory' o ruta de importación de un almacén compartido).
+        RATE_LIMIT_MAX_KEYS (int): Número máximo de cubos guardados por el almacén en memoria.
+        LOGIN_RATE_LIMIT_ENABLED (bool): Limita los intentos de `POST /auth/login` por usuario y por IP.
+        LOGIN_RATE_LIMIT_USER_BURST (int): Intentos seguidos permitidos por nombre de usuario.
+        LOGIN_RATE_LIMIT_USER_PER_MINUTE (float): Intentos por minuto que se recuperan por nombre de usuario.
+        LOGIN_RATE_LIMIT_IP_BURST (int): Intentos seguidos permitidos por IP.
+        LOGIN_RATE_LIMIT_IP_PER_MINUTE (float): Intentos por minuto que se recuperan por IP.
+        LOOKUP_CACHE_ENABLED (bool): Sirve las prioridades y categorías desde cachés en memoria del proceso.
+        LOOKUP_CACHE_PRELOAD (bool): Precarga las cachés de prioridades y categorías al crear la aplicación.
+        BCRYPT_LOG_ROUNDS (int): Coste (log2 de rondas) de los hashes bcrypt nuevos.
+        BCRYPT_POOL_SIZE (int): Procesos del pool de bcrypt de cada worker (0 ejecuta bcrypt en el hilo de la solicitud); por defecto, los núcleos repartidos entre los `SERVER_WORKERS`.
+        BCRYPT_POOL_QUEUE_FACTOR (int): Trabajos de bcrypt pendientes admitidos por proceso del pool.
+        BCRYPT_POOL_TIMEOUT (float): Segundos máximos de espera por el pool de bcrypt.
+        SQL_PROFILER_ENABLED (bool): Activa el perfilador SQL por solicitud (cabecera `Server-Timing` y log estructurado).
+        SQL_PROFILER_MAX_STATEMENTS (int): Sentencias SQL por solicitud a partir de las cuales se marca la solicitud.
+        SQL_PROFILER_MAX_DB_MS (float): Milisegundos en base de datos por solicitud a partir de los cuales se marca la solicitud.
+        ASYNC_SQLALCHEMY_DATABASE_URI (str): URI del engine asíncrono de la aplicación ASGI; si no se define se deriva de `SQLALCHEMY_DATABASE_URI`.
+        ASGI_WSGI_THREADS (int): Hilos con los que la aplicación ASGI atiende las rutas síncronas de Flask.
+        API_DOCS_ENABLED (bool): Registra Swagger UI y `/swagger.json`; se recomienda desactivarlo en producción.
+        API_SPEC_FILE (str): Archivo JSON con la especificación OpenAPI precalculada; si no existe se genera en la primera solicitud.
+        SERVER_BIND (str): Dirección en la que escucha el servidor de producción (serve.py).
+        SERVER_WORKERS (int): Procesos worker del servidor de producción; por defecto, uno por núcleo.
+        SERVER_THREADS (int): Hilos por worker del servidor de producción.
+        SERVER_MAX_REQUESTS (int): Solicitudes tras las cuales se recicla un worker (0 lo desactiva).
+        SERVER_MAX_REQUESTS_JITTER (int): Variación aleatoria de `SERVER_MAX_REQUESTS`, para no reciclar todos los workers a la vez.
+        SERVER_TIMEOUT (int): Segundos sin respuesta tras los cuales se reinicia un worker.
+        SERVER_GRACEFUL_TIMEOUT (int): Segundos que tiene un worker para terminar sus solicitudes al recargar o detenerse.
+        SERVER_KEEPALIVE (int): Segundos que se mantiene abierta una conexión keep-alive.
+        FAST_SERIALIZATION_ENABLED (bool): Serializa los listados de tareas, categorías y prioridades sin `marshal`, con la misma salida.
+        RESTX_JSON (dict): Opciones de `json.dumps` para las respuestas; con `JSON_COMPACT` la salida es compacta y se puede codificar con orjson.
+        SQLITE_PRAGMAS (dict): PRAGMA que se ejecutan en cada conexión nueva cuando la base de datos es SQLite.
     """
 
     # URI de conexión a la base de datos MySQL, con las credenciales y el host tomados del archivo .env
@@ -26,11 +70,201 @@ class Config:
     # Desactiva el rastreo de modificaciones para mejorar el rendimiento de la aplicación
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
-    # Activa el logging de las consultas SQL en la consola
-    SQLALCHEMY_ECHO = True
+    # Logging de todas las consultas SQL en la consola: es síncrono y lento, solo para depuración local.
+    # Para analizar el rendimiento usar el perfilador SQL (SQL_PROFILER_ENABLED)
+    SQLALCHEMY_ECHO = os.environ.get('SQLALCHEMY_ECHO', 'false').lower() == 'true'
+
+    # Configuración del pool de conexiones, ajustable con variables de entorno
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'poolclass': InstrumentedQueuePool,  # QueuePool que además mide las esperas por conexión
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 10)),  # Conexiones que se mantienen abiertas
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 20)),  # Conexiones extra permitidas en picos
+        'pool_timeout': float(os.environ.get('DB_POOL_TIMEOUT', 30)),  # Segundos de espera por una conexión libre
+        'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', 1800)),  # Segundos antes de renovar una conexión (evita las cerradas por MySQL)
+        'pool_pre_ping': os.environ.get('DB_POOL_PRE_PING', 'true').lower() == 'true'  # Comprueba la conexión antes de usarla
+    }
 
     # Clave secreta para funcionalidades de seguridad como sesiones y cookies
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'super_secret_key'
 
     # Clave secreta para la autenticación JWT, usada para generar tokens
     JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY') or 'jwt_super_secret_key'
+
+    # Tamaño de página por defecto para los endpoints de listado paginados por cursor
+    PAGINATION_DEFAULT_LIMIT = int(os.environ.get('PAGINATION_DEFAULT_LIMIT', 50))
+
+    # Tamaño máximo de página: ninguna solicitud puede cargar más elementos que este límite
+    PAGINATION_MAX_LIMIT = int(os.environ.get('PAGINATION_MAX_LIMIT', 200))
+
+    # Número de filas que se leen por lote desde la base de datos al exportar las tareas
+    TASK_EXPORT_BATCH_SIZE = int(os.environ.get('TASK_EXPORT_BATCH_SIZE', 1000))
+
+    # Número máximo de tareas que se pueden crear en una sola solicitud a POST /tasks/bulk
+    TASK_BULK_MAX_ITEMS = int(os.environ.get('TASK_BULK_MAX_ITEMS', 5000))
+
+    # Número máximo de operaciones que se pueden ejecutar en una sola solicitud a POST /batch
+    BATCH_MAX_OPERATIONS = int(os.environ.get('BATCH_MAX_OPERATIONS', 100))
+
+    # Respuestas de los POST con Idempotency-Key: almacén, tamaño, caducidad y espera de los reintentos
+    IDEMPOTENCY_BACKEND = os.environ.get('IDEMPOTENCY_BACKEND', 'memory')
+    IDEMPOTENCY_CACHE_SIZE = int(os.environ.get('IDEMPOTENCY_CACHE_SIZE', 10000))
+    IDEMPOTENCY_TTL = int(os.environ.get('IDEMPOTENCY_TTL', 86400))
+    IDEMPOTENCY_WAIT_TIMEOUT = float(os.environ.get('IDEMPOTENCY_WAIT_TIMEOUT', 10))
+
+    # Proxies inversos de confianza (balanceador, nginx) cuyo X-Forwarded-For indica la IP del cliente
+    PROXY_FIX_X_FOR = int(os.environ.get('PROXY_FIX_X_FOR', 0))
+
+    # Limitación de intentos de inicio de sesión (token bucket por usuario y por IP), antes de bcrypt
+    # (un BURST o PER_MINUTE de 0 desactiva ese cubo)
+    RATE_LIMIT_BACKEND = os.environ.get('RATE_LIMIT_BACKEND', 'memory')
+    RATE_LIMIT_MAX_KEYS = int(os.environ.get('RATE_LIMIT_MAX_KEYS', 100000))
+    LOGIN_RATE_LIMIT_ENABLED = os.environ.get('LOGIN_RATE_LIMIT_ENABLED', 'true').lower() == 'true'
+    LOGIN_RATE_LIMIT_USER_BURST = int(os.environ.get('LOGIN_RATE_LIMIT_USER_BURST', 5))
+    LOGIN_RATE_LIMIT_USER_PER_MINUTE = float(os.environ.get('LOGIN_RATE_LIMIT_USER_PER_MINUTE', 5))
+    LOGIN_RATE_LIMIT_IP_BURST = int(os.environ.get('LOGIN_RATE_LIMIT_IP_BURST', 20))
+    LOGIN_RATE_LIMIT_IP_PER_MINUTE = float(os.environ.get('LOGIN_RATE_LIMIT_IP_PER_MINUTE', 30))
+
+    # Servir desde memoria las tablas de prioridades y categorías (si no, se leen en cada consulta)
+    LOOKUP_CACHE_ENABLED = os.environ.get('LOOKUP_CACHE_ENABLED', 'true').lower() == 'true'
+
+    # Precargar en memoria las tablas de prioridades y categorías al arrancar la aplicación
+    LOOKUP_CACHE_PRELOAD = os.environ.get('LOOKUP_CACHE_PRELOAD', 'true').lower() == 'true'
+
+    # Coste de bcrypt para los hashes nuevos; los hashes con menor coste se regeneran al iniciar sesión
+    BCRYPT_LOG_ROUNDS = int(os.environ.get('BCRYPT_LOG_ROUNDS', 12))
+
+    # Procesos dedicados a bcrypt en cada worker, para que el trabajo de CPU no ocupe los hilos de
+    # la API; sin definir (None) se reparten los núcleos entre los SERVER_WORKERS (ver `bcrypt_pool_size`)
+    BCRYPT_POOL_SIZE = int(os.environ['BCRYPT_POOL_SIZE']) if 'BCRYPT_POOL_SIZE' in os.environ else None
+
+    # Trabajos pendientes por proceso antes de rechazar con 503, y tiempo máximo de espera
+    BCRYPT_POOL_QUEUE_FACTOR = int(os.environ.get('BCRYPT_POOL_QUEUE_FACTOR', 4))
+    BCRYPT_POOL_TIMEOUT = float(os.environ.get('BCRYPT_POOL_TIMEOUT', 10))
+
+    # Perfilador SQL por solicitud y presupuestos de sentencias y de tiempo en base de datos
+    SQL_PROFILER_ENABLED = os.environ.get('SQL_PROFILER_ENABLED', 'false').lower() == 'true'
+    SQL_PROFILER_MAX_STATEMENTS = int(os.environ.get('SQL_PROFILER_MAX_STATEMENTS', 20))
+    SQL_PROFILER_MAX_DB_MS = float(os.environ.get('SQL_PROFILER_MAX_DB_MS', 200))
+
+    # Punto de entrada ASGI (asgi.py): URI del engine asíncrono (aiomysql/aiosqlite) e hilos para las rutas síncronas
+    ASYNC_SQLALCHEMY_DATABASE_URI = os.environ.get('ASYNC_SQLALCHEMY_DATABASE_URI')
+    ASGI_WSGI_THREADS = int(os.environ.get('ASGI_WSGI_THREADS', 16))
+
+    # Documentación de la API: activarla o no, y archivo con la especificación precalculada
+    API_DOCS_ENABLED = os.environ.get('API_DOCS_ENABLED', 'true').lower() == 'true'
+    API_SPEC_FILE = os.environ.get('API_SPEC_FILE')
+
+    # Servidor de producción (serve.py): procesos, hilos y reciclado de workers
+    SERVER_BIND = os.environ.get('SERVER_BIND', '0.0.0.0:8000')
+    SERVER_WORKERS = int(os.environ.get('SERVER_WORKERS', os.cpu_count() or 1))
+    SERVER_THREADS = int(os.environ.get('SERVER_THREADS', 4))
+    SERVER_MAX_REQUESTS = int(os.environ.get('SERVER_MAX_REQUESTS', 1000))
+    SERVER_MAX_REQUESTS_JITTER = int(os.environ.get('SERVER_MAX_REQUESTS_JITTER', 100))
+    SERVER_TIMEOUT = int(os.environ.get('SERVER_TIMEOUT', 30))
+    SERVER_GRACEFUL_TIMEOUT = int(os.environ.get('SERVER_GRACEFUL_TIMEOUT', 30))
+    SERVER_KEEPALIVE = int(os.environ.get('SERVER_KEEPALIVE', 5))
+
+    # Serialización rápida de los listados (diccionarios construidos desde tuplas y orjson si está disponible)
+    FAST_SERIALIZATION_ENABLED = os.environ.get('FAST_SERIALIZATION_ENABLED', 'false').lower() == 'true'
+
+    # JSON compacto y sin escapar caracteres no ASCII; es la salida que orjson reproduce byte a byte
+    RESTX_JSON = {'separators': (',', ':'), 'ensure_ascii': False} if os.environ.get('JSON_COMPACT', 'false').lower() == 'true' else {}
+
+    # PRAGMA para las conexiones SQLite; la configuración base (MySQL) no define ninguno
+    SQLITE_PRAGMAS = {}
+
+
+class DevelopmentConfig(Config):
+    """
+    Configuración de desarrollo local sobre un archivo SQLite, sin servidor de base de datos.
+
+    Usa el modo WAL, de modo que las lecturas no bloquean a la escritura en curso, y PRAGMA
+    ajustados para una base local: `synchronous=NORMAL` (con WAL solo se sincroniza en los
+    checkpoints), espera ante bloqueos en lugar de fallar, caché de páginas y temporales en
+    memoria y lectura mediante mmap.
+
+    Atributos:
+        SQLALCHEMY_DATABASE_URI (str): `DEV_DATABASE_URL`; por defecto `instance/dev.db`.
+        SQLITE_PRAGMAS (dict): PRAGMA de rendimiento aplicados a cada conexión.
+    """
+
+    DEBUG = True
+
+    # Ruta relativa a la carpeta `instance` de la aplicación
+    SQLALCHEMY_DATABASE_URI = os.environ.get('DEV_DATABASE_URL', 'sqlite:///dev.db')
+
+    # Pool de conexiones sin las opciones pensadas para MySQL (reciclado y pre-ping)
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'poolclass': InstrumentedQueuePool,
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 10)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 20)),
+        'pool_timeout': float(os.environ.get('DB_POOL_TIMEOUT', 30)),
+        # Las conexiones del pool se usan desde varios hilos, nunca a la vez
+        'connect_args': {'check_same_thread': False}
+    }
+
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'busy_timeout': 5000,  # Milisegundos de espera si otra conexión tiene el bloqueo de escritura
+        'cache_size': -64000,  # Negativo: tamaño en KiB (64 MB)
+        'temp_store': 'MEMORY',
+        'mmap_size': 268435456  # 256 MB
+    }
+
+
+class TestConfig(Config):
+    """
+    Configuración para pruebas: SQLite en memoria y costes mínimos.
+
+    La base de datos en memoria se comparte entre hilos con un único `StaticPool`. bcrypt
+    usa el coste mínimo en el hilo de la solicitud. Las cachés de consulta están
+    desactivadas: las prioridades y las categorías se leen de la base de datos en cada
+    solicitud, de modo que cada prueba ve su estado real.
+
+    Atributos:
+        SQLALCHEMY_DATABASE_URI (str): `TEST_DATABASE_URL`; por defecto SQLite en memoria.
+        SQLITE_PRAGMAS (dict): PRAGMA sin durabilidad, suficientes para datos desechables.
+    """
+
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = os.environ.get('TEST_DATABASE_URL', 'sqlite://')
+    SQLALCHEMY_ECHO = False
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'poolclass': StaticPool,
+        'connect_args': {'check_same_thread': False}
+    }
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'MEMORY',
+        'synchronous': 'OFF',
+        'temp_store': 'MEMORY'
+    }
+    LOOKUP_CACHE_ENABLED = False
+    LOOKUP_CACHE_PRELOAD = False
+    BCRYPT_LOG_ROUNDS = 4
+    BCRYPT_POOL_SIZE = 0
+    LOGIN_RATE_LIMIT_ENABLED = False
+
+
+class ProductionConfig(Config):
+    """
+    Configuración de producción sobre MySQL.
+
+    Usa el pool de conexiones de `Config` con el pre-ping siempre activo (una conexión
+    cerrada por MySQL se detecta antes de usarla), sin logging de SQL y sin modo debug.
+    La documentación de la API está desactivada salvo que se active con `API_DOCS_ENABLED`.
+    """
+
+    DEBUG = False
+    SQLALCHEMY_ECHO = False
+    SQLALCHEMY_ENGINE_OPTIONS = dict(Config.SQLALCHEMY_ENGINE_OPTIONS, pool_pre_ping=True)
+    API_DOCS_ENABLED = os.environ.get('API_DOCS_ENABLED', 'false').lower() == 'true'
+
+
+# Configuraciones que se pueden seleccionar por nombre en `create_app` o con la variable APP_CONFIG
+config_by_name = {
+    'default': Config,
+    'development': DevelopmentConfig,
+    'testing': TestConfig,
+    'production': ProductionConfig
+}
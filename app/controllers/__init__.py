@@ -1,21 +1,41 @@
 from flask import Blueprint
 from flask_restx import Api
-from .user_controller import user_ns  # Importar el namespace de user_controller
-from .task_controller import task_ns  # Importar el namespace de task_controller (si existe)
-from .category_controller import category_ns  # Importar el namespace de category_controller (si existe)
-from .priority_controller import priority_ns  # Importar el namespace de priority_controller (si existe)
-from .auth_controller import auth_ns  # Importar el namespace de auth_controller (si existe)
 
-# Crear un objeto Blueprint para los controladores
-blueprint = Blueprint('api', __name__)
+# El Blueprint con su propia Api no se registra en `create_app`: se construye solo la
+# primera vez que se accede a `app.controllers.blueprint` o `app.controllers.api`, para
+# que importar un controlador no pague el registro de todos los namespaces.
+_blueprint_api = None
 
-# Crear un objeto Api de Flask-RESTx
-api = Api(blueprint, version='1.0', title='API de Gestión', description='API para gestión de usuarios, tareas, categorías y prioridades')
+def _build_blueprint_api():
+    """Crear el Blueprint y la Api de Flask-RESTx con todos los namespaces registrados."""
+    from .user_controller import user_ns  # Importar el namespace de user_controller
+    from .task_controller import task_ns  # Importar el namespace de task_controller
+    from .category_controller import category_ns  # Importar el namespace de category_controller
+    from .priority_controller import priority_ns  # Importar el namespace de priority_controller
+    from .auth_controller import auth_ns  # Importar el namespace de auth_controller
+    from .health_controller import health_ns  # Importar el namespace de health_controller
+    from .batch_controller import batch_ns  # Importar el namespace de batch_controller
 
-# Registrar los namespaces en la API
-api.add_namespace(user_ns)  # Registrar el namespace de usuarios
-api.add_namespace(task_ns)  # Registrar el namespace de tareas
-api.add_namespace(category_ns)  # Registrar el namespace de categorías
-api.add_namespace(priority_ns)  # Registrar el namespace de prioridades
-api.add_namespace(auth_ns)  # Registrar el namespace de autenticación
+    # Crear un objeto Blueprint para los controladores
+    blueprint = Blueprint('api', __name__)
 
+    # Crear un objeto Api de Flask-RESTx
+    api = Api(blueprint, version='1.0', title='API de Gestión', description='API para gestión de usuarios, tareas, categorías y prioridades')
+
+    # Registrar los namespaces en la API
+    api.add_namespace(user_ns)  # Registrar el namespace de usuarios
+    api.add_namespace(task_ns)  # Registrar el namespace de tareas
+    api.add_namespace(category_ns)  # Registrar el namespace de categorías
+    api.add_namespace(priority_ns)  # Registrar el namespace de prioridades
+    api.add_namespace(auth_ns)  # Registrar el namespace de autenticación
+    api.add_namespace(health_ns)  # Registrar el namespace de salud
+    api.add_namespace(batch_ns)  # Registrar el namespace de lotes
+    return blueprint, api
+
+def __getattr__(name):
+    global _blueprint_api
+    if name in ('blueprint', 'api'):
+        if _blueprint_api is None:
+            _blueprint_api = _build_blueprint_api()
+        return _blueprint_api[0] if name == 'blueprint' else _blueprint_api[1]
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
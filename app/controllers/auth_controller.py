@@ -1,8 +1,9 @@
-from flask import request, jsonify
+from flask import request
 from flask_restx import Namespace, Resource, fields
 from app.services.user_service import UserService
 from flask_jwt_extended import create_access_token
-from app import bcrypt
+from app.utils.password_hasher import HasherBusyError, check_password, reject_password
+from app.utils.rate_limit import login_retry_after
 
 # Crear un espacio de nombres (namespace) para la autenticación
 auth_ns = Namespace('auth', description='Operaciones de autenticación')
@@ -22,17 +23,36 @@ class AuthResource(Resource):
         """Iniciar sesión y obtener un token JWT"""
         # Obtener los datos enviados en el cuerpo de la solicitud en formato JSON
         data = request.get_json()
+
+        # Limitar los intentos por IP y por usuario antes de gastar CPU en bcrypt
+        retry_after = login_retry_after(data['username'], request.remote_addr)
+        if retry_after:
+            return {'message': 'Too many login attempts, try again later'}, 429, {'Retry-After': str(retry_after)}
         
         # Buscar al usuario en la base de datos según el nombre de usuario proporcionado
         user = UserService.get_user_by_username(data['username'])
         
         # Verificar si el usuario existe y si la contraseña es correcta usando bcrypt
-        if user and bcrypt.check_password_hash(user.password, data['password']):
-            # Si la autenticación es correcta, generar un token JWT
-            access_token = create_access_token(identity=user.username)
+        # (la verificación se ejecuta en el pool de procesos para no bloquear los hilos de la API).
+        # Un usuario inexistente se rechaza sin bcrypt, pero en el mismo tiempo que una verificación
+        try:
+            valid = check_password(user.password, data['password']) if user is not None else reject_password()
+        except HasherBusyError:
+            return {'message': 'Service busy, try again later'}, 503
+
+        if valid:
+            # Si la autenticación es correcta, generar un token JWT con los claims de autorización,
+            # para que los endpoints protegidos no tengan que consultar al usuario en la base de datos
+            access_token = create_access_token(
+                identity=user.username,
+                additional_claims=UserService.get_user_claims(user)
+            )
+
+            # Actualizar el hash si se generó con un coste bcrypt anterior al configurado
+            UserService.rehash_password_if_needed(user, data['password'])
             
             # Devolver el token JWT como respuesta en formato JSON
-            return jsonify({'access_token': access_token})
+            return {'access_token': access_token}, 200
         
         # Si la autenticación falla (usuario no encontrado o contraseña incorrecta), devolver un error 401
-        return jsonify({'message': 'Invalid credentials'}), 401
\ No newline at end of file
+        return {'message': 'Invalid credentials'}, 401
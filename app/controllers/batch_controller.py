@@ -0,0 +1,110 @@
+from flask import current_app, request
+from flask_restx import Namespace, Resource, fields, marshal
+from sqlalchemy.exc import IntegrityError
+from werkzeug.exceptions import BadRequest
+from app.controllers.category_controller import category_model, category_response_model
+from app.controllers.priority_controller import priority_model, priority_response_model
+from app.controllers.task_controller import task_model, task_patch_model, task_response_model
+from app.services.batch_service import BATCH_ACTIONS, BATCH_RESOURCES, BatchConflict, BatchError, BatchNotFound, BatchService
+from app.utils.idempotency import idempotent
+from flask_jwt_extended import jwt_required
+
+# Namespace para las operaciones por lotes
+batch_ns = Namespace('batch', description='Operaciones por lotes sobre tareas, categorías y prioridades')
+
+# Modelo de entrada de cada operación del lote
+batch_operation_model = batch_ns.model('BatchOperation', {
+    'resource': fields.String(required=True, enum=list(BATCH_RESOURCES), description='Recurso sobre el que se opera'),
+    'action': fields.String(required=True, enum=list(BATCH_ACTIONS), description='Acción a ejecutar'),
+    'id': fields.Integer(description='ID del elemento (obligatorio en update y delete)'),
+    'data': fields.Raw(description='Datos del elemento, con el mismo formato que su endpoint (en create y update)')
+})
+
+batch_model = batch_ns.model('Batch', {
+    'operations': fields.List(fields.Nested(batch_operation_model), required=True, description='Operaciones, en orden')
+})
+
+# Modelo de salida con el resultado de cada operación
+batch_result_model = batch_ns.model('BatchResult', {
+    'index': fields.Integer(description='Posición de la operación en la solicitud'),
+    'status': fields.String(description='Resultado: created, updated o deleted'),
+    'id': fields.Integer(description='ID del elemento'),
+    'data': fields.Raw(description='Elemento resultante, con el mismo formato que su endpoint')
+})
+
+batch_response_model = batch_ns.model('BatchResponse', {
+    'results': fields.List(fields.Nested(batch_result_model, skip_none=True), description='Resultado por operación')
+})
+
+# Modelo de entrada de `data` según el recurso y la acción (los de sus endpoints)
+DATA_MODELS = {
+    ('tasks', 'create'): task_model,
+    ('tasks', 'update'): task_patch_model,
+    ('categories', 'create'): category_model,
+    ('categories', 'update'): category_model,
+    ('priorities', 'create'): priority_model,
+    ('priorities', 'update'): priority_model
+}
+
+# Serialización del resultado de cada recurso con el modelo de respuesta de su endpoint
+SERIALIZERS = {
+    'tasks': lambda task: marshal(task, task_response_model),
+    'categories': lambda category: marshal(category, category_response_model),
+    'priorities': lambda priority: marshal(priority, priority_response_model)
+}
+
+
+def validate_operation(index, operation):
+    """Validar una operación del lote antes de ejecutar ninguna.
+
+    Args:
+        index (int): Posición de la operación en la solicitud.
+        operation (dict): Operación validada con `batch_operation_model`.
+
+    Returns:
+        dict: La operación con `data` normalizado para el servicio.
+    """
+    resource, action = operation['resource'], operation['action']
+    if action != 'create' and operation.get('id') is None:
+        batch_ns.abort(400, 'Missing id', index=index)
+    model = DATA_MODELS.get((resource, action))
+    if model is None:
+        return operation
+    data = operation.get('data')
+    if not isinstance(data, dict):
+        batch_ns.abort(400, 'Missing data', index=index)
+    try:
+        model.validate(data)
+    except BadRequest as e:
+        batch_ns.abort(400, 'Input payload validation failed', index=index, errors=e.data.get('errors'))
+    if model is task_patch_model:
+        # Igual que PATCH /tasks/<id>: solo se pasan al servicio los campos del modelo
+        data = {name: data.get(name) for name in task_patch_model.keys()}
+    return dict(operation, data=data)
+
+
+@batch_ns.route('')
+class BatchResource(Resource):
+    @batch_ns.expect(batch_model, validate=True)
+    @jwt_required()
+    @idempotent(batch_ns)
+    @batch_ns.marshal_with(batch_response_model)
+    def post(self):
+        """Ejecutar varias operaciones en una sola transacción (todas o ninguna)"""
+        operations = request.get_json()['operations']
+        if len(operations) > current_app.config['BATCH_MAX_OPERATIONS']:
+            batch_ns.abort(413, 'Too many operations in a single request')
+        operations = [validate_operation(index, operation) for index, operation in enumerate(operations)]
+
+        try:
+            results = BatchService.run(operations, SERIALIZERS)
+        except BatchNotFound as e:
+            # Ninguna operación se confirmó: se informa la que falló
+            batch_ns.abort(404, str(e), index=e.index)
+        except BatchConflict as e:
+            batch_ns.abort(409, str(e), index=e.index)
+        except BatchError as e:
+            batch_ns.abort(400, str(e), index=e.index)
+        except IntegrityError:
+            batch_ns.abort(409, 'Batch conflicts with existing data')
+        return {'results': results}, 200
@@ -1,6 +1,11 @@
 from flask import request
 from flask_restx import Namespace, Resource, fields
 from app.services.category_service import CategoryService
+from app.utils.etag import conditional_get
+from app.utils.idempotency import idempotent
+from app.utils.fast_json import fast_list_with, fast_serialization_enabled
+from app.utils.pagination import get_page_args, page_headers
+from app.utils.sparse_fields import get_fields, marshal_fields_with, pick
 from flask_jwt_extended import jwt_required
 from flask_jwt_extended import get_jwt_identity
 #from app.services.role_service import RoleService
@@ -21,15 +26,25 @@ category_response_model = category_ns.model('CategoryResponse', {
 
 @category_ns.route('/')
 class CategoryListResource(Resource):
+    @category_ns.doc(params={'after': 'Cursor opaco devuelto en la cabecera X-Next-Cursor', 'limit': 'Tamaño de página'})
     @jwt_required()  # Requiere autenticación JWT para acceder a este endpoint
-    @category_ns.marshal_list_with(category_response_model)  # Serialización automática de la respuesta
+    @conditional_get('categories')  # Responde 304 si el cliente ya tiene la versión actual
+    @fast_list_with(category_ns, category_response_model)  # Serialización de la respuesta (rápida si está activada)
     def get(self):
-        """Obtener todas las categorías"""
-        categories = CategoryService.get_all_categories()  # Llama al servicio para obtener todas las categorías
-        return categories, 200  # Retorna la lista de categorías con un código de estado 200 (OK)
+        """Obtener una página de categorías"""
+        try:
+            after_id, limit = get_page_args()  # Lee el cursor y el tamaño de página de la URL
+            fields = get_fields(category_response_model)
+        except ValueError as e:
+            category_ns.abort(400, str(e))
+        page = CategoryService.get_all_categories(after_id, limit)  # Llama al servicio para obtener la página
+        if fast_serialization_enabled():
+            return [pick(CategoryService.serialize_category(category), fields) for category in page.items], 200, page_headers(page)
+        return page.items, 200, page_headers(page)  # Retorna la página con el cursor de la siguiente en las cabeceras
 
     @category_ns.expect(category_model, validate=True)  # Espera los datos de entrada según el modelo de categoría
     @jwt_required()  # Requiere autenticación JWT para acceder a este endpoint
+    @idempotent(category_ns)  # Los reintentos con la misma Idempotency-Key repiten la primera respuesta
     @category_ns.marshal_with(category_response_model, code=201)  # Serializa la respuesta de la categoría creada
     def post(self):
         """Crear una nueva categoría (Solo para administradores)"""
@@ -41,7 +56,8 @@ class CategoryListResource(Resource):
 @category_ns.param('category_id', 'El ID de la categoría')
 class CategoryResource(Resource):
     @jwt_required()  # Requiere autenticación JWT
-    @category_ns.marshal_with(category_response_model)
+    @conditional_get('categories')  # Responde 304 si el cliente ya tiene la versión actual
+    @marshal_fields_with(category_ns, category_response_model)
     def get(self, category_id):
         """Obtener una categoría por su ID"""
         category = CategoryService.get_category_by_id(category_id)  # Llama al servicio para obtener la categoría
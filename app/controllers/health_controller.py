@@ -0,0 +1,36 @@
+from flask_restx import Namespace, Resource, fields
+from app import db
+from app.utils.db_pool import get_pool_status
+
+# Crear un espacio de nombres (namespace) para los chequeos de salud
+health_ns = Namespace('health', description='Estado de la aplicación y sus recursos')
+
+# Modelo de salida con las estadísticas de espera del pool
+pool_wait_model = health_ns.model('DbPoolWait', {
+    'count': fields.Integer(description='Conexiones obtenidas del pool'),
+    'total_ms': fields.Float(description='Tiempo total de espera en milisegundos'),
+    'avg_ms': fields.Float(description='Espera media en milisegundos'),
+    'max_ms': fields.Float(description='Mayor espera en milisegundos'),
+    'timeouts': fields.Integer(description='Esperas que agotaron pool_timeout')
+})
+
+# Modelo de salida con el estado del pool de conexiones
+pool_status_model = health_ns.model('DbPoolStatus', {
+    'pool_class': fields.String(description='Clase del pool de conexiones'),
+    'size': fields.Integer(description='Tamaño base del pool'),
+    'checked_out': fields.Integer(description='Conexiones en uso'),
+    'idle': fields.Integer(description='Conexiones libres en el pool'),
+    'overflow': fields.Integer(description='Conexiones abiertas por encima del tamaño base'),
+    'max_overflow': fields.Integer(description='Máximo de conexiones de desborde'),
+    'timeout': fields.Float(description='Segundos máximos de espera por una conexión'),
+    'wait': fields.Nested(pool_wait_model, allow_null=True, description='Estadísticas de espera'),
+    'status': fields.String(description='Estado textual para pools que no son QueuePool')
+})
+
+@health_ns.route('/db-pool')
+class DbPoolResource(Resource):
+    @health_ns.doc('get_db_pool_status')
+    @health_ns.marshal_with(pool_status_model, skip_none=True)
+    def get(self):
+        """Obtener el estado del pool de conexiones a la base de datos"""
+        return get_pool_status(db.engine), 200
@@ -1,6 +1,11 @@
 from flask import request, jsonify
 from flask_restx import Namespace, Resource, fields
 from app.services.priority_service import PriorityService
+from app.utils.etag import conditional_get
+from app.utils.idempotency import idempotent
+from app.utils.fast_json import fast_list_with, fast_serialization_enabled
+from app.utils.pagination import get_page_args, page_headers
+from app.utils.sparse_fields import get_fields, marshal_fields_with, pick
 
 # Crear un espacio de nombres (namespace) para prioridades
 priority_ns = Namespace('priorities', description='Operaciones relacionadas con las prioridades')
@@ -19,15 +24,24 @@ priority_response_model = priority_ns.model('PriorityResponse', {
 # Controlador para manejar las operaciones CRUD de prioridades
 @priority_ns.route('/')
 class PriorityListResource(Resource):
-    @priority_ns.doc('get_priorities')
-    @priority_ns.marshal_list_with(priority_response_model)  # Formato de respuesta
+    @priority_ns.doc('get_priorities', params={'after': 'Cursor opaco devuelto en la cabecera X-Next-Cursor', 'limit': 'Tamaño de página'})
+    @conditional_get('priorities')  # Responde 304 si el cliente ya tiene la versión actual
+    @fast_list_with(priority_ns, priority_response_model)  # Formato de respuesta
     def get(self):
-        """Obtener todas las prioridades"""
-        priorities = PriorityService.get_all_priorities()
-        return priorities, 200
+        """Obtener una página de prioridades"""
+        try:
+            after_id, limit = get_page_args()
+            fields = get_fields(priority_response_model)
+        except ValueError as e:
+            priority_ns.abort(400, str(e))
+        page = PriorityService.get_all_priorities(after_id, limit)
+        if fast_serialization_enabled():
+            return [pick(PriorityService.serialize_priority(priority), fields) for priority in page.items], 200, page_headers(page)
+        return page.items, 200, page_headers(page)
 
     @priority_ns.doc('create_priority')
     @priority_ns.expect(priority_model, validate=True)  # Modelo esperado
+    @idempotent(priority_ns)  # Los reintentos con la misma Idempotency-Key repiten la primera respuesta
     @priority_ns.marshal_with(priority_response_model, code=201)  # Formato de respuesta
     def post(self):
         """Crear una nueva prioridad"""
@@ -42,7 +56,8 @@ class PriorityListResource(Resource):
 @priority_ns.param('priority_id', 'El ID de la prioridad')
 class PriorityResource(Resource):
     @priority_ns.doc('get_priority_by_id')
-    @priority_ns.marshal_with(priority_response_model)
+    @conditional_get('priorities')  # Responde 304 si el cliente ya tiene la versión actual
+    @marshal_fields_with(priority_ns, priority_response_model)
     def get(self, priority_id):
         """Obtener una prioridad por su ID"""
         priority = PriorityService.get_priority_by_id(priority_id)
@@ -1,6 +1,14 @@
-from flask import request
-from flask_restx import Namespace, Resource, fields
+import csv
+import io
+import json
+from flask import Response, current_app, request, stream_with_context
+from flask_restx import Namespace, Resource, fields, inputs, marshal
 from app.services.task_service import TaskService
+from app.utils.etag import conditional_get
+from app.utils.idempotency import idempotent
+from app.utils.fast_json import fast_list_with, fast_serialization_enabled
+from app.utils.pagination import decode_cursor, get_page_args, page_headers
+from app.utils.sparse_fields import get_fields, marshal_fields_with
 from flask_jwt_extended import jwt_required
 
 # Namespace para Tareas
@@ -10,7 +18,26 @@ task_ns = Namespace('tasks', description='Operaciones con las tareas')
 task_model = task_ns.model('Task', {
     'title': fields.String(required=True, description='Título de la tarea'),
     'description': fields.String(description='Descripción de la tarea'),
-    'category_ids': fields.List(fields.Integer, description='IDs de las categorías asociadas')
+    'category_ids': fields.List(fields.Integer, description='IDs de las categorías asociadas'),
+    'priority_id': fields.Integer(description='ID de la prioridad de la tarea (obligatorio)')
+})
+
+# Modelo de entrada para la creación masiva de tareas
+task_bulk_model = task_ns.model('TaskBulk', {
+    'tasks': fields.List(fields.Nested(task_model), required=True, description='Tareas a crear')
+})
+
+# Modelo de salida con el resultado de cada tarea de la creación masiva
+task_bulk_result_model = task_ns.model('TaskBulkResult', {
+    'index': fields.Integer(description='Posición de la tarea en la solicitud'),
+    'status': fields.String(description='Resultado: created o error'),
+    'id': fields.Integer(description='ID de la tarea creada'),
+    'message': fields.String(description='Motivo del error')
+})
+
+task_bulk_response_model = task_ns.model('TaskBulkResponse', {
+    'created': fields.Integer(description='Número de tareas creadas'),
+    'results': fields.List(fields.Nested(task_bulk_result_model, skip_none=True), description='Resultado por tarea')
 })
 
 # Modelo de salida para tareas (respuesta)
@@ -25,20 +52,273 @@ task_response_model = task_ns.model('TaskResponse', {
     })), description='Lista de categorías asociadas a la tarea')
 })
 
+# Modelo de entrada para la actualización parcial de una tarea (todos los campos son opcionales)
+task_patch_model = task_ns.model('TaskPatch', {
+    'title': fields.String(description='Título de la tarea'),
+    'description': fields.String(description='Descripción de la tarea'),
+    'completed': fields.Boolean(description='Estado de la tarea (completada o no)'),
+    'priority_id': fields.Integer(description='ID de la prioridad de la tarea'),
+    'category_ids': fields.List(fields.Integer, description='IDs de las categorías asociadas')
+})
+
+# Modelos de salida para las estadísticas de tareas
+task_stats_group_model = task_ns.model('TaskStatsGroup', {
+    'id': fields.Integer(description='ID de la prioridad o categoría'),
+    'name': fields.String(description='Nombre de la prioridad o categoría'),
+    'total': fields.Integer(description='Número de tareas'),
+    'completed': fields.Integer(description='Tareas completadas'),
+    'open': fields.Integer(description='Tareas pendientes')
+})
+
+task_stats_model = task_ns.model('TaskStats', {
+    'total': fields.Integer(description='Número total de tareas'),
+    'completed': fields.Integer(description='Tareas completadas'),
+    'open': fields.Integer(description='Tareas pendientes'),
+    'by_priority': fields.List(fields.Nested(task_stats_group_model), description='Tareas por prioridad'),
+    'by_category': fields.List(fields.Nested(task_stats_group_model), description='Tareas por categoría')
+})
+
+# Modelo de entrada para completar o reabrir tareas en bloque (por IDs o por filtro)
+task_transition_filter_model = task_ns.model('TaskTransitionFilter', {
+    'priority_id': fields.Integer(description='Seleccionar las tareas de esta prioridad'),
+    'category_id': fields.Integer(description='Seleccionar las tareas de esta categoría')
+})
+
+task_transition_model = task_ns.model('TaskTransition', {
+    'ids': fields.List(fields.Integer, description='IDs de las tareas'),
+    'filter': fields.Nested(task_transition_filter_model, description='Filtro de tareas, alternativo a ids')
+})
+
+task_transition_response_model = task_ns.model('TaskTransitionResponse', {
+    'updated': fields.Integer(description='Número de tareas modificadas')
+})
+
+def get_task_filters():
+    """Lee los filtros de tareas de la URL (`completed`, `priority_id` y `category_id`).
+
+    Returns:
+        dict: Filtros presentes en la solicitud, listos para pasarse a `TaskService`.
+
+    Raises:
+        ValueError: Si algún filtro no tiene un valor válido.
+    """
+    filters = {}
+    if request.args.get('completed') not in (None, ''):
+        filters['completed'] = inputs.boolean(request.args['completed'])
+    for name in ('priority_id', 'category_id'):
+        if request.args.get(name) not in (None, ''):
+            try:
+                filters[name] = int(request.args[name])
+            except ValueError:
+                raise ValueError(f'Invalid {name}')
+    return filters
+
 @task_ns.route('/')
 class TaskListResource(Resource):
+    @task_ns.doc(params={
+        'after': 'Cursor opaco devuelto en la cabecera X-Next-Cursor',
+        'limit': 'Tamaño de página',
+        'completed': 'Filtrar por estado (true/false)',
+        'priority_id': 'Filtrar por ID de prioridad',
+        'category_id': 'Filtrar por ID de categoría'
+    })
     @jwt_required()
-    @task_ns.marshal_list_with(task_response_model)  # Serialización automática de la lista de tareas
+    @conditional_get('tasks', 'categories')  # ETag según las versiones de tareas y categorías
+    @fast_list_with(task_ns, task_response_model)  # Serialización de la lista de tareas (rápida si está activada)
     def get(self):
-        """Obtener todas las tareas"""
-        tasks = TaskService.get_all_tasks()
-        return tasks, 200
+        """Obtener una página de tareas, opcionalmente filtrada"""
+        try:
+            after_id, limit = get_page_args()
+            filters = get_task_filters()
+            fields = get_fields(task_response_model)
+        except ValueError as e:
+            task_ns.abort(400, str(e))
+        if fast_serialization_enabled():
+            page = TaskService.get_all_task_dicts(after_id, limit, fields=fields, **filters)
+        else:
+            page = TaskService.get_all_tasks(after_id, limit, fields=fields, **filters)
+        return page.items, 200, page_headers(page)
 
     @task_ns.expect(task_model, validate=True)
     @jwt_required()
+    @idempotent(task_ns)  # Los reintentos con la misma Idempotency-Key repiten la primera respuesta
     @task_ns.marshal_with(task_response_model, code=201)  # Serialización automática de la tarea creada
     def post(self):
         """Crear una nueva tarea"""
         data = request.get_json()
-        task = TaskService.create_task(data['title'], data['description'], data['category_ids'])
+        try:
+            task = TaskService.create_task(data['title'], data.get('description'), data.get('category_ids') or [], data.get('priority_id'))
+        except ValueError as e:
+            task_ns.abort(400, str(e))
         return task, 201
+
+@task_ns.route('/<int:task_id>')
+@task_ns.param('task_id', 'El ID de la tarea')
+class TaskResource(Resource):
+    @jwt_required()
+    @conditional_get('tasks', 'categories')  # ETag según las versiones de tareas y categorías
+    @marshal_fields_with(task_ns, task_response_model)
+    def get(self, task_id):
+        """Obtener una tarea por su ID"""
+        # Los campos ya los validó `marshal_fields_with`
+        task = TaskService.get_task_by_id(task_id, get_fields(task_response_model))
+        if not task:
+            task_ns.abort(404, 'Task not found')
+        return task, 200
+
+    @task_ns.expect(task_patch_model, validate=True)
+    @jwt_required()
+    @task_ns.marshal_with(task_response_model)
+    def patch(self, task_id):
+        """Actualizar parcialmente una tarea"""
+        data = request.get_json()
+        changes = {name: data.get(name) for name in task_patch_model.keys()}
+        try:
+            TaskService.patch_task(task_id, **changes)
+        except ValueError as e:
+            task_ns.abort(404 if str(e) == 'Task not found' else 400, str(e))
+        # La tarea se lee una sola vez, ya actualizada, para devolverla
+        return TaskService.get_task_by_id(task_id), 200
+
+    @jwt_required()
+    def delete(self, task_id):
+        """Eliminar una tarea por su ID"""
+        try:
+            TaskService.delete_task(task_id)
+        except ValueError as e:
+            task_ns.abort(404, str(e))
+        return {'message': 'Task deleted successfully'}, 200
+
+@task_ns.route('/bulk')
+class TaskBulkResource(Resource):
+    @task_ns.expect(task_bulk_model, validate=True)
+    @jwt_required()
+    @idempotent(task_ns)
+    @task_ns.marshal_with(task_bulk_response_model, code=201)
+    def post(self):
+        """Crear muchas tareas en una sola transacción"""
+        items = request.get_json()['tasks']
+        if len(items) > current_app.config['TASK_BULK_MAX_ITEMS']:
+            task_ns.abort(413, 'Too many tasks in a single request')
+
+        results = TaskService.create_tasks_bulk(items)
+        created = sum(1 for result in results if result['status'] == 'created')
+
+        # 201 si se crearon todas las tareas, 207 si alguna falló
+        code = 201 if created == len(results) else 207
+        return {'created': created, 'results': results}, code
+
+# Formatos soportados por la exportación y su tipo de contenido
+EXPORT_MIMETYPES = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv'
+}
+
+def _export_ndjson(tasks):
+    """Genera una línea JSON por tarea usando los campos de `task_response_model`."""
+    for task in tasks:
+        yield json.dumps(marshal(task, task_response_model)) + '\n'
+
+def _export_csv(tasks):
+    """Genera la exportación en CSV; las categorías se unen por ';' en una sola columna."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    columns = list(task_response_model.keys())
+    writer.writerow(columns)
+    for task in tasks:
+        data = marshal(task, task_response_model)
+        data['categories'] = ';'.join(category['name'] for category in data['categories'] or [])
+        writer.writerow([data[column] for column in columns])
+        # Entregar lo escrito y vaciar el buffer para no acumular la exportación en memoria
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+
+@task_ns.route('/export')
+class TaskExportResource(Resource):
+    @task_ns.doc(params={'format': 'Formato de salida: ndjson (por defecto) o csv'})
+    @jwt_required()
+    def get(self):
+        """Exportar todas las tareas en streaming (NDJSON o CSV)"""
+        export_format = request.args.get('format', 'ndjson')
+        if export_format not in EXPORT_MIMETYPES:
+            task_ns.abort(400, 'Unsupported export format')
+
+        tasks = TaskService.iter_tasks(current_app.config['TASK_EXPORT_BATCH_SIZE'])
+        generator = _export_csv(tasks) if export_format == 'csv' else _export_ndjson(tasks)
+
+        # La respuesta se construye a medida que se leen los lotes de la base de datos
+        response = Response(stream_with_context(generator), mimetype=EXPORT_MIMETYPES[export_format])
+        response.headers['Content-Disposition'] = f'attachment; filename=tasks.{export_format}'
+        return response
+
+@task_ns.route('/search')
+class TaskSearchResource(Resource):
+    @task_ns.doc(params={
+        'q': 'Texto a buscar en el título y la descripción',
+        'after': 'Cursor opaco devuelto en la cabecera X-Next-Cursor',
+        'limit': 'Tamaño de página'
+    })
+    @jwt_required()
+    @marshal_fields_with(task_ns, task_response_model, as_list=True)
+    def get(self):
+        """Buscar tareas por título y descripción, ordenadas por relevancia"""
+        query_text = request.args.get('q', '').strip()
+        if not query_text:
+            task_ns.abort(400, 'Missing search query')
+        try:
+            # En la búsqueda el cursor guarda la posición dentro del ranking
+            offset = decode_cursor(request.args.get('after')) or 0
+            _, limit = get_page_args()
+            fields = get_fields(task_response_model)
+        except ValueError as e:
+            task_ns.abort(400, str(e))
+        page = TaskService.search_tasks(query_text, offset, limit, fields)
+        return page.items, 200, page_headers(page)
+
+@task_ns.route('/stats')
+class TaskStatsResource(Resource):
+    @jwt_required()
+    @conditional_get('tasks', 'categories', 'priorities')  # Los contadores cambian con cada escritura de tareas
+    @task_ns.marshal_with(task_stats_model)
+    def get(self):
+        """Obtener estadísticas de tareas: totales, por prioridad y por categoría"""
+        return TaskService.get_stats(), 200
+
+def transition_tasks(completed):
+    """Completar o reabrir en bloque las tareas indicadas en el cuerpo de la solicitud.
+
+    Args:
+        completed (bool): Estado a asignar.
+
+    Returns:
+        tuple: Respuesta con el número de tareas modificadas y el código HTTP.
+    """
+    data = request.get_json()
+    task_ids = data.get('ids')
+    filters = {name: value for name, value in (data.get('filter') or {}).items() if value is not None}
+    if (task_ids is None) == (not filters):
+        task_ns.abort(400, 'Provide either ids or a filter')
+    if task_ids is not None and len(task_ids) > current_app.config['TASK_BULK_MAX_ITEMS']:
+        task_ns.abort(413, 'Too many tasks in a single request')
+
+    updated = TaskService.set_tasks_completed(completed, task_ids, **filters)
+    return {'updated': updated}, 200
+
+@task_ns.route('/complete')
+class TaskCompleteResource(Resource):
+    @task_ns.expect(task_transition_model, validate=True)
+    @jwt_required()
+    @task_ns.marshal_with(task_transition_response_model)
+    def post(self):
+        """Marcar como completadas muchas tareas con una sola sentencia UPDATE"""
+        return transition_tasks(True)
+
+@task_ns.route('/reopen')
+class TaskReopenResource(Resource):
+    @task_ns.expect(task_transition_model, validate=True)
+    @jwt_required()
+    @task_ns.marshal_with(task_transition_response_model)
+    def post(self):
+        """Reabrir muchas tareas con una sola sentencia UPDATE"""
+        return transition_tasks(False)
@@ -1,6 +1,7 @@
 from flask import request, jsonify
 from flask_restx import Namespace, Resource, fields
 from app.services.user_service import UserService
+from app.utils.pagination import get_page_args, page_headers
 
 # Crear un espacio de nombres (namespace) para los usuarios
 user_ns = Namespace('users', description='Operaciones relacionadas con los usuarios')
@@ -44,18 +45,29 @@ class UserResource(Resource):
             print(str(e))  # Imprime el error en la consola
             return jsonify({'message': str(e)}), 500  # Asegúrate de que esto retorne un diccionario
 
-    @user_ns.doc('get_users')
+    @user_ns.doc('get_users', params={'after': 'Cursor opaco devuelto en la cabecera X-Next-Cursor', 'limit': 'Tamaño de página'})
     def get(self):
         """
-        Obtener todos los usuarios
+        Obtener una página de usuarios
         ---
-        Este método permite obtener una lista de todos los usuarios registrados en la base de datos.
+        Este método permite obtener una página de los usuarios registrados en la base de datos.
+
+        Query Parameters:
+        - after: Cursor opaco devuelto en la cabecera X-Next-Cursor de la página anterior.
+        - limit: Tamaño de página (acotado por el máximo del servidor).
 
         Responses:
         - 200: Retorna una lista de nombres de usuarios.
+        - 400: Si el cursor o el límite no son válidos.
         """
-        users = UserService.get_all_users()  # Llama al servicio para obtener todos los usuarios
-        return jsonify({'users': [user.username for user in users]}), 200  # Retorna solo los nombres de usuario
+        try:
+            after_id, limit = get_page_args()  # Lee el cursor y el tamaño de página de la URL
+        except ValueError as e:
+            return {'message': str(e)}, 400
+        page = UserService.get_all_users(after_id, limit)  # Llama al servicio para obtener la página de usuarios
+        response = jsonify({'users': [user.username for user in page.items]})  # Retorna solo los nombres de usuario
+        response.headers.extend(page_headers(page))  # Cursor de la siguiente página en las cabeceras
+        return response
 
 
 @user_ns.route('/<username>')
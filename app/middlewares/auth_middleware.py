@@ -1,12 +1,15 @@
-from flask_jwt_extended import get_jwt_identity
+from flask_jwt_extended import get_jwt
 from functools import wraps
 from flask import jsonify
-from app.services.user_service import UserService
 
 def priority_required(required_priority):
     """
     Middleware personalizado para verificar si el usuario autenticado tiene una prioridad específica.
     
+    La prioridad se lee del claim `priority` del token JWT ya verificado, por lo que la
+    autorización no realiza ninguna consulta a la base de datos. Debe usarse junto con
+    `jwt_required`.
+    
     Args:
         required_priority (str): La prioridad requerida que se debe cumplir para acceder al recurso.
     
@@ -17,16 +20,9 @@ def priority_required(required_priority):
     def decorator(func):
         @wraps(func)  # Mantiene el nombre y la docstring original de la función decorada
         def wrapper(*args, **kwargs):
-            # Obtener el nombre de usuario (identity) del token JWT actual
-            username = get_jwt_identity()
-            
-            # Buscar el usuario en la base de datos por su nombre de usuario
-            user = UserService.get_user_by_username(username)
-            
-            # Verificar si la prioridad del usuario coincide con la prioridad requerida
-            # En este caso, deberías tener una forma de obtener la prioridad del usuario
-            # Esto podría ser una propiedad en el modelo de usuario o a través de un servicio
-            user_priority = user.priority.name if user.priority else None
+            # Obtener la prioridad del usuario desde los claims del token JWT actual
+            # (los tokens emitidos antes de incluir el claim no tienen prioridad y se rechazan)
+            user_priority = get_jwt().get('priority')
             
             if user_priority != required_priority:
                 # Si la prioridad no coincide, retornar un mensaje de error y un código de estado 403
@@ -0,0 +1,40 @@
+from app import db
+
+class TableVersion(db.Model):
+    """
+    Modelo que guarda un contador de versión por tabla.
+
+    Los servicios incrementan la versión de una tabla en la misma transacción en la que la
+    modifican, de modo que los endpoints de lectura pueden generar un ETag barato sin
+    consultar ni serializar los datos.
+
+    Atributos:
+        name (str): Nombre lógico de la tabla (clave primaria), por ejemplo 'tasks'.
+        version (int): Contador que se incrementa con cada escritura.
+    """
+
+    __tablename__ = 'table_versions'  # Nombre de la tabla en la base de datos
+
+    # Definición de columnas de la tabla
+    name = db.Column(db.String(50), primary_key=True)  # Nombre de la tabla versionada
+    version = db.Column(db.Integer, nullable=False, default=0)  # Versión actual de la tabla
+
+    def __init__(self, name, version=0):
+        """
+        Constructor de la clase TableVersion.
+
+        Args:
+            name (str): Nombre de la tabla versionada.
+            version (int, opcional): Versión inicial, por defecto 0.
+        """
+        self.name = name
+        self.version = version
+
+    def __repr__(self):
+        """
+        Representación en cadena del objeto TableVersion.
+
+        Returns:
+            str: Nombre de la tabla y su versión.
+        """
+        return f'<TableVersion {self.name} v{self.version}>'
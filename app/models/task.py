@@ -1,9 +1,12 @@
 from app import db
+from app.utils.lookup_cache import priority_cache
 
 # Tabla intermedia para la relación de muchos a muchos entre Tareas y Categorías
 task_category = db.Table('task_category',
     db.Column('task_id', db.Integer, db.ForeignKey('tasks.id'), primary_key=True),  # Referencia a la tabla 'tasks'
-    db.Column('category_id', db.Integer, db.ForeignKey('categories.id'), primary_key=True)  # Referencia a la tabla 'categories'
+    db.Column('category_id', db.Integer, db.ForeignKey('categories.id'), primary_key=True),  # Referencia a la tabla 'categories'
+    # Índice para la dirección inversa (tareas de una categoría); la clave primaria solo cubre task_id -> category_id
+    db.Index('ix_task_category_category_id_task_id', 'category_id', 'task_id')
 )
 
 class Task(db.Model):
@@ -22,6 +25,12 @@ class Task(db.Model):
     """
     
     __tablename__ = 'tasks'  # Nombre de la tabla en la base de datos
+    __table_args__ = (
+        # Índice para filtrar por estado y prioridad; incluye implícitamente el ID para paginar por cursor
+        db.Index('ix_tasks_completed_priority_id', 'completed', 'priority_id'),
+        # Índice FULLTEXT para la búsqueda de texto (solo MySQL; en SQLite se usa FTS5)
+        db.Index('ix_tasks_title_description_fulltext', 'title', 'description', mysql_prefix='FULLTEXT').ddl_if(dialect='mysql'),
+    )
 
     # Definición de columnas de la tabla
     id = db.Column(db.Integer, primary_key=True)  # Clave primaria de la tabla
@@ -33,6 +42,7 @@ class Task(db.Model):
     # Relación muchos a muchos con categorías usando la tabla intermedia 'task_category'
     categories = db.relationship('Category', 
                                  secondary=task_category,  # Tabla intermedia que define la relación
+                                 order_by='Category.id',  # Orden estable, igual al de la serialización rápida
                                  backref=db.backref('tasks', lazy=True))  # Permite acceso inverso desde categorías a tareas
 
     # Relación con el modelo Priority
@@ -69,11 +79,13 @@ class Task(db.Model):
         Returns:
             dict: Representación del objeto en forma de diccionario, incluyendo prioridades y categorías.
         """
+        # El nombre de la prioridad se obtiene de la caché en memoria, sin cargar la relación
+        priority = priority_cache.get(self.priority_id)
         return {
             'id': self.id,
             'title': self.title,
             'description': self.description,
             'completed': self.completed,
-            'priority': self.priority.name if self.priority else None,  # Incluye la prioridad si existe
+            'priority': priority.name if priority else None,  # Incluye la prioridad si existe
             'categories': [category.to_dict() for category in self.categories]  # Serializa las categorías
         }
\ No newline at end of file
@@ -0,0 +1,49 @@
+from app import db
+
+class TaskCounter(db.Model):
+    """
+    Modelo que guarda los contadores agregados de tareas.
+
+    Hay una fila para el total general (`scope='all'`, `ref_id=0`), una por prioridad
+    (`scope='priority'`) y una por categoría (`scope='category'`). `TaskService` las
+    actualiza en la misma transacción que cada escritura sobre las tareas, de modo que las
+    estadísticas se leen sin recorrer la tabla de tareas.
+
+    Atributos:
+        scope (str): Tipo de agregado: 'all', 'priority' o 'category'.
+        ref_id (int): ID de la prioridad o categoría; 0 para el total general.
+        total (int): Número de tareas del agregado.
+        completed (int): Número de tareas completadas del agregado.
+    """
+
+    __tablename__ = 'task_counters'  # Nombre de la tabla en la base de datos
+
+    # Definición de columnas de la tabla
+    scope = db.Column(db.String(20), primary_key=True)  # Tipo de agregado
+    ref_id = db.Column(db.Integer, primary_key=True, autoincrement=False)  # ID de la prioridad o categoría
+    total = db.Column(db.Integer, nullable=False, default=0)  # Número de tareas
+    completed = db.Column(db.Integer, nullable=False, default=0)  # Número de tareas completadas
+
+    def __init__(self, scope, ref_id, total=0, completed=0):
+        """
+        Constructor de la clase TaskCounter.
+
+        Args:
+            scope (str): Tipo de agregado: 'all', 'priority' o 'category'.
+            ref_id (int): ID de la prioridad o categoría; 0 para el total general.
+            total (int, opcional): Número inicial de tareas.
+            completed (int, opcional): Número inicial de tareas completadas.
+        """
+        self.scope = scope
+        self.ref_id = ref_id
+        self.total = total
+        self.completed = completed
+
+    def __repr__(self):
+        """
+        Representación en cadena del objeto TaskCounter.
+
+        Returns:
+            str: Agregado y sus contadores.
+        """
+        return f'<TaskCounter {self.scope}:{self.ref_id} {self.completed}/{self.total}>'
@@ -0,0 +1,113 @@
+import os
+
+from gunicorn.app.base import BaseApplication
+
+from app import create_app, db
+from app.config import ProductionConfig
+
+
+class ServerConfig(ProductionConfig):
+    """Configuración del servidor de producción: el modo debug no puede activarse."""
+
+    DEBUG = False
+
+
+class ProductionServer(BaseApplication):
+    """Servidor de producción multiproceso (gunicorn) para la aplicación Flask.
+
+    La aplicación se crea una sola vez en el proceso maestro (`preload_app`) antes de
+    crear los workers, de modo que los módulos, los modelos y las cachés precargadas se
+    comparten entre procesos mediante copy-on-write. El maestro cierra las conexiones
+    abiertas durante la carga antes de crear los workers; cada worker abre las suyas y se
+    recicla tras `SERVER_MAX_REQUESTS` solicitudes.
+
+    Por la precarga, `SIGHUP` reemplaza los workers pero no carga código nuevo: un
+    despliegue requiere reiniciar el maestro o arrancar uno nuevo con `SIGUSR2`.
+
+    El modo debug está siempre desactivado: se fuerza en la aplicación y no hay opción
+    para activarlo.
+
+    Atributos:
+        application (Flask): Aplicación creada con `create_app`.
+        options (dict): Configuración de gunicorn.
+    """
+
+    def __init__(self, application, options=None):
+        self.application = application
+        self.options = options or {}
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            if key in self.cfg.settings and value is not None:
+                self.cfg.set(key.lower(), value)
+        # Opciones de desarrollo que nunca deben usarse en este punto de entrada
+        self.cfg.set('reload', False)
+        self.cfg.set('preload_app', True)
+        self.cfg.set('when_ready', when_ready)
+        self.cfg.set('post_fork', post_fork)
+
+    def load(self):
+        return self.application
+
+
+def when_ready(server):
+    """Cerrar en el proceso maestro las conexiones abiertas al crear la aplicación.
+
+    El maestro no atiende solicitudes: sin esto mantendría abiertas durante toda su vida
+    las conexiones usadas al precargar (por ejemplo, las de las cachés de consulta).
+    """
+    application = server.app.application
+    with application.app_context():
+        for engine in db.engines.values():
+            engine.dispose()
+
+
+def post_fork(server, worker):
+    """Descartar en el worker las conexiones del pool heredadas del proceso maestro.
+
+    Normalmente no queda ninguna, porque `when_ready` las cierra antes de crear los
+    workers, pero así el worker nunca comparte un socket con el maestro. Con
+    `close=False` no se cierran los sockets, que siguen perteneciendo al maestro; el
+    worker simplemente abrirá conexiones nuevas la primera vez que las necesite.
+    """
+    application = server.app.application
+    with application.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+
+
+def build_options(config):
+    """Construir la configuración de gunicorn a partir de la configuración de la aplicación.
+
+    Args:
+        config (Config): Configuración de la aplicación.
+
+    Returns:
+        dict: Opciones de gunicorn.
+    """
+    return {
+        'bind': config['SERVER_BIND'],
+        'workers': config['SERVER_WORKERS'],
+        'threads': config['SERVER_THREADS'],
+        # Con varios hilos por worker se usa el worker de hilos de gunicorn
+        'worker_class': 'gthread' if config['SERVER_THREADS'] > 1 else 'sync',
+        'max_requests': config['SERVER_MAX_REQUESTS'],
+        'max_requests_jitter': config['SERVER_MAX_REQUESTS_JITTER'],
+        'timeout': config['SERVER_TIMEOUT'],
+        'graceful_timeout': config['SERVER_GRACEFUL_TIMEOUT'],
+        'keepalive': config['SERVER_KEEPALIVE'],
+        'accesslog': '-',
+        'errorlog': '-'
+    }
+
+
+def main():
+    """Crear la aplicación con el modo debug desactivado y servirla con gunicorn."""
+    # Ni FLASK_DEBUG ni la configuración pueden activar el depurador en producción
+    os.environ.pop('FLASK_DEBUG', None)
+    application = create_app(ServerConfig)
+    application.config['DEBUG'] = False
+    application.debug = False
+
+    ProductionServer(application, build_options(application.config)).run()
@@ -0,0 +1,127 @@
+from sqlalchemy.exc import IntegrityError
+
+from app import db
+from app.models.task import Task
+from app.services.category_service import CategoryService
+from app.services.errors import NotFoundError
+from app.services.priority_service import PriorityService
+from app.services.task_service import TaskService
+from app.utils import transaction
+from app.utils.lookup_cache import category_cache, priority_cache
+
+# Recursos y acciones que admite un lote
+BATCH_RESOURCES = ('tasks', 'categories', 'priorities')
+BATCH_ACTIONS = ('create', 'update', 'delete')
+
+# Estado del resultado de cada acción
+BATCH_STATUSES = {'create': 'created', 'update': 'updated', 'delete': 'deleted'}
+
+
+class BatchError(ValueError):
+    """Error de una operación de un lote; el lote completo se deshace.
+
+    Atributos:
+        index (int): Posición de la operación que falló.
+    """
+
+    def __init__(self, index, message):
+        super().__init__(message)
+        self.index = index
+
+
+class BatchNotFound(BatchError):
+    """El elemento sobre el que opera una operación no existe."""
+
+
+class BatchConflict(BatchError):
+    """La base de datos rechazó las escrituras de una operación (por ejemplo, un nombre duplicado)."""
+
+
+class BatchService:
+    """Servicio que ejecuta varias operaciones de tareas, categorías y prioridades en una transacción."""
+
+    @staticmethod
+    def _create_task(data):
+        return TaskService.create_task(
+            data['title'], data.get('description'), data.get('category_ids') or [], data.get('priority_id')
+        )
+
+    @staticmethod
+    def _update_task(task_id, data):
+        TaskService.patch_task(task_id, **data)
+        # `patch_task` escribe sin pasar por el ORM: si la tarea ya estaba en el mapa de
+        # identidad (por ejemplo, creada en el mismo lote) se recargan sus atributos
+        return db.session.get(Task, task_id, populate_existing=True)
+
+    @staticmethod
+    def _run_operation(operation):
+        resource, action = operation['resource'], operation['action']
+        entry_id, data = operation.get('id'), operation.get('data') or {}
+        if resource == 'tasks':
+            if action == 'create':
+                return BatchService._create_task(data)
+            if action == 'update':
+                return BatchService._update_task(entry_id, data)
+            return TaskService.delete_task(entry_id)
+        if resource == 'categories':
+            if action == 'create':
+                return CategoryService.create_category(data['name'])
+            if action == 'update':
+                return CategoryService.update_category(entry_id, data['name'])
+            return CategoryService.delete_category(entry_id)
+        if action == 'create':
+            return PriorityService.create_priority(data['name'])
+        if action == 'update':
+            return PriorityService.update_priority(entry_id, data['name'])
+        return PriorityService.delete_priority(entry_id)
+
+    @staticmethod
+    def run(operations, serializers):
+        """Ejecutar las operaciones en orden dentro de una sola transacción.
+
+        Cada operación llama al mismo método de servicio que su endpoint, pero las
+        escrituras solo se envían con `flush`; al final se hace un único commit. Si una
+        operación falla se deshacen todas las anteriores.
+
+        Args:
+            operations (List[dict]): Operaciones ya validadas, con `resource` (tasks,
+                categories o priorities), `action` (create, update o delete), `id` (en
+                update y delete) y `data` (en create y update).
+            serializers (dict): Función que convierte el resultado de cada recurso en un
+                diccionario; se aplica antes del commit, que expira las instancias.
+
+        Returns:
+            List[dict]: Un resultado por operación, en el mismo orden, con `index`,
+            `status` ('created', 'updated' o 'deleted'), `id` y `data` (salvo en delete).
+
+        Raises:
+            BatchError: Si alguna operación falla; indica su posición y el motivo.
+            BatchNotFound: Si el elemento de alguna operación no existe.
+            BatchConflict: Si la base de datos rechaza las escrituras de una operación.
+            IntegrityError: Si la base de datos rechaza las escrituras al confirmar el lote.
+        """
+        results = []
+        try:
+            with transaction.batch():
+                for index, operation in enumerate(operations):
+                    try:
+                        entry = BatchService._run_operation(operation)
+                    except NotFoundError as e:
+                        raise BatchNotFound(index, str(e)) from e
+                    except ValueError as e:
+                        raise BatchError(index, str(e)) from e
+                    except IntegrityError as e:
+                        # Cada operación envía sus escrituras con `flush`: el error es de esta operación
+                        raise BatchConflict(index, 'Conflicts with existing data') from e
+                    result = {'index': index, 'status': BATCH_STATUSES[operation['action']]}
+                    if entry is None:
+                        result['id'] = operation['id']
+                    else:
+                        result['id'] = entry.id
+                        result['data'] = serializers[operation['resource']](entry)
+                    results.append(result)
+        finally:
+            # Otras solicitudes pudieron recargar las cachés durante el lote, antes del commit
+            category_cache.invalidate()
+            priority_cache.invalidate()
+        return results
@@ -1,5 +1,11 @@
 from app import db
 from app.models.category import Category
+from app.services.table_version_service import TableVersionService
+from app.services.task_counter_service import TaskCounterService
+from app.services.errors import NotFoundError
+from app.utils.lookup_cache import category_cache
+from app.utils import transaction
+from app.utils.pagination import paginate_items
 
 class CategoryService:
     """Servicio que gestiona las operaciones CRUD para las categorías."""
@@ -17,8 +23,8 @@ class CategoryService:
         Raises:
             ValueError: Si la categoría ya existe.
         """
-        # Verificar si la categoría con el mismo nombre ya existe
-        category = Category.query.filter_by(name=name).first()
+        # Verificar si la categoría con el mismo nombre ya existe (consulta servida desde la caché)
+        category = category_cache.get_by_name(name)
         if category:
             # Si ya existe una categoría con el mismo nombre, se lanza una excepción
             raise ValueError("Category already exists")
@@ -28,7 +34,10 @@ class CategoryService:
         
         # Guardar la nueva categoría en la base de datos
         db.session.add(new_category)
-        db.session.commit()
+        # Incrementar la versión de la tabla para invalidar los ETags
+        TableVersionService.bump('categories')
+        transaction.commit()
+        category_cache.invalidate()
         
         return new_category
 
@@ -44,19 +53,22 @@ class CategoryService:
             Category: La categoría actualizada.
 
         Raises:
-            ValueError: Si la categoría no se encuentra.
+            NotFoundError: Si la categoría no se encuentra.
         """
         # Buscar la categoría por su ID
         category = Category.query.get(category_id)
         if not category:
             # Si la categoría no se encuentra, lanzar una excepción
-            raise ValueError('Category not found')
+            raise NotFoundError('Category not found')
         
         # Actualizar el nombre de la categoría
         category.name = name
         
+        # Incrementar la versión de la tabla para invalidar los ETags
+        TableVersionService.bump('categories')
         # Guardar los cambios en la base de datos
-        db.session.commit()
+        transaction.commit()
+        category_cache.invalidate()
         
         return category
 
@@ -68,27 +80,49 @@ class CategoryService:
             category_id (int): El ID de la categoría a eliminar.
 
         Raises:
-            ValueError: Si la categoría no se encuentra.
+            NotFoundError: Si la categoría no se encuentra.
         """
         # Buscar la categoría por su ID
         category = Category.query.get(category_id)
         if not category:
             # Si la categoría no se encuentra, lanzar una excepción
-            raise ValueError('Category not found')
+            raise NotFoundError('Category not found')
         
         # Eliminar la categoría de la base de datos
         db.session.delete(category)
-        db.session.commit()
+        # Las tareas dejan de pertenecer a la categoría: sus contadores desaparecen con ella
+        TaskCounterService.discard('category', category_id)
+        # Incrementar la versión de las tablas afectadas (también se eliminan asociaciones de tareas)
+        TableVersionService.bump('categories', 'tasks')
+        transaction.commit()
+        category_cache.invalidate()
 
     @staticmethod
-    def get_all_categories():
-        """Obtener todas las categorías disponibles en la base de datos.
+    def get_category_by_id(category_id):
+        """Obtener una categoría por su ID.
+
+        Args:
+            category_id (int): El ID de la categoría.
+
+        Returns:
+            LookupEntry: La categoría correspondiente al ID, o None si no existe.
+        """
+        # Buscar la categoría por su ID en la caché
+        return category_cache.get(category_id)
+
+    @staticmethod
+    def get_all_categories(after_id=None, limit=None):
+        """Obtener una página de las categorías disponibles en la base de datos.
+
+        Args:
+            after_id (int, opcional): ID de la última categoría de la página anterior.
+            limit (int, opcional): Tamaño de página, acotado por `PAGINATION_MAX_LIMIT`.
 
         Returns:
-            List[Category]: Una lista de todas las categorías.
+            Page: Categorías de la página ordenadas por ID y cursor de la siguiente página.
         """
-        # Devuelve todas las categorías usando una consulta SQLAlchemy
-        return Category.query.all()
+        # Devuelve una página de categorías servida desde la caché en memoria
+        return paginate_items(category_cache.all(), after_id, limit)
 
     @staticmethod
     def serialize_category(category):
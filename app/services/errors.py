@@ -0,0 +1,7 @@
+class NotFoundError(ValueError):
+    """El elemento sobre el que opera un servicio no existe.
+
+    Hereda de `ValueError`, de modo que los llamadores que ya capturan los errores de
+    validación de los servicios la siguen capturando; los que necesitan distinguirla
+    (por ejemplo, para responder 404) capturan esta clase.
+    """
@@ -1,5 +1,11 @@
 from app import db
 from app.models.priority import Priority  # Asegúrate de tener el modelo Priority importado
+from app.services.table_version_service import TableVersionService
+from app.services.task_counter_service import TaskCounterService
+from app.services.errors import NotFoundError
+from app.utils.lookup_cache import priority_cache
+from app.utils import transaction
+from app.utils.pagination import paginate_items
 
 class PriorityService:
     """Servicio para manejar las operaciones CRUD y adicionales para prioridades."""
@@ -17,8 +23,8 @@ class PriorityService:
         Raises:
             ValueError: Si la prioridad ya existe.
         """
-        # Verificar si la prioridad ya existe
-        priority = Priority.query.filter_by(name=name).first()
+        # Verificar si la prioridad ya existe (consulta servida desde la caché)
+        priority = priority_cache.get_by_name(name)
         if priority:
             raise ValueError("Priority already exists")
         
@@ -27,19 +33,26 @@ class PriorityService:
         
         # Guardar la prioridad en la base de datos
         db.session.add(new_priority)
-        db.session.commit()
+        # Incrementar la versión de la tabla para invalidar los ETags
+        TableVersionService.bump('priorities')
+        transaction.commit()
+        priority_cache.invalidate()
         
         return new_priority
 
     @staticmethod
-    def get_all_priorities():
-        """Obtener todas las prioridades disponibles.
+    def get_all_priorities(after_id=None, limit=None):
+        """Obtener una página de las prioridades disponibles.
         
+        Args:
+            after_id (int, opcional): ID de la última prioridad de la página anterior.
+            limit (int, opcional): Tamaño de página, acotado por `PAGINATION_MAX_LIMIT`.
+
         Returns:
-            List[Priority]: Lista de todas las prioridades en la base de datos.
+            Page: Prioridades de la página ordenadas por ID y cursor de la siguiente página.
         """
-        # Retorna todas las prioridades
-        return Priority.query.all()
+        # Retorna una página de prioridades servida desde la caché en memoria
+        return paginate_items(priority_cache.all(), after_id, limit)
 
     @staticmethod
     def get_priority_by_id(priority_id):
@@ -49,10 +62,10 @@ class PriorityService:
             priority_id (int): El ID de la prioridad.
 
         Returns:
-            Priority: La prioridad correspondiente al ID, o None si no existe.
+            LookupEntry: La prioridad correspondiente al ID, o None si no existe.
         """
-        # Buscar la prioridad por su ID
-        return Priority.query.get(priority_id)
+        # Buscar la prioridad por su ID en la caché
+        return priority_cache.get(priority_id)
 
     @staticmethod
     def update_priority(priority_id, new_name):
@@ -66,18 +79,21 @@ class PriorityService:
             Priority: La prioridad actualizada.
 
         Raises:
-            ValueError: Si la prioridad no se encuentra.
+            NotFoundError: Si la prioridad no se encuentra.
         """
         # Buscar la prioridad por su ID
         priority = Priority.query.get(priority_id)
         if not priority:
-            raise ValueError("Priority not found")
+            raise NotFoundError("Priority not found")
         
         # Actualizar el nombre de la prioridad
         priority.name = new_name
         
+        # Incrementar la versión de la tabla para invalidar los ETags
+        TableVersionService.bump('priorities')
         # Confirmar los cambios en la base de datos
-        db.session.commit()
+        transaction.commit()
+        priority_cache.invalidate()
         
         return priority
 
@@ -89,13 +105,29 @@ class PriorityService:
             priority_id (int): El ID de la prioridad a eliminar.
 
         Raises:
-            ValueError: Si la prioridad no se encuentra.
+            NotFoundError: Si la prioridad no se encuentra.
         """
         # Buscar la prioridad por su ID
         priority = Priority.query.get(priority_id)
         if not priority:
-            raise ValueError("Priority not found")
+            raise NotFoundError("Priority not found")
         
         # Eliminar la prioridad
         db.session.delete(priority)
-        db.session.commit()
\ No newline at end of file
+        TaskCounterService.discard('priority', priority_id)
+        # Incrementar la versión de la tabla para invalidar los ETags
+        TableVersionService.bump('priorities')
+        transaction.commit()
+        priority_cache.invalidate()
+
+    @staticmethod
+    def serialize_priority(priority):
+        """Convierte una prioridad en un diccionario serializable.
+
+        Args:
+            priority (Priority): La prioridad (o su entrada de la caché) que se desea serializar.
+
+        Returns:
+            dict: Un diccionario con el ID y el nombre de la prioridad.
+        """
+        return {'id': priority.id, 'name': priority.name}
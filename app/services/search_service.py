@@ -0,0 +1,189 @@
+import re
+from abc import ABC, abstractmethod
+
+from flask import current_app
+from sqlalchemy import and_, bindparam, case, or_, select, text
+from sqlalchemy.dialects.mysql import match
+
+from app import db
+from app.models.task import Task
+
+
+class SearchBackend(ABC):
+    """Interfaz de los motores de búsqueda de texto completo sobre las tareas.
+
+    Cada implementación busca en `Task.title` y `Task.description`, devuelve los IDs
+    ordenados por relevancia y mantiene su índice sincronizado con las escrituras.
+    """
+
+    @abstractmethod
+    def search(self, query_text, offset, limit):
+        """Buscar tareas.
+
+        Args:
+            query_text (str): Texto a buscar.
+            offset (int): Número de resultados a saltar.
+            limit (int): Número máximo de resultados.
+
+        Returns:
+            List[int]: IDs de las tareas, de mayor a menor relevancia.
+        """
+
+    def sync_tasks(self, task_ids):
+        """Actualizar el índice con el contenido actual de las tareas (ya escritas en la sesión)."""
+
+    def remove_tasks(self, task_ids):
+        """Eliminar tareas del índice."""
+
+
+class MySQLFullTextBackend(SearchBackend):
+    """Búsqueda con el índice FULLTEXT de MySQL sobre `tasks(title, description)`.
+
+    InnoDB mantiene el índice FULLTEXT en la misma transacción que la tabla, por lo que
+    no hace falta sincronizar nada desde los servicios.
+    """
+
+    def search(self, query_text, offset, limit):
+        relevance = match(Task.title, Task.description, against=bindparam('query_text')).in_natural_language_mode()
+        statement = (
+            select(Task.id)
+            .where(relevance)
+            .order_by(relevance.desc(), Task.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        return list(db.session.scalars(statement, {'query_text': query_text}))
+
+
+class SQLiteFTS5Backend(SearchBackend):
+    """Búsqueda con una tabla virtual FTS5 de SQLite, para desarrollo local y pruebas.
+
+    La tabla `tasks_fts` usa el ID de la tarea como `rowid`. Se crea y se llena con las
+    tareas existentes en su propia transacción la primera vez que se busca; mientras no
+    exista, las escrituras no tienen nada que sincronizar porque la creación copiará
+    las tareas ya confirmadas.
+    """
+
+    def __init__(self):
+        self._ready = False
+
+    def _index_exists(self, connection):
+        return connection.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tasks_fts'")
+        ).first() is not None
+
+    def _ensure_index(self):
+        if self._ready:
+            return
+        with db.engine.begin() as connection:
+            if not self._index_exists(connection):
+                connection.execute(text('CREATE VIRTUAL TABLE tasks_fts USING fts5(title, description)'))
+                connection.execute(text(
+                    'INSERT INTO tasks_fts (rowid, title, description) SELECT id, title, description FROM tasks'
+                ))
+        self._ready = True
+
+    def _index_ready(self):
+        # En las escrituras no se crea el índice: solo se sincroniza si ya existe
+        if not self._ready and self._index_exists(db.session):
+            self._ready = True
+        return self._ready
+
+    @staticmethod
+    def _to_fts_query(query_text):
+        # Cada palabra se busca como frase literal para que los operadores de FTS5 no se interpreten
+        terms = re.findall(r'\w+', query_text, flags=re.UNICODE)
+        return ' '.join(f'"{term}"' for term in terms)
+
+    def search(self, query_text, offset, limit):
+        fts_query = self._to_fts_query(query_text)
+        if not fts_query:
+            return []
+        self._ensure_index()
+        rows = db.session.execute(
+            text(
+                'SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH :query '
+                'ORDER BY bm25(tasks_fts), rowid LIMIT :limit OFFSET :offset'
+            ),
+            {'query': fts_query, 'limit': limit, 'offset': offset}
+        )
+        return [row.rowid for row in rows]
+
+    def sync_tasks(self, task_ids):
+        if not task_ids or not self._index_ready():
+            return
+        # Copiar el contenido desde la propia tabla de tareas, sin pasar los datos por Python
+        db.session.execute(
+            text(
+                'INSERT OR REPLACE INTO tasks_fts (rowid, title, description) '
+                'SELECT id, title, description FROM tasks WHERE id IN :ids'
+            ).bindparams(bindparam('ids', expanding=True)),
+            {'ids': list(task_ids)}
+        )
+
+    def remove_tasks(self, task_ids):
+        if not task_ids or not self._index_ready():
+            return
+        db.session.execute(
+            text('DELETE FROM tasks_fts WHERE rowid IN :ids').bindparams(bindparam('ids', expanding=True)),
+            {'ids': list(task_ids)}
+        )
+
+
+class LikeSearchBackend(SearchBackend):
+    """Búsqueda sin índice con `LIKE` (sin distinguir mayúsculas), para cualquier dialecto.
+
+    Cada palabra del texto debe aparecer en el título o en la descripción; primero se
+    devuelven las tareas cuyo título contiene todas las palabras. Recorre la tabla
+    completa, así que solo se usa con los dialectos que no tienen un motor propio.
+    """
+
+    def search(self, query_text, offset, limit):
+        terms = re.findall(r'\w+', query_text, flags=re.UNICODE)
+        if not terms:
+            return []
+        in_title = [Task.title.icontains(term, autoescape=True) for term in terms]
+        statement = (
+            select(Task.id)
+            .where(*(or_(title, Task.description.icontains(term, autoescape=True))
+                     for title, term in zip(in_title, terms)))
+            .order_by(case((and_(*in_title), 0), else_=1), Task.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        return list(db.session.scalars(statement))
+
+
+# Motor de búsqueda según el dialecto de la base de datos
+SEARCH_BACKENDS = {
+    'mysql': MySQLFullTextBackend,
+    'sqlite': SQLiteFTS5Backend
+}
+
+
+class SearchService:
+    """Servicio de búsqueda de texto completo sobre las tareas."""
+
+    @staticmethod
+    def get_backend():
+        """Obtener el motor de búsqueda de la aplicación actual.
+
+        Returns:
+            SearchBackend: Motor correspondiente al dialecto del engine, o la búsqueda con
+            `LIKE` (sin índice que sincronizar) si el dialecto no tiene uno.
+        """
+        backend = current_app.extensions.get('task_search')
+        if backend is None:
+            backend_class = SEARCH_BACKENDS.get(db.engine.dialect.name, LikeSearchBackend)
+            backend = current_app.extensions['task_search'] = backend_class()
+        return backend
+
+    @staticmethod
+    def sync_tasks(task_ids):
+        """Sincronizar el índice con tareas creadas o modificadas (antes del commit)."""
+        SearchService.get_backend().sync_tasks(task_ids)
+
+    @staticmethod
+    def remove_tasks(task_ids):
+        """Eliminar tareas del índice (antes del commit)."""
+        SearchService.get_backend().remove_tasks(task_ids)
@@ -0,0 +1,116 @@
+from flask import has_request_context, request
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from app import db
+from app.models.table_version import TableVersion
+
+# Clave del entorno WSGI de la solicitud donde se guardan las versiones ya leídas
+REQUEST_VERSIONS_KEY = 'app.table_versions'
+
+class TableVersionService:
+    """Servicio para mantener y consultar los contadores de versión de cada tabla."""
+
+    @staticmethod
+    def bump(*table_names):
+        """Incrementar la versión de una o varias tablas.
+
+        Debe llamarse antes del commit de la escritura, para que la nueva versión se
+        confirme en la misma transacción que los datos.
+
+        Args:
+            *table_names (str): Nombres de las tablas modificadas.
+        """
+        for name in table_names:
+            result = db.session.execute(
+                update(TableVersion)
+                .where(TableVersion.name == name)
+                .values(version=TableVersion.version + 1)
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount:
+                continue
+
+            # Primera escritura sobre la tabla: crear su contador dentro de un savepoint,
+            # por si otra solicitud lo creó al mismo tiempo
+            try:
+                with db.session.begin_nested():
+                    db.session.add(TableVersion(name=name, version=1))
+            except IntegrityError:
+                db.session.execute(
+                    update(TableVersion)
+                    .where(TableVersion.name == name)
+                    .values(version=TableVersion.version + 1)
+                    .execution_options(synchronize_session=False)
+                )
+
+    @staticmethod
+    def get_versions(table_names):
+        """Obtener la versión actual de varias tablas con una sola consulta.
+
+        Args:
+            table_names (Iterable[str]): Nombres de las tablas.
+
+        Returns:
+            dict: Versión de cada tabla; 0 si la tabla nunca se ha modificado.
+        """
+        table_names = list(table_names)
+        return TableVersionService.to_versions(table_names, db.session.execute(TableVersionService.statement(table_names)))
+
+    @staticmethod
+    def get_request_versions(table_names):
+        """Obtener la versión de varias tablas, leyendo cada una como mucho una vez por solicitud.
+
+        Así el ETag de una respuesta y la comprobación de las cachés de consulta usan la
+        misma versión. Fuera de una solicitud equivale a `get_versions`.
+
+        Args:
+            table_names (Iterable[str]): Nombres de las tablas.
+
+        Returns:
+            dict: Versión de cada tabla; 0 si la tabla nunca se ha modificado.
+        """
+        table_names = list(table_names)
+        if not has_request_context():
+            return TableVersionService.get_versions(table_names)
+        versions = request.environ.setdefault(REQUEST_VERSIONS_KEY, {})
+        missing = [name for name in table_names if name not in versions]
+        if missing:
+            versions.update(TableVersionService.get_versions(missing))
+        return {name: versions[name] for name in table_names}
+
+    @staticmethod
+    def remember_versions(versions):
+        """Guardar en la solicitud actual versiones leídas por otra vía (sesión asíncrona o recarga de una caché).
+
+        Args:
+            versions (dict): Versión de cada tabla.
+        """
+        if has_request_context():
+            request.environ.setdefault(REQUEST_VERSIONS_KEY, {}).update(versions)
+
+    @staticmethod
+    def statement(table_names):
+        """Sentencia que lee las versiones de varias tablas; también se ejecuta desde sesiones asíncronas.
+
+        Args:
+            table_names (List[str]): Nombres de las tablas.
+
+        Returns:
+            Select: SELECT de `name` y `version` de esas tablas.
+        """
+        return select(TableVersion.name, TableVersion.version).where(TableVersion.name.in_(table_names))
+
+    @staticmethod
+    def to_versions(table_names, rows):
+        """Convertir las filas leídas con `statement()` en un diccionario de versiones.
+
+        Args:
+            table_names (List[str]): Nombres de las tablas consultadas.
+            rows (Iterable): Filas con `name` y `version`.
+
+        Returns:
+            dict: Versión de cada tabla; 0 si la tabla nunca se ha modificado.
+        """
+        versions = dict.fromkeys(table_names, 0)
+        versions.update({row.name: row.version for row in rows})
+        return versions
@@ -0,0 +1,140 @@
+from collections import defaultdict
+from sqlalchemy import case, delete, func, select, update
+from sqlalchemy.exc import IntegrityError
+from app import db
+from app.models.task import Task, task_category
+from app.models.task_counter import TaskCounter
+from app.utils.lookup_cache import category_cache, priority_cache
+
+class TaskCounterService:
+    """Servicio para mantener y consultar los contadores agregados de tareas."""
+
+    @staticmethod
+    def task_state(task):
+        """Obtener el estado de una tarea que afecta a los contadores.
+
+        Args:
+            task (Task): La tarea (accede a `task.categories`).
+
+        Returns:
+            tuple: (priority_id, IDs de categorías, completed).
+        """
+        return task.priority_id, frozenset(category.id for category in task.categories), task.completed
+
+    @staticmethod
+    def diff(old_state, new_state, deltas=None):
+        """Calcular cómo cambian los contadores al pasar una tarea de un estado a otro.
+
+        Args:
+            old_state (tuple): Estado anterior (ver `task_state`), o None si la tarea se crea.
+            new_state (tuple): Estado nuevo, o None si la tarea se elimina.
+            deltas (dict, opcional): Diferencias acumuladas a las que sumar estas.
+
+        Returns:
+            dict: Diferencias `(scope, ref_id) -> [total, completed]`.
+        """
+        if deltas is None:
+            deltas = defaultdict(lambda: [0, 0])
+        for state, sign in ((old_state, -1), (new_state, 1)):
+            if state is None:
+                continue
+            priority_id, category_ids, completed = state
+            keys = [('all', 0), ('priority', priority_id)] + [('category', category_id) for category_id in category_ids]
+            for key in keys:
+                deltas[key][0] += sign
+                deltas[key][1] += sign if completed else 0
+        return deltas
+
+    @staticmethod
+    def apply(deltas):
+        """Aplicar diferencias a los contadores con un UPDATE por agregado modificado.
+
+        Debe llamarse antes del commit de la escritura, para que los contadores se
+        confirmen en la misma transacción que las tareas.
+
+        Args:
+            deltas (dict): Diferencias devueltas por `diff`.
+        """
+        for (scope, ref_id), (total, completed) in deltas.items():
+            if not total and not completed:
+                continue
+            statement = (
+                update(TaskCounter)
+                .where(TaskCounter.scope == scope, TaskCounter.ref_id == ref_id)
+                .values(total=TaskCounter.total + total, completed=TaskCounter.completed + completed)
+                .execution_options(synchronize_session=False)
+            )
+            if db.session.execute(statement).rowcount:
+                continue
+
+            # Primera tarea del agregado: crear su fila dentro de un savepoint,
+            # por si otra solicitud la creó al mismo tiempo
+            try:
+                with db.session.begin_nested():
+                    db.session.add(TaskCounter(scope, ref_id, total, completed))
+            except IntegrityError:
+                db.session.execute(statement)
+
+    @staticmethod
+    def discard(scope, ref_id):
+        """Eliminar los contadores de una prioridad o categoría que se elimina.
+
+        Args:
+            scope (str): 'priority' o 'category'.
+            ref_id (int): ID de la prioridad o categoría.
+        """
+        db.session.execute(delete(TaskCounter).where(TaskCounter.scope == scope, TaskCounter.ref_id == ref_id))
+
+    @staticmethod
+    def get_stats():
+        """Obtener las estadísticas de tareas leyendo solo la tabla de contadores.
+
+        Returns:
+            dict: Totales generales (`total`, `completed`, `open`) y listas `by_priority`
+            y `by_category` con los mismos campos más `id` y `name`.
+        """
+        counters = {(row.scope, row.ref_id): row for row in db.session.query(TaskCounter)}
+
+        def stats(scope, entry):
+            row = counters.get((scope, entry.id))
+            total, completed = (row.total, row.completed) if row else (0, 0)
+            return {'id': entry.id, 'name': entry.name, 'total': total, 'completed': completed, 'open': total - completed}
+
+        overall = counters.get(('all', 0))
+        total, completed = (overall.total, overall.completed) if overall else (0, 0)
+        return {
+            'total': total,
+            'completed': completed,
+            'open': total - completed,
+            # Los nombres salen de las cachés de consulta; se incluyen también los agregados vacíos
+            'by_priority': [stats('priority', entry) for entry in priority_cache.all()],
+            'by_category': [stats('category', entry) for entry in category_cache.all()]
+        }
+
+    @staticmethod
+    def reconcile():
+        """Recalcular todos los contadores desde cero con GROUP BY sobre las tareas.
+
+        Returns:
+            int: Número de filas de contadores escritas.
+        """
+        completed = func.sum(case((Task.completed.is_(True), 1), else_=0))
+        rows = []
+        total_row = db.session.execute(select(func.count(Task.id), completed)).one()
+        rows.append(TaskCounter('all', 0, total_row[0], total_row[1] or 0))
+        for priority_id, total, done in db.session.execute(
+            select(Task.priority_id, func.count(Task.id), completed).group_by(Task.priority_id)
+        ):
+            rows.append(TaskCounter('priority', priority_id, total, done or 0))
+        for category_id, total, done in db.session.execute(
+            select(task_category.c.category_id, func.count(Task.id), completed)
+            .join(task_category, task_category.c.task_id == Task.id)
+            .group_by(task_category.c.category_id)
+        ):
+            rows.append(TaskCounter('category', category_id, total, done or 0))
+
+        # Reemplazar todos los contadores en una sola transacción
+        db.session.execute(delete(TaskCounter))
+        db.session.add_all(rows)
+        db.session.commit()
+        return len(rows)
@@ -1,34 +1,115 @@
+from collections import Counter
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import load_only, selectinload
 from app import db
-from app.models.task import Task
 from app.models.category import Category
+from app.models.task import Task, task_category
+from app.services.search_service import SearchService
+from app.services.task_counter_service import TaskCounterService
+from app.services.table_version_service import TableVersionService
+from app.services.errors import NotFoundError
+from app.utils.lookup_cache import category_cache, priority_cache
+from app.utils import transaction
+from app.utils.pagination import Page, clamp_limit, encode_cursor, paginate
+
+# Campos de `task_response_model` en su orden y columna de Task de cada campo escalar
+TASK_FIELDS = ('id', 'title', 'description', 'completed', 'categories')
+TASK_FIELD_COLUMNS = {'id': Task.id, 'title': Task.title, 'description': Task.description, 'completed': Task.completed}
 
 class TaskService:
     """Servicio para manejar las operaciones CRUD y lógicas de las tareas."""
 
     @staticmethod
-    def create_task(title, description, category_ids):
+    def _read_options(fields=None):
+        """Opciones de carga para las lecturas de tareas que luego se serializan.
+
+        Carga las categorías con un SELECT ... IN adicional, de modo que serializar N tareas
+        cuesta un número constante de consultas. El nombre de la prioridad se resuelve
+        desde `priority_cache`, por lo que no hace falta cargar esa relación.
+
+        Con `fields` solo se leen las columnas de los campos pedidos (y la clave primaria),
+        y las categorías solo se cargan si se piden.
+
+        Args:
+            fields (tuple, opcional): Campos de `TASK_FIELDS` que se van a serializar.
+
+        Returns:
+            list: Opciones para `Query.options` o `Select.options`.
+        """
+        if fields is None:
+            return [selectinload(Task.categories)]
+        options = [load_only(Task.id, *(TASK_FIELD_COLUMNS[name] for name in fields if name in TASK_FIELD_COLUMNS))]
+        if 'categories' in fields:
+            options.append(selectinload(Task.categories))
+        return options
+
+    @staticmethod
+    def _read_query(fields=None):
+        """Consulta base para las lecturas de tareas que luego se serializan.
+
+        Args:
+            fields (tuple, opcional): Campos que se van a serializar (ver `_read_options`).
+
+        Returns:
+            Query: Consulta de tareas con las relaciones precargadas.
+        """
+        return Task.query.options(*TaskService._read_options(fields))
+
+    @staticmethod
+    def _apply_filters(query, completed=None, priority_id=None, category_id=None):
+        """Aplicar los filtros de tareas en SQL.
+
+        Args:
+            query (Query): Consulta de tareas.
+            completed (bool, opcional): Filtrar por estado de la tarea.
+            priority_id (int, opcional): Filtrar por prioridad.
+            category_id (int, opcional): Filtrar por categoría asociada.
+
+        Returns:
+            Query: Consulta filtrada.
+        """
+        # Los filtros de estado y prioridad usan el índice (completed, priority_id)
+        if completed is not None:
+            query = query.filter(Task.completed == completed)
+        if priority_id is not None:
+            query = query.filter(Task.priority_id == priority_id)
+        # El filtro por categoría usa el índice (category_id, task_id) de la tabla intermedia
+        if category_id is not None:
+            query = query.filter(Task.id.in_(
+                select(task_category.c.task_id).where(task_category.c.category_id == category_id)
+            ))
+        return query
+
+    @staticmethod
+    def create_task(title, description, category_ids, priority_id=None):
         """Crear una nueva tarea con categorías asociadas.
         
         Args:
             title (str): El título de la tarea.
             description (str): La descripción de la tarea.
             category_ids (List[int]): Lista de IDs de categorías a asociar.
+            priority_id (int): El ID de la prioridad de la tarea (obligatorio).
 
         Returns:
             Task: La nueva tarea creada.
 
         Raises:
-            ValueError: Si las categorías especificadas no existen.
+            ValueError: Si falta la prioridad o la prioridad o las categorías no existen.
         """
-        # Obtener las categorías asociadas filtrando por los IDs proporcionados
-        categories = Category.query.filter(Category.id.in_(category_ids)).all()
-        
-        # Verificar si se encontraron categorías
-        if len(categories) != len(category_ids):
+        # `tasks.priority_id` no admite nulos: se valida igual que en `create_tasks_bulk`
+        if priority_id is None:
+            raise ValueError('Priority is required')
+        if priority_cache.get(priority_id) is None:
+            raise ValueError('Priority not found')
+
+        # Obtener las categorías asociadas desde la caché, sin consultar la tabla
+        if category_cache.missing(category_ids):
             raise ValueError("Some categories do not exist")
+        categories = category_cache.attach(category_ids)
         
         # Crear una nueva instancia de Task con el título, descripción y el estado 'no completada'
-        new_task = Task(title=title, description=description, completed=False)
+        new_task = Task(title=title, description=description, completed=False, priority_id=priority_id)
         
         # Asociar las categorías a la tarea
         new_task.categories = categories
@@ -36,11 +117,94 @@ class TaskService:
         # Agregar la nueva tarea a la sesión de base de datos
         db.session.add(new_task)
         
+        # Obtener el ID de la tarea y sincronizar el índice de búsqueda en la misma transacción
+        db.session.flush()
+        SearchService.sync_tasks([new_task.id])
+
+        # Sumar la nueva tarea a los contadores de estadísticas
+        TaskCounterService.apply(TaskCounterService.diff(None, (priority_id, frozenset(category_ids), False)))
+
+        # Incrementar la versión de la tabla para invalidar los ETags
+        TableVersionService.bump('tasks')
         # Confirmar los cambios y guardar la nueva tarea en la base de datos
-        db.session.commit()
+        transaction.commit()
         
         return new_task
 
+    @staticmethod
+    def create_tasks_bulk(items):
+        """Crear muchas tareas en una sola transacción.
+
+        Valida todas las categorías y prioridades referenciadas contra las cachés de consulta,
+        inserta las tareas válidas en un único flush (el ORM agrupa los INSERT cuando el
+        dialecto lo permite) y las filas de `task_category` con un único executemany.
+        Las tareas con referencias inexistentes se reportan y no se insertan.
+
+        Args:
+            items (List[dict]): Tareas a crear, con `title`, `description`, `category_ids` y `priority_id`.
+
+        Returns:
+            List[dict]: Un resultado por elemento, en el mismo orden que `items`, con
+            `index`, `status` ('created' o 'error') y el `id` creado o el `message` del error.
+        """
+        # Reunir todas las referencias para validarlas de una vez contra las cachés
+        category_ids = {category_id for item in items for category_id in item.get('category_ids') or []}
+        priority_ids = {item['priority_id'] for item in items if item.get('priority_id') is not None}
+        existing_categories = category_ids - category_cache.missing(category_ids)
+        existing_priorities = priority_ids - priority_cache.missing(priority_ids)
+
+        results = []
+        pending = []  # Pares (resultado, tarea, categorías) de los elementos válidos
+        for index, item in enumerate(items):
+            item_categories = set(item.get('category_ids') or [])
+            priority_id = item.get('priority_id')
+            if not item_categories <= existing_categories:
+                results.append({'index': index, 'status': 'error', 'message': 'Some categories do not exist'})
+                continue
+            if priority_id is None:
+                # `tasks.priority_id` no admite nulos, se rechaza antes de llegar al INSERT
+                results.append({'index': index, 'status': 'error', 'message': 'Priority is required'})
+                continue
+            if priority_id not in existing_priorities:
+                results.append({'index': index, 'status': 'error', 'message': 'Priority not found'})
+                continue
+
+            result = {'index': index, 'status': 'created'}
+            task = Task(title=item['title'], description=item.get('description'), completed=False, priority_id=priority_id)
+            results.append(result)
+            pending.append((result, task, item_categories))
+
+        if not pending:
+            return results
+
+        # Insertar todas las tareas en un único flush para obtener sus IDs
+        db.session.add_all([task for _, task, _ in pending])
+        db.session.flush()
+
+        # Insertar las asociaciones con un único executemany en lugar de una fila por vez
+        associations = []
+        for result, task, item_categories in pending:
+            # Leer el ID antes del commit, que expira los atributos de las instancias
+            result['id'] = task.id
+            associations.extend({'task_id': task.id, 'category_id': category_id} for category_id in item_categories)
+        if associations:
+            db.session.execute(task_category.insert(), associations)
+
+        # Sincronizar el índice de búsqueda con las tareas nuevas
+        SearchService.sync_tasks([result['id'] for result, _, _ in pending])
+
+        # Acumular los contadores de todas las tareas y aplicarlos con un UPDATE por agregado
+        deltas = None
+        for _, task, item_categories in pending:
+            deltas = TaskCounterService.diff(None, (task.priority_id, frozenset(item_categories), False), deltas)
+        TaskCounterService.apply(deltas)
+
+        # Incrementar la versión de la tabla para invalidar los ETags
+        TableVersionService.bump('tasks')
+        # Confirmar todo en una sola transacción
+        transaction.commit()
+        return results
+
     @staticmethod
     def update_task(task_id, title=None, description=None, completed=None, category_ids=None):
         """Actualizar los detalles de una tarea existente.
@@ -56,14 +220,23 @@ class TaskService:
             Task: La tarea actualizada.
 
         Raises:
-            ValueError: Si la tarea no se encuentra.
+            NotFoundError: Si la tarea no se encuentra.
+            ValueError: Si alguna categoría no existe.
         """
-        # Buscar la tarea por su ID
-        task = Task.query.get(task_id)
+        # Buscar la tarea por su ID bloqueando su fila: el estado previo que se lee para los
+        # contadores no puede cambiar hasta el commit (populate_existing descarta una copia
+        # anterior que ya estuviera en la sesión)
+        task = db.session.scalars(
+            select(Task).where(Task.id == task_id).with_for_update().execution_options(populate_existing=True)
+        ).first()
         
         # Si la tarea no existe, lanzar un error
         if not task:
-            raise ValueError('Task not found')
+            raise NotFoundError('Task not found')
+
+        # Estado previo para los contadores; las categorías solo se cargan si van a cambiar
+        old_categories = frozenset(category.id for category in task.categories) if category_ids is not None else None
+        old_completed = task.completed
         
         # Actualizar los campos proporcionados si se han pasado
         if title is not None:
@@ -77,17 +250,134 @@ class TaskService:
         
         # Si se proporcionaron nuevas categorías, actualizarlas
         if category_ids is not None:
-            categories = Category.query.filter(Category.id.in_(category_ids)).all()
-            # Verificar si se encontraron categorías
-            if len(categories) != len(category_ids):
+            # Verificar las categorías contra la caché en lugar de consultar la tabla
+            if category_cache.missing(category_ids):
                 raise ValueError("Some categories do not exist")
-            task.categories = categories
+            task.categories = category_cache.attach(category_ids)
         
+        # Sincronizar el índice de búsqueda si cambió el texto de la tarea
+        if title is not None or description is not None:
+            db.session.flush()
+            SearchService.sync_tasks([task.id])
+
+        # Actualizar los contadores solo si cambió el estado o las categorías
+        new_categories = frozenset(category_ids) if category_ids is not None else None
+        if task.completed != old_completed or new_categories != old_categories:
+            if old_categories is None:
+                old_categories = new_categories = frozenset(category.id for category in task.categories)
+            TaskCounterService.apply(TaskCounterService.diff(
+                (task.priority_id, old_categories, old_completed),
+                (task.priority_id, new_categories, task.completed)
+            ))
+
+        # Incrementar la versión de la tabla para invalidar los ETags
+        TableVersionService.bump('tasks')
         # Confirmar los cambios y actualizar la tarea en la base de datos
-        db.session.commit()
+        transaction.commit()
         
         return task
 
+    @staticmethod
+    def patch_task(task_id, title=None, description=None, completed=None, priority_id=None, category_ids=None):
+        """Actualizar parcialmente una tarea sin cargarla en el ORM.
+
+        Los campos escalares se modifican con un único UPDATE; si no coincide ninguna fila
+        la tarea no existe. Las categorías se actualizan como diferencia sobre
+        `task_category` (solo se borran y se insertan las asociaciones que cambian).
+        Solo se leen las columnas `priority_id` y `completed` cuando el cambio afecta a los
+        contadores de estadísticas.
+
+        Args:
+            task_id (int): El ID de la tarea a actualizar.
+            title (str, opcional): Nuevo título de la tarea.
+            description (str, opcional): Nueva descripción de la tarea.
+            completed (bool, opcional): Nuevo estado de la tarea.
+            priority_id (int, opcional): Nueva prioridad de la tarea.
+            category_ids (List[int], opcional): Nuevas categorías asociadas.
+
+        Raises:
+            NotFoundError: Si la tarea no existe.
+            ValueError: Si la prioridad o alguna categoría no existen.
+        """
+        # Validar las referencias contra las cachés, sin consultar las tablas
+        if priority_id is not None and priority_cache.get(priority_id) is None:
+            raise ValueError('Priority not found')
+        if category_ids is not None and category_cache.missing(category_ids):
+            raise ValueError('Some categories do not exist')
+
+        values = {name: value for name, value in (
+            ('title', title), ('description', description), ('completed', completed), ('priority_id', priority_id)
+        ) if value is not None}
+
+        # Estado previo para los contadores: una lectura de dos columnas bloqueando la fila
+        old_state = None
+        if completed is not None or priority_id is not None or category_ids is not None:
+            row = db.session.execute(
+                select(Task.priority_id, Task.completed).where(Task.id == task_id).with_for_update()
+            ).first()
+            if row is None:
+                raise NotFoundError('Task not found')
+            current_categories = frozenset(db.session.scalars(
+                select(task_category.c.category_id).where(task_category.c.task_id == task_id)
+            ))
+            old_state = (row.priority_id, current_categories, row.completed)
+
+        if values:
+            result = db.session.execute(
+                update(Task).where(Task.id == task_id).values(**values).execution_options(synchronize_session=False)
+            )
+            if not result.rowcount:
+                transaction.rollback()
+                raise NotFoundError('Task not found')
+        elif old_state is None:
+            # Sin cambios que aplicar: solo se comprueba que la tarea exista
+            if db.session.get(Task, task_id) is None:
+                raise NotFoundError('Task not found')
+            return
+
+        if category_ids is not None:
+            new_categories = frozenset(category_ids)
+            removed = old_state[1] - new_categories
+            added = new_categories - old_state[1]
+            if removed:
+                db.session.execute(delete(task_category).where(
+                    task_category.c.task_id == task_id, task_category.c.category_id.in_(removed)
+                ))
+            if added:
+                db.session.execute(task_category.insert(), [
+                    {'task_id': task_id, 'category_id': category_id} for category_id in added
+                ])
+
+        if old_state is not None:
+            new_state = (
+                priority_id if priority_id is not None else old_state[0],
+                frozenset(category_ids) if category_ids is not None else old_state[1],
+                completed if completed is not None else old_state[2]
+            )
+            if new_state != old_state:
+                TaskCounterService.apply(TaskCounterService.diff(old_state, new_state))
+
+        # Sincronizar el índice de búsqueda si cambió el texto de la tarea
+        if title is not None or description is not None:
+            SearchService.sync_tasks([task_id])
+
+        # Incrementar la versión de la tabla para invalidar los ETags
+        TableVersionService.bump('tasks')
+        transaction.commit()
+
+    @staticmethod
+    def get_task_by_id(task_id, fields=None):
+        """Obtener una tarea por su ID con sus categorías cargadas.
+
+        Args:
+            task_id (int): El ID de la tarea.
+            fields (tuple, opcional): Campos que se van a serializar; por defecto todos.
+
+        Returns:
+            Task: La tarea, o None si no existe.
+        """
+        return TaskService._read_query(fields).filter(Task.id == task_id).first()
+
     @staticmethod
     def delete_task(task_id):
         """Eliminar una tarea existente.
@@ -96,34 +386,185 @@ class TaskService:
             task_id (int): El ID de la tarea a eliminar.
 
         Raises:
-            ValueError: Si la tarea no se encuentra.
+            NotFoundError: Si la tarea no se encuentra.
         """
         # Buscar la tarea por su ID
         task = Task.query.get(task_id)
         
         # Si la tarea no existe, lanzar un error
         if not task:
-            raise ValueError('Task not found')
+            raise NotFoundError('Task not found')
         
-        # Eliminar la tarea de la base de datos
+        # Restar la tarea de los contadores de estadísticas
+        TaskCounterService.apply(TaskCounterService.diff(TaskCounterService.task_state(task), None))
+
+        # Eliminar la tarea de la base de datos y del índice de búsqueda
         db.session.delete(task)
+        SearchService.remove_tasks([task_id])
         
+        # Incrementar la versión de la tabla para invalidar los ETags
+        TableVersionService.bump('tasks')
         # Confirmar los cambios
-        db.session.commit()
+        transaction.commit()
 
     @staticmethod
-    def get_all_tasks():
-        """Obtener todas las tareas existentes.
+    def get_all_tasks(after_id=None, limit=None, completed=None, priority_id=None, category_id=None, fields=None):
+        """Obtener una página de las tareas existentes.
         
+        Args:
+            after_id (int, opcional): ID de la última tarea de la página anterior.
+            limit (int, opcional): Tamaño de página, acotado por `PAGINATION_MAX_LIMIT`.
+            completed (bool, opcional): Filtrar por estado de la tarea.
+            priority_id (int, opcional): Filtrar por prioridad.
+            category_id (int, opcional): Filtrar por categoría asociada.
+            fields (tuple, opcional): Campos que se van a serializar; por defecto todos.
+
+        Returns:
+            Page: Tareas de la página ordenadas por ID y cursor de la siguiente página.
+        """
+        # Paginación por cursor sobre la clave primaria, nunca se carga la tabla completa
+        query = TaskService._apply_filters(TaskService._read_query(fields), completed, priority_id, category_id)
+        return paginate(query, Task.id, after_id, limit)
+
+    @staticmethod
+    def get_all_task_dicts(after_id=None, limit=None, completed=None, priority_id=None, category_id=None, fields=None):
+        """Obtener una página de tareas ya serializada, leyendo tuplas en lugar de objetos del ORM.
+
+        Produce los mismos datos que `get_all_tasks` serializado con `task_response_model`
+        (mismas claves y en el mismo orden), con una consulta de columnas para las tareas y
+        otra para sus categorías.
+
+        Args:
+            after_id (int, opcional): ID de la última tarea de la página anterior.
+            limit (int, opcional): Tamaño de página, acotado por `PAGINATION_MAX_LIMIT`.
+            completed (bool, opcional): Filtrar por estado de la tarea.
+            priority_id (int, opcional): Filtrar por prioridad.
+            category_id (int, opcional): Filtrar por categoría asociada.
+            fields (tuple, opcional): Campos que se leen y se devuelven; por defecto todos.
+
+        Returns:
+            Page: Diccionarios de las tareas de la página y cursor de la siguiente página.
+        """
+        fields = fields or TASK_FIELDS
+        # La clave primaria se lee siempre: la necesitan el cursor y las categorías
+        columns = [Task.id] + [TASK_FIELD_COLUMNS[name] for name in fields if name in TASK_FIELD_COLUMNS and name != 'id']
+        query = Task.query.with_entities(*columns)
+        page = paginate(TaskService._apply_filters(query, completed, priority_id, category_id), Task.id, after_id, limit)
+
+        categories = {row.id: [] for row in page.items}
+        if categories and 'categories' in fields:
+            # Solo los enlaces de las tareas de la página; el orden es el de la relación Task.categories
+            links = db.session.execute(
+                select(task_category.c.task_id, Category.id, Category.name)
+                .join(Category, Category.id == task_category.c.category_id)
+                .where(task_category.c.task_id.in_(list(categories)))
+                .order_by(task_category.c.task_id, Category.id)
+            )
+            for task_id, category_id, name in links:
+                categories[task_id].append({'id': category_id, 'name': name})
+
+        if fields == TASK_FIELDS:
+            items = [
+                {'id': row.id, 'title': row.title, 'description': row.description, 'completed': row.completed,
+                 'categories': categories[row.id]}
+                for row in page.items
+            ]
+        else:
+            items = [
+                {name: categories[row.id] if name == 'categories' else getattr(row, name) for name in fields}
+                for row in page.items
+            ]
+        return page._replace(items=items)
+
+    @staticmethod
+    def search_tasks(query_text, offset=0, limit=None, fields=None):
+        """Buscar tareas por título y descripción, ordenadas por relevancia.
+
+        Args:
+            query_text (str): Texto a buscar.
+            offset (int, opcional): Número de resultados a saltar (viene del cursor).
+            limit (int, opcional): Tamaño de página, acotado por `PAGINATION_MAX_LIMIT`.
+            fields (tuple, opcional): Campos que se van a serializar; por defecto todos.
+
+        Returns:
+            Page: Tareas de la página en orden de relevancia y cursor de la siguiente página.
+        """
+        limit = clamp_limit(limit)
+        # Pedimos un resultado extra para saber si existe una página siguiente
+        task_ids = SearchService.get_backend().search(query_text, offset, limit + 1)
+        next_cursor = None
+        if len(task_ids) > limit:
+            task_ids = task_ids[:limit]
+            next_cursor = encode_cursor(offset + limit)
+
+        tasks = TaskService._read_query(fields).filter(Task.id.in_(task_ids)).all() if task_ids else []
+        # Devolver las tareas en el orden de relevancia del motor de búsqueda
+        position = {task_id: index for index, task_id in enumerate(task_ids)}
+        tasks.sort(key=lambda task: position[task.id])
+        return Page(tasks, next_cursor)
+
+    @staticmethod
+    def get_stats():
+        """Obtener las estadísticas de tareas (totales, por prioridad y por categoría).
+
         Returns:
-            List[Task]: Lista de todas las tareas en la base de datos.
+            dict: Estadísticas leídas de los contadores mantenidos en cada escritura.
         """
-        # Devolver todas las tareas almacenadas
-        return Task.query.all()
+        return TaskCounterService.get_stats()
+
+    @staticmethod
+    def iter_tasks(batch_size):
+        """Recorrer todas las tareas leyendo la base de datos por lotes.
+
+        Usa `yield_per` para que el driver lea las filas con un cursor del lado del servidor
+        en lotes de `batch_size`, y saca cada tarea de la sesión una vez entregada, de modo
+        que la memoria se mantiene constante sin importar cuántas tareas existan.
+
+        Args:
+            batch_size (int): Número de filas leídas por lote.
+
+        Yields:
+            Task: Cada tarea, ordenada por ID, con sus categorías cargadas.
+        """
+        query = Task.query.options(selectinload(Task.categories)).order_by(Task.id).yield_per(batch_size)
+        for task in query:
+            yield task
+            # Liberar la tarea del mapa de identidad para no acumular objetos en memoria
+            db.session.expunge(task)
+
+    @staticmethod
+    def _set_task_completed(task_id, completed):
+        # UPDATE condicional: la base de datos decide, con la fila bloqueada, si el estado
+        # cambia; dos solicitudes simultáneas no pueden contar el mismo cambio dos veces
+        result = db.session.execute(
+            update(Task)
+            .where(Task.id == task_id, Task.completed != completed)
+            .values(completed=completed)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount:
+            priority_id = db.session.scalar(select(Task.priority_id).where(Task.id == task_id))
+            category_ids = frozenset(db.session.scalars(
+                select(task_category.c.category_id).where(task_category.c.task_id == task_id)
+            ))
+            TaskCounterService.apply(TaskCounterService.diff(
+                (priority_id, category_ids, not completed), (priority_id, category_ids, completed)
+            ))
+            # Incrementar la versión de la tabla para invalidar los ETags
+            TableVersionService.bump('tasks')
+            transaction.commit()
+
+        # Sin cambios la tarea puede no existir, o ya tener el estado pedido
+        task = db.session.get(Task, task_id, populate_existing=True)
+        if not task:
+            raise NotFoundError('Task not found')
+        return task
 
     @staticmethod
     def mark_task_completed(task_id):
         """Marcar una tarea como completada.
+
+        Los contadores de estadísticas solo cambian si la tarea no estaba completada.
         
         Args:
             task_id (int): El ID de la tarea a marcar como completada.
@@ -132,26 +573,15 @@ class TaskService:
             Task: La tarea con el estado actualizado.
 
         Raises:
-            ValueError: Si la tarea no se encuentra.
+            NotFoundError: Si la tarea no se encuentra.
         """
-        # Buscar la tarea por su ID
-        task = Task.query.get(task_id)
-        
-        # Si la tarea no existe, lanzar un error
-        if not task:
-            raise ValueError('Task not found')
-        
-        # Marcar la tarea como completada
-        task.completed = True
-        
-        # Confirmar los cambios
-        db.session.commit()
-        
-        return task
+        return TaskService._set_task_completed(task_id, True)
 
     @staticmethod
     def mark_task_incomplete(task_id):
         """Marcar una tarea como incompleta.
+
+        Los contadores de estadísticas solo cambian si la tarea estaba completada.
         
         Args:
             task_id (int): El ID de la tarea a marcar como incompleta.
@@ -160,19 +590,67 @@ class TaskService:
             Task: La tarea con el estado actualizado.
 
         Raises:
-            ValueError: Si la tarea no se encuentra.
+            NotFoundError: Si la tarea no se encuentra.
         """
-        # Buscar la tarea por su ID
-        task = Task.query.get(task_id)
-        
-        # Si la tarea no existe, lanzar un error
-        if not task:
-            raise ValueError('Task not found')
-        
-        # Marcar la tarea como incompleta
-        task.completed = False
-        
-        # Confirmar los cambios
-        db.session.commit()
-        
-        return task
\ No newline at end of file
+        return TaskService._set_task_completed(task_id, False)
+
+    @staticmethod
+    def set_tasks_completed(completed, task_ids=None, priority_id=None, category_id=None):
+        """Cambiar el estado de muchas tareas con una sola sentencia UPDATE.
+
+        Las tareas se seleccionan por sus IDs o por filtros; solo se modifican las que
+        todavía no tienen el estado pedido. Los contadores de estadísticas se ajustan con
+        las mismas filas, bloqueadas con SELECT ... FOR UPDATE antes del UPDATE, leyendo solo
+        la prioridad y las categorías de cada tarea.
+
+        Args:
+            completed (bool): Estado a asignar (True completa, False reabre).
+            task_ids (List[int], opcional): IDs de las tareas a modificar.
+            priority_id (int, opcional): Modificar las tareas de esta prioridad.
+            category_id (int, opcional): Modificar las tareas de esta categoría.
+
+        Returns:
+            int: Número de tareas modificadas.
+
+        Raises:
+            ValueError: Si no se indican IDs ni filtros.
+        """
+        if task_ids is None and priority_id is None and category_id is None:
+            raise ValueError('Provide task ids or a filter')
+
+        # Filas afectadas: las seleccionadas que aún no tienen el estado pedido
+        query = TaskService._apply_filters(Task.query, not completed, priority_id, category_id)
+        if task_ids is not None:
+            query = query.filter(Task.id.in_(task_ids))
+        criteria = query.whereclause
+
+        # Se bloquean las filas seleccionadas (y sus enlaces a categorías) antes de contarlas:
+        # otra transacción no puede cambiarlas hasta el commit, de modo que el UPDATE modifica
+        # exactamente las filas contadas. FOR UPDATE no admite GROUP BY: se agrupa en Python
+        sign = 1 if completed else -1
+        by_priority = Counter(db.session.execute(
+            select(Task.priority_id).where(criteria).with_for_update()
+        ).scalars())
+        updated = sum(by_priority.values())
+        if not updated:
+            return 0
+        deltas = {('all', 0): [0, sign * updated]}
+        deltas.update({('priority', ref_id): [0, sign * count] for ref_id, count in by_priority.items()})
+        by_category = Counter(db.session.execute(
+            select(task_category.c.category_id)
+            .join(Task, Task.id == task_category.c.task_id)
+            .where(criteria)
+            .with_for_update(of=task_category)
+        ).scalars())
+        deltas.update({('category', ref_id): [0, sign * count] for ref_id, count in by_category.items()})
+
+        # Un único UPDATE ... WHERE sobre todas las tareas seleccionadas
+        result = db.session.execute(
+            update(Task).where(criteria).values(completed=completed).execution_options(synchronize_session=False)
+        )
+        TaskCounterService.apply(deltas)
+
+        # Incrementar la versión de la tabla para invalidar los ETags
+        TableVersionService.bump('tasks')
+        transaction.commit()
+        return result.rowcount
@@ -1,26 +1,35 @@
-from app import db, bcrypt
+from app import db
 from app.models.user import User
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import load_only
+from app.utils.pagination import paginate
+from app.utils.password_hasher import HasherBusyError, hash_password, needs_rehash
 
 class UserService:
     @staticmethod
     def create_user(username, password):
-        # Lógica para crear un nuevo usuario
-        new_user = User(username=username, password=password)  # Asumiendo que tienes un modelo User
+        # Lógica para crear un nuevo usuario; la contraseña se guarda como hash bcrypt (calculado en el pool de procesos)
+        new_user = User(username=username, password=hash_password(password))
         db.session.add(new_user)
         db.session.commit()
         return new_user  # Asegúrate de que `new_user` sea serializable
     
     @staticmethod
-    def get_all_users():
+    def get_all_users(after_id=None, limit=None):
         """
-        Obtener todos los usuarios de la base de datos.
+        Obtener una página de los usuarios de la base de datos.
         
+        Args:
+            after_id (int, opcional): ID del último usuario de la página anterior.
+            limit (int, opcional): Tamaño de página, acotado por `PAGINATION_MAX_LIMIT`.
+
         Returns:
-            List[User]: Lista de todos los usuarios en la base de datos.
+            Page: Usuarios de la página ordenados por ID y cursor de la siguiente página,
+            con solo el ID y el nombre de usuario cargados.
         """
-        # Recuperar todos los registros de la tabla User
-        return User.query.all()
+        # Recuperar una página de la tabla User usando paginación por cursor; el hash de la
+        # contraseña nunca se lee en los listados
+        return paginate(User.query.options(load_only(User.id, User.username, raiseload=True)), User.id, after_id, limit)
 
     @staticmethod
     def get_user_by_username(username):
@@ -36,6 +45,48 @@ class UserService:
         # Filtrar usuarios por su nombre de usuario (username)
         return User.query.filter_by(username=username).first()
 
+    @staticmethod
+    def get_user_claims(user):
+        """
+        Obtener los claims de autorización que se incluyen en el token JWT del usuario.
+        
+        Args:
+            user (User): Usuario autenticado.
+        
+        Returns:
+            dict: ID del usuario (`uid`) y nombre de su prioridad (`priority`), o None si no tiene.
+        """
+        # El modelo User todavía no define una relación de prioridad; si existe, se usa su nombre
+        priority = getattr(user, 'priority', None)
+        return {
+            'uid': user.id,
+            'priority': priority.name if priority else None
+        }
+
+    @staticmethod
+    def rehash_password_if_needed(user, password):
+        """
+        Regenerar el hash de la contraseña si se generó con un coste bcrypt desactualizado.
+        
+        Se llama tras un inicio de sesión correcto, cuando se conoce la contraseña en texto plano.
+        
+        Args:
+            user (User): Usuario recién autenticado.
+            password (str): Contraseña en texto plano verificada.
+        
+        Returns:
+            bool: True si se actualizó el hash.
+        """
+        if not needs_rehash(user.password):
+            return False
+        try:
+            user.password = hash_password(password)
+        except HasherBusyError:
+            # Con el pool saturado se deja para el siguiente inicio de sesión
+            return False
+        db.session.commit()
+        return True
+
     @staticmethod
     def update_user(username, new_data):
         """
@@ -59,7 +110,7 @@ class UserService:
 
         # Si se proporciona una nueva contraseña, generar el hash
         if 'password' in new_data:
-            user.password = bcrypt.generate_password_hash(new_data['password']).decode('utf-8')
+            user.password = hash_password(new_data['password'])  # Hash calculado en el pool de procesos
 
         # Guardar los cambios en la base de datos
         db.session.commit()
@@ -0,0 +1,106 @@
+import threading
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+
+class PoolWaitStats:
+    """Estadísticas acumuladas de espera al obtener conexiones del pool.
+
+    Atributos:
+        count (int): Número de conexiones obtenidas.
+        total (float): Segundos totales de espera.
+        max (float): Mayor espera registrada, en segundos.
+        timeouts (int): Veces que se agotó `pool_timeout` sin obtener conexión.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.timeouts = 0
+
+    def record(self, seconds, timed_out=False):
+        """Registrar una espera.
+
+        Args:
+            seconds (float): Segundos esperados.
+            timed_out (bool, opcional): Si la espera terminó por `pool_timeout`.
+        """
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+                return
+            self.count += 1
+            self.total += seconds
+            self.max = max(self.max, seconds)
+
+    def as_dict(self):
+        """Convertir las estadísticas en un diccionario en milisegundos.
+
+        Returns:
+            dict: Número de esperas, total, media y máximo en ms, y número de timeouts.
+        """
+        with self._lock:
+            return {
+                'count': self.count,
+                'total_ms': round(self.total * 1000, 3),
+                'avg_ms': round(self.total * 1000 / self.count, 3) if self.count else 0.0,
+                'max_ms': round(self.max * 1000, 3),
+                'timeouts': self.timeouts
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """`QueuePool` que mide cuánto espera cada solicitud para obtener una conexión."""
+
+    # SQLAlchemy nombra el logger del pool con el módulo de la clase; sin esto quedaría bajo el
+    # logger `app` de Flask y con DEBUG activo registraría cada checkout y checkin. Así cuelga de
+    # `sqlalchemy.pool`, como el QueuePool normal, y solo se activa con `echo_pool`
+    _sqla_logger_namespace = 'sqlalchemy.pool.impl.InstrumentedQueuePool'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.wait_stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.wait_stats.record(time.perf_counter() - start)
+        return connection
+
+
+def get_pool_status(engine):
+    """Obtener el estado actual del pool de conexiones de un engine.
+
+    Args:
+        engine (Engine): Engine de SQLAlchemy.
+
+    Returns:
+        dict: Clase del pool y, si es un `QueuePool`, conexiones en uso, libres y de desborde,
+        más las estadísticas de espera si el pool está instrumentado.
+    """
+    pool = engine.pool
+    status = {'pool_class': type(pool).__name__}
+    if not isinstance(pool, QueuePool):
+        status['status'] = pool.status()
+        return status
+
+    status.update({
+        'size': pool.size(),
+        'checked_out': pool.checkedout(),
+        'idle': pool.checkedin(),
+        # `overflow()` es negativo mientras no se hayan abierto todas las conexiones base
+        'overflow': max(pool.overflow(), 0),
+        'max_overflow': pool._max_overflow,
+        'timeout': pool.timeout()
+    })
+    if isinstance(pool, InstrumentedQueuePool):
+        status['wait'] = pool.wait_stats.as_dict()
+    return status
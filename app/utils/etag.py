@@ -0,0 +1,60 @@
+import hashlib
+from functools import wraps
+
+from flask import Response, after_this_request, request
+
+from app.services.table_version_service import TableVersionService
+
+
+def build_etag(versions):
+    """Construye el valor del ETag a partir de las versiones y de la URL solicitada.
+
+    Args:
+        versions (dict): Versión de cada tabla de la que depende la respuesta.
+
+    Returns:
+        str: Valor del ETag (sin comillas ni prefijo W/).
+    """
+    # Se incluye la URL completa para que cada página o filtro tenga su propio ETag
+    parts = [request.full_path] + [f'{name}={versions[name]}' for name in sorted(versions)]
+    return hashlib.sha1('|'.join(parts).encode('utf-8')).hexdigest()
+
+
+def conditional_get(*table_names):
+    """Decorador que añade ETags débiles y soporte para `If-None-Match` a un GET.
+
+    El ETag se deriva de los contadores de `table_versions` que mantienen los servicios,
+    por lo que comprobarlo cuesta una consulta por clave primaria. Si coincide con el
+    `If-None-Match` del cliente se responde 304 sin ejecutar el endpoint, es decir, sin
+    la consulta del listado ni la serialización. Debe colocarse por encima de los
+    decoradores `marshal_*` y por debajo de `jwt_required`.
+
+    Args:
+        *table_names (str): Tablas de las que depende la respuesta del endpoint.
+
+    Returns:
+        Función decoradora.
+    """
+
+    def decorator(func):
+        @wraps(func)  # Mantiene el nombre y la docstring original de la función decorada
+        def wrapper(*args, **kwargs):
+            etag = build_etag(TableVersionService.get_request_versions(table_names))
+
+            # El cliente ya tiene la versión actual: 304 sin cuerpo
+            if request.if_none_match.contains_weak(etag):
+                response = Response(status=304)
+                response.set_etag(etag, weak=True)
+                return response
+
+            @after_this_request
+            def add_etag(response):
+                # Solo las respuestas correctas son cacheables por el cliente
+                if response.status_code == 200:
+                    response.set_etag(etag, weak=True)
+                return response
+
+            return func(*args, **kwargs)
+
+        return wrapper
+    return decorator
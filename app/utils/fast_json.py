@@ -0,0 +1,87 @@
+import json
+from functools import wraps
+
+from flask import current_app
+from flask_restx.representations import dumps as restx_dumps
+from flask_restx.utils import unpack
+
+from app.utils.sparse_fields import marshal_fields_with
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional: sin él se usa el mismo codificador que flask-restx
+    orjson = None
+
+# Única configuración de `RESTX_JSON` con la que orjson produce exactamente los mismos bytes
+# que `json.dumps`: separadores compactos y caracteres no ASCII sin escapar
+ORJSON_SETTINGS = {'separators': (',', ':'), 'ensure_ascii': False}
+
+
+def fast_serialization_enabled():
+    """Indica si los endpoints de listado deben usar la serialización rápida.
+
+    Returns:
+        bool: Valor de `FAST_SERIALIZATION_ENABLED` en la configuración de la aplicación.
+    """
+    return current_app.config.get('FAST_SERIALIZATION_ENABLED', False)
+
+
+def _json_settings():
+    # Mismas opciones que `output_json` de flask-restx, sin modificar la configuración
+    settings = dict(current_app.config.get('RESTX_JSON', {}))
+    if current_app.debug:
+        settings.setdefault('indent', 4)
+    return settings
+
+
+def dumps(data):
+    """Codificar `data` con los mismos bytes que `output_json` de flask-restx.
+
+    Se usa orjson cuando está instalado, flask-restx codifica con el módulo `json` de la
+    biblioteca estándar y `RESTX_JSON` es exactamente `ORJSON_SETTINGS`; en cualquier
+    otro caso se usa el mismo codificador y las mismas opciones que flask-restx.
+
+    Args:
+        data: Datos ya serializados (dicts, listas y valores JSON).
+
+    Returns:
+        bytes: Documento JSON terminado en salto de línea.
+    """
+    settings = _json_settings()
+    if orjson is not None and restx_dumps is json.dumps and settings == ORJSON_SETTINGS:
+        return orjson.dumps(data) + b'\n'
+    return (restx_dumps(data, **settings) + '\n').encode('utf-8')
+
+
+def fast_list_with(namespace, model):
+    """Decorador para los GET de listado con serialización rápida opcional.
+
+    Documenta la respuesta igual que `namespace.marshal_list_with(model)`. Si
+    `FAST_SERIALIZATION_ENABLED` está desactivado se comporta como ese decorador
+    (respetando `?fields=`, ver `marshal_fields_with`). Si está activado, el endpoint debe
+    devolver los elementos ya convertidos en diccionarios con los campos pedidos y las
+    claves en el orden del modelo, que se codifican directamente con `dumps` sin pasar
+    por `marshal`.
+
+    Args:
+        namespace (Namespace): Namespace del endpoint.
+        model (Model): Modelo de respuesta de cada elemento.
+
+    Returns:
+        Función decoradora.
+    """
+
+    def decorator(func):
+        marshalled = marshal_fields_with(namespace, model, as_list=True)(func)
+
+        @wraps(marshalled)  # Conserva la documentación del modelo de respuesta
+        def wrapper(*args, **kwargs):
+            if not fast_serialization_enabled():
+                return marshalled(*args, **kwargs)
+            data, code, headers = unpack(func(*args, **kwargs))
+            response = current_app.response_class(dumps(data), status=code, mimetype='application/json')
+            response.headers.extend(headers or {})
+            return response
+
+        return wrapper
+    return decorator
@@ -0,0 +1,229 @@
+import hashlib
+import threading
+import time
+from collections import namedtuple
+from functools import wraps
+
+from flask import after_this_request, current_app, request
+from flask_jwt_extended import get_jwt_identity
+from flask_restx.utils import unpack
+from werkzeug.utils import import_string
+
+from app.utils.ttl_cache import TTLCache
+
+# Cabecera con la que el cliente identifica una solicitud que puede reintentar
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+
+# Cabecera que se añade a las respuestas repetidas desde la caché
+REPLAYED_HEADER = 'Idempotent-Replayed'
+
+# Longitud máxima de la clave enviada por el cliente
+MAX_KEY_LENGTH = 255
+
+# Respuesta guardada de una solicitud: huella del cuerpo y resultado ya serializado del endpoint
+IdempotentResponse = namedtuple('IdempotentResponse', ['fingerprint', 'data', 'code', 'headers'])
+
+
+class IdempotencyInFlight(Exception):
+    """La solicitud original con la misma clave sigue en curso tras el tiempo de espera."""
+
+
+class IdempotencyStore:
+    """Interfaz de los almacenes de respuestas idempotentes.
+
+    Cada clave pasa por dos estados: en curso (la solicitud original se está ejecutando)
+    y completada (su respuesta está guardada). Un almacén compartido entre procesos (por
+    ejemplo, sobre Redis) se configura con `IDEMPOTENCY_BACKEND` indicando su ruta de
+    importación y debe implementar estos métodos.
+    """
+
+    @classmethod
+    def from_app(cls, app):
+        """Crear el almacén a partir de la configuración de la aplicación.
+
+        Args:
+            app (Flask): Aplicación actual.
+
+        Returns:
+            IdempotencyStore: Almacén configurado.
+        """
+        return cls(app.config['IDEMPOTENCY_CACHE_SIZE'], app.config['IDEMPOTENCY_TTL'])
+
+    def lookup_or_lock(self, key, timeout):
+        """Obtener la respuesta guardada de una clave o marcarla como en curso.
+
+        Si otra solicitud con la misma clave está en curso, espera a que termine.
+
+        Args:
+            key (str): Clave de la solicitud.
+            timeout (float): Segundos máximos de espera por una solicitud en curso.
+
+        Returns:
+            IdempotentResponse: La respuesta guardada, o None si la clave quedó marcada como
+            en curso y el llamador debe ejecutar la solicitud y llamar a `save` o `release`.
+
+        Raises:
+            IdempotencyInFlight: Si la solicitud en curso no terminó dentro de `timeout`.
+        """
+        raise NotImplementedError
+
+    def save(self, key, response):
+        """Guardar la respuesta de una clave en curso y liberar a las solicitudes en espera.
+
+        Args:
+            key (str): Clave de la solicitud.
+            response (IdempotentResponse): Respuesta a repetir en los reintentos.
+        """
+        raise NotImplementedError
+
+    def release(self, key):
+        """Liberar una clave en curso sin guardar respuesta (la solicitud falló).
+
+        Args:
+            key (str): Clave de la solicitud.
+        """
+        raise NotImplementedError
+
+
+class MemoryIdempotencyStore(IdempotencyStore):
+    """Almacén en memoria del proceso, acotado por tamaño (LRU) y con caducidad (TTL).
+
+    Las solicitudes en espera se bloquean en un `threading.Event` de la clave en curso.
+    Con varios procesos (workers de gunicorn) cada uno tiene su propio almacén.
+
+    Atributos:
+        responses (TTLCache): Respuestas guardadas por clave.
+    """
+
+    def __init__(self, maxsize, ttl):
+        self.responses = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._in_flight = {}  # Clave -> Event que se activa al terminar la solicitud original
+        self._lock = threading.Lock()
+
+    def lookup_or_lock(self, key, timeout):
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                response = self.responses.get(key)
+                if response is not None:
+                    return response
+                event = self._in_flight.get(key)
+                if event is None:
+                    self._in_flight[key] = threading.Event()
+                    return None
+            # Si la original falla sin guardar respuesta, se vuelve a intentar marcar la clave
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not event.wait(remaining):
+                raise IdempotencyInFlight()
+
+    def save(self, key, response):
+        with self._lock:
+            self.responses.set(key, response)
+            event = self._in_flight.pop(key, None)
+        if event is not None:
+            event.set()
+
+    def release(self, key):
+        with self._lock:
+            event = self._in_flight.pop(key, None)
+        if event is not None:
+            event.set()
+
+
+# Almacenes disponibles por nombre en `IDEMPOTENCY_BACKEND`
+IDEMPOTENCY_BACKENDS = {
+    'memory': MemoryIdempotencyStore
+}
+
+
+def get_idempotency_store():
+    """Obtener el almacén de respuestas idempotentes de la aplicación actual.
+
+    Returns:
+        IdempotencyStore: Almacén de `IDEMPOTENCY_BACKEND`, un nombre de
+        `IDEMPOTENCY_BACKENDS` o una ruta de importación (`paquete.modulo:Clase`).
+    """
+    store = current_app.extensions.get('idempotency')
+    if store is None:
+        backend = current_app.config['IDEMPOTENCY_BACKEND']
+        store_class = IDEMPOTENCY_BACKENDS.get(backend) or import_string(backend)
+        store = current_app.extensions['idempotency'] = store_class.from_app(current_app)
+    return store
+
+
+def _scope():
+    # Las claves de cada usuario son independientes; sin JWT se separan por dirección del cliente
+    try:
+        identity = get_jwt_identity()
+    except RuntimeError:
+        identity = None
+    return f'addr:{request.remote_addr}' if identity is None else f'user:{identity}'
+
+
+def idempotent(namespace):
+    """Decorador que admite la cabecera `Idempotency-Key` en un POST.
+
+    La primera solicitud con una clave se ejecuta y su respuesta (salvo los errores 5xx)
+    se guarda; los reintentos con la misma clave la repiten desde el almacén, con la
+    cabecera `Idempotent-Replayed`, sin ejecutar el endpoint ni consultar la base de
+    datos. Un reintento que llega mientras la original sigue en curso espera a que
+    termine (hasta `IDEMPOTENCY_WAIT_TIMEOUT`, luego 409). Reutilizar la clave con otro
+    cuerpo responde 422. Sin la cabecera el endpoint se comporta como siempre.
+
+    Debe colocarse por debajo de `jwt_required` (las claves se separan por usuario) y
+    por encima de los decoradores `marshal_*`, para guardar la respuesta ya serializada.
+    En los endpoints sin JWT las claves se separan por dirección del cliente.
+
+    Args:
+        namespace (Namespace): Namespace del endpoint, para documentar la cabecera.
+
+    Returns:
+        Función decoradora.
+    """
+
+    def decorator(func):
+        @wraps(func)  # Conserva la documentación del modelo de respuesta
+        def wrapper(*args, **kwargs):
+            client_key = request.headers.get(IDEMPOTENCY_HEADER)
+            if client_key is None:
+                return func(*args, **kwargs)
+            if not client_key or len(client_key) > MAX_KEY_LENGTH:
+                namespace.abort(400, f'Invalid {IDEMPOTENCY_HEADER} header')
+
+            # La misma clave en otro endpoint o de otro usuario es otra solicitud
+            key = '\x1f'.join((_scope(), request.method, request.path, client_key))
+            fingerprint = hashlib.sha256(request.get_data()).hexdigest()
+            store = get_idempotency_store()
+            try:
+                stored = store.lookup_or_lock(key, current_app.config['IDEMPOTENCY_WAIT_TIMEOUT'])
+            except IdempotencyInFlight:
+                namespace.abort(409, 'A request with this idempotency key is still in progress')
+
+            if stored is not None:
+                if stored.fingerprint != fingerprint:
+                    namespace.abort(422, f'{IDEMPOTENCY_HEADER} was already used with a different payload')
+
+                @after_this_request
+                def mark_replayed(response):
+                    response.headers[REPLAYED_HEADER] = 'true'
+                    return response
+
+                return stored.data, stored.code, stored.headers
+
+            try:
+                data, code, headers = unpack(func(*args, **kwargs))
+            except BaseException:
+                store.release(key)
+                raise
+            if code >= 500:
+                # Los errores del servidor no se guardan: el reintento vuelve a ejecutarse
+                store.release(key)
+            else:
+                store.save(key, IdempotentResponse(fingerprint, data, code, dict(headers or {})))
+            return data, code, headers
+
+        return namespace.doc(params={IDEMPOTENCY_HEADER: {
+            'in': 'header', 'type': 'string',
+            'description': 'Clave única de la solicitud; los reintentos con la misma clave repiten la primera respuesta'
+        }})(wrapper)
+    return decorator
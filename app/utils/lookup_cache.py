@@ -0,0 +1,232 @@
+import logging
+import threading
+
+from flask import current_app
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import make_transient_to_detached
+
+from app import db
+from app.models.category import Category
+from app.models.priority import Priority
+from app.services.table_version_service import TableVersionService
+from app.utils.transaction import in_batch
+
+logger = logging.getLogger(__name__)
+
+
+class LookupEntry:
+    """Copia de solo lectura de una fila de una tabla de consulta.
+
+    Expone los mismos atributos que el modelo, por lo que se serializa igual con `marshal`.
+
+    Atributos:
+        id (int): Clave primaria de la fila.
+        name (str): Nombre de la fila.
+    """
+
+    __slots__ = ('id', 'name')
+
+    def __init__(self, entry_id, name):
+        self.id = entry_id
+        self.name = name
+
+    def __repr__(self):
+        return f'<LookupEntry {self.id} {self.name}>'
+
+
+class LookupCache:
+    """Caché en memoria de una tabla pequeña de consulta (id -> fila y nombre -> fila).
+
+    Guarda copias inmutables de las filas en lugar de instancias del ORM, de modo que
+    pueden compartirse entre solicitudes e hilos sin quedar ligadas a una sesión.
+    La caché es local a cada proceso, así que cada copia se marca con la versión de la
+    tabla en `table_versions` (que los servicios incrementan en cada escritura) y se
+    recarga cuando esa versión cambia; la versión se lee como mucho una vez por solicitud.
+    Los servicios que escriben en la tabla además llaman a `invalidate()` después del
+    commit, para que el proceso que escribió no espere a la comprobación. Dentro de un
+    lote (`app.utils.transaction.batch`), o con `LOOKUP_CACHE_ENABLED` desactivado, las
+    lecturas consultan la tabla en la sesión sin guardar nada.
+
+    Atributos:
+        model (db.Model): Modelo cacheado; debe tener las columnas `id` y `name`.
+        table_name (str): Nombre de la tabla en `table_versions`.
+        version (int): Se incrementa en cada invalidación.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.table_name = model.__tablename__
+        self.version = 0
+        self._lock = threading.Lock()
+        # Par (versión de la tabla, (filas, por ID, por nombre)) o None si está invalidada
+        self._data = None
+
+    def load(self):
+        """Cargar (o recargar) la tabla completa en memoria.
+
+        Returns:
+            tuple: Filas ordenadas por ID, diccionario por ID y diccionario por nombre.
+        """
+        version = self.version
+        # La versión de la tabla se lee antes que las filas: si otra escritura se confirma
+        # entre ambas lecturas, la copia queda marcada como anterior y se vuelve a cargar
+        table_version = TableVersionService.get_versions([self.table_name])[self.table_name]
+        TableVersionService.remember_versions({self.table_name: table_version})
+        return self.store(db.session.execute(self.statement()).all(), version, table_version)
+
+    def statement(self):
+        """Sentencia que lee la tabla completa; también se ejecuta desde sesiones asíncronas.
+
+        Returns:
+            Select: SELECT de `id` y `name` ordenado por ID.
+        """
+        return select(self.model.id, self.model.name).order_by(self.model.id)
+
+    def store(self, rows, version, table_version):
+        """Guardar en la caché las filas leídas con `statement()`.
+
+        Args:
+            rows (list): Filas con `id` y `name`.
+            version (int): Valor de `version` antes de leer las filas.
+            table_version (int): Versión de la tabla en `table_versions`, leída antes que las filas.
+
+        Returns:
+            tuple: Filas ordenadas por ID, diccionario por ID y diccionario por nombre.
+        """
+        data = self._build(rows)
+        with self._lock:
+            # Si hubo una invalidación mientras se leía la tabla, lo leído no se guarda
+            if version == self.version:
+                self._data = (table_version, data)
+        return data
+
+    @staticmethod
+    def _build(rows):
+        entries = [LookupEntry(row.id, row.name) for row in rows]
+        return entries, {entry.id: entry for entry in entries}, {entry.name: entry for entry in entries}
+
+    def is_current(self, table_version):
+        """Indicar si la caché tiene en memoria la versión indicada de la tabla.
+
+        Args:
+            table_version (int): Versión actual de la tabla en `table_versions`.
+
+        Returns:
+            bool: True si las lecturas no necesitan consultar la tabla.
+        """
+        data = self._data
+        return data is not None and data[0] == table_version
+
+    def invalidate(self):
+        """Marcar la caché como obsoleta tras una escritura en la tabla."""
+        with self._lock:
+            self.version += 1
+            self._data = None
+
+    def _snapshot(self):
+        if in_batch() or not current_app.config['LOOKUP_CACHE_ENABLED']:
+            # Dentro de un lote la sesión ve escrituras aún sin confirmar: se leen de la
+            # tabla sin guardarlas, porque el lote todavía puede deshacerse
+            return self._build(db.session.execute(self.statement()).all())
+        table_version = TableVersionService.get_request_versions([self.table_name])[self.table_name]
+        data = self._data
+        if data is not None and data[0] == table_version:
+            return data[1]
+        return self.load()
+
+    def all(self):
+        """Obtener todas las filas ordenadas por ID.
+
+        Returns:
+            List[LookupEntry]: Filas de la tabla.
+        """
+        return self._snapshot()[0]
+
+    def get(self, entry_id):
+        """Obtener una fila por su ID.
+
+        Args:
+            entry_id (int): ID de la fila.
+
+        Returns:
+            LookupEntry: La fila, o None si no existe.
+        """
+        return self._snapshot()[1].get(entry_id)
+
+    def get_by_name(self, name):
+        """Obtener una fila por su nombre.
+
+        Args:
+            name (str): Nombre de la fila.
+
+        Returns:
+            LookupEntry: La fila, o None si no existe.
+        """
+        return self._snapshot()[2].get(name)
+
+    def missing(self, entry_ids):
+        """Obtener los IDs que no existen en la tabla.
+
+        Args:
+            entry_ids (Iterable[int]): IDs a comprobar.
+
+        Returns:
+            set: IDs inexistentes.
+        """
+        by_id = self._snapshot()[1]
+        return {entry_id for entry_id in entry_ids if entry_id not in by_id}
+
+    def attach(self, entry_ids):
+        """Obtener instancias del ORM asociadas a la sesión actual sin consultar la tabla.
+
+        Se usa para asignar relaciones (por ejemplo `task.categories`) a partir de la caché:
+        las instancias se construyen con los datos cacheados y se incorporan a la sesión con
+        `merge(load=False)`, que no emite SELECT.
+
+        Args:
+            entry_ids (Iterable[int]): IDs de las filas.
+
+        Returns:
+            list: Instancias del modelo en el mismo orden que `entry_ids`.
+
+        Raises:
+            ValueError: Si alguno de los IDs no existe.
+        """
+        entry_ids = list(dict.fromkeys(entry_ids))
+        by_id = self._snapshot()[1]
+        if any(entry_id not in by_id for entry_id in entry_ids):
+            raise ValueError(f'Some {self.model.__tablename__} do not exist')
+
+        instances = []
+        for entry_id in entry_ids:
+            # Reutilizar la instancia si ya está en el mapa de identidad de la sesión
+            key = db.session.identity_key(self.model, entry_id)
+            instance = db.session.identity_map.get(key)
+            if instance is None:
+                entry = by_id[entry_id]
+                instance = self.model(name=entry.name)
+                instance.id = entry.id
+                make_transient_to_detached(instance)
+                instance = db.session.merge(instance, load=False)
+            instances.append(instance)
+        return instances
+
+
+# Cachés globales de las tablas de consulta, igual que las extensiones en `app/__init__.py`
+priority_cache = LookupCache(Priority)
+category_cache = LookupCache(Category)
+
+
+def preload_lookup_caches():
+    """Precargar las cachés de consulta al arrancar la aplicación.
+
+    Si la base de datos todavía no está disponible (por ejemplo, antes de ejecutar las
+    migraciones), se registra un aviso y las cachés se cargarán en la primera lectura.
+    """
+    try:
+        priority_cache.load()
+        category_cache.load()
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        logger.warning('Lookup caches not preloaded: %s', e)
@@ -0,0 +1,62 @@
+import json
+import os
+
+from flask_restx import Api
+from flask_restx.swagger import Swagger
+from werkzeug.utils import cached_property
+
+
+class CachedSpecApi(Api):
+    """Api de flask-restx que puede servir la especificación OpenAPI desde un archivo.
+
+    Si `spec_file` existe, `/swagger.json` devuelve su contenido sin recorrer los
+    namespaces ni los modelos; si no, la especificación se genera la primera vez que se
+    pide y queda en memoria. Con `doc=False` tampoco se registra la interfaz de Swagger UI
+    ni sus archivos estáticos.
+
+    Atributos:
+        spec_file (str): Ruta del archivo JSON precalculado, o None.
+        specs_enabled (bool): Si se registra la ruta `/swagger.json` (argumento `add_specs`).
+    """
+
+    def __init__(self, *args, spec_file=None, **kwargs):
+        self.spec_file = spec_file
+        self.specs_enabled = kwargs.get('add_specs', True)
+        super().__init__(*args, **kwargs)
+
+    @cached_property
+    def __schema__(self):
+        if self.spec_file and os.path.exists(self.spec_file):
+            with open(self.spec_file, encoding='utf-8') as spec:
+                return json.load(spec)
+        return super().__schema__
+
+    def _register_specs(self, app_or_blueprint):
+        # `init_app` vuelve a leer `add_specs` de sus propios argumentos e ignora el del constructor
+        self._add_specs = self.specs_enabled
+        super()._register_specs(app_or_blueprint)
+
+    def _register_apidoc(self, app):
+        # Sin documentación no hace falta el blueprint con los estáticos de Swagger UI
+        if self._doc:
+            super()._register_apidoc(app)
+
+
+def export_spec(api, path):
+    """Generar la especificación OpenAPI de una API y guardarla en un archivo JSON.
+
+    Debe llamarse dentro de un contexto de solicitud, porque la especificación incluye
+    la ruta base de la API.
+
+    Args:
+        api (Api): API de flask-restx.
+        path (str): Ruta del archivo de salida.
+
+    Returns:
+        dict: La especificación generada.
+    """
+    # Siempre se genera desde los namespaces, sin leer el archivo existente
+    spec = Swagger(api).as_dict()
+    with open(path, 'w', encoding='utf-8') as output:
+        json.dump(spec, output, ensure_ascii=False, indent=2)
+    return spec
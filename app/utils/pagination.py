@@ -0,0 +1,176 @@
+import base64
+from collections import namedtuple
+from urllib.parse import urlencode
+
+from flask import current_app, request
+
+# Resultado de una consulta paginada: los elementos de la página y el cursor de la siguiente (o None)
+Page = namedtuple('Page', ['items', 'next_cursor'])
+
+
+def encode_cursor(last_id):
+    """Codifica el ID del último elemento de una página en un cursor opaco.
+
+    Args:
+        last_id (int): Clave primaria del último elemento devuelto.
+
+    Returns:
+        str: Cursor en base64 apto para usarse en la URL.
+    """
+    raw = str(last_id).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Decodifica un cursor opaco generado por `encode_cursor`.
+
+    Args:
+        cursor (str): Cursor recibido en el parámetro `after`.
+
+    Returns:
+        int: Clave primaria a partir de la cual continuar, o None si no se envió cursor.
+
+    Raises:
+        ValueError: Si el cursor no es válido.
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        last_id = int(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+    except (ValueError, UnicodeError):
+        raise ValueError('Invalid cursor')
+    if last_id < 0:
+        raise ValueError('Invalid cursor')
+    return last_id
+
+
+def clamp_limit(limit):
+    """Normaliza el tamaño de página respetando el máximo configurado en el servidor.
+
+    Args:
+        limit (int | str | None): Tamaño de página solicitado por el cliente.
+
+    Returns:
+        int: Tamaño de página efectivo, entre 1 y `PAGINATION_MAX_LIMIT`.
+
+    Raises:
+        ValueError: Si el límite no es un entero positivo.
+    """
+    max_limit = current_app.config['PAGINATION_MAX_LIMIT']
+    if limit in (None, ''):
+        return min(current_app.config['PAGINATION_DEFAULT_LIMIT'], max_limit)
+    try:
+        limit = int(limit)
+    except (TypeError, ValueError):
+        raise ValueError('Invalid limit')
+    if limit < 1:
+        raise ValueError('Invalid limit')
+    return min(limit, max_limit)
+
+
+def keyset(query, id_column, after_id, limit):
+    """Aplica el filtro, el orden y el límite de una página a una consulta.
+
+    Sirve tanto para `Query` como para sentencias `select()`, por ejemplo las que se
+    ejecutan con una sesión asíncrona. Pide un elemento extra para saber si existe
+    una página siguiente; el resultado se pasa a `make_page`.
+
+    Args:
+        query (Query | Select): Consulta base de SQLAlchemy.
+        id_column (Column): Columna de clave primaria sobre la que se busca.
+        after_id (int): ID del último elemento de la página anterior, o None.
+        limit (int): Tamaño de página ya normalizado con `clamp_limit`.
+
+    Returns:
+        Query | Select: Consulta de la página.
+    """
+    if after_id is not None:
+        query = query.filter(id_column > after_id)
+    return query.order_by(id_column).limit(limit + 1)
+
+
+def make_page(rows, limit):
+    """Construye la página a partir de las filas leídas con `keyset`.
+
+    Args:
+        rows (list): Filas leídas (como máximo `limit + 1`).
+        limit (int): Tamaño de página.
+
+    Returns:
+        Page: Elementos de la página y cursor para la siguiente página.
+    """
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return Page(rows, encode_cursor(rows[-1].id))
+    return Page(list(rows), None)
+
+
+def paginate(query, id_column, after_id=None, limit=None):
+    """Aplica paginación por cursor (keyset) sobre la clave primaria.
+
+    En lugar de usar OFFSET, filtra por `id > after_id` y ordena por la clave primaria,
+    de modo que cada página se resuelve con un recorrido del índice sin importar su posición.
+
+    Args:
+        query (Query): Consulta base de SQLAlchemy.
+        id_column (Column): Columna de clave primaria sobre la que se busca.
+        after_id (int, opcional): ID del último elemento de la página anterior.
+        limit (int, opcional): Tamaño de página solicitado.
+
+    Returns:
+        Page: Elementos de la página y cursor para la siguiente página.
+    """
+    limit = clamp_limit(limit)
+    return make_page(keyset(query, id_column, after_id, limit).all(), limit)
+
+
+def paginate_items(items, after_id=None, limit=None):
+    """Aplica la misma paginación por cursor sobre una lista ya cargada en memoria.
+
+    Args:
+        items (list): Elementos ordenados por `id`.
+        after_id (int, opcional): ID del último elemento de la página anterior.
+        limit (int, opcional): Tamaño de página solicitado.
+
+    Returns:
+        Page: Elementos de la página y cursor para la siguiente página.
+    """
+    limit = clamp_limit(limit)
+    if after_id is not None:
+        items = [item for item in items if item.id > after_id]
+    return make_page(items, limit)
+
+
+def get_page_args():
+    """Lee los parámetros `after` y `limit` de la solicitud actual.
+
+    Returns:
+        tuple: (after_id, limit) listos para pasarse a los servicios.
+
+    Raises:
+        ValueError: Si el cursor o el límite no son válidos.
+    """
+    after_id = decode_cursor(request.args.get('after'))
+    limit = clamp_limit(request.args.get('limit'))
+    return after_id, limit
+
+
+def page_headers(page):
+    """Construye las cabeceras de navegación para una página.
+
+    Args:
+        page (Page): Página devuelta por un servicio.
+
+    Returns:
+        dict: Cabeceras `X-Next-Cursor` y `Link` si existe una página siguiente.
+    """
+    if not page.next_cursor:
+        return {}
+    args = request.args.to_dict()
+    args['after'] = page.next_cursor
+    next_url = f'{request.base_url}?{urlencode(args)}'
+    return {
+        'X-Next-Cursor': page.next_cursor,
+        'Link': f'<{next_url}>; rel="next"'
+    }
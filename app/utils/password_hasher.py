@@ -0,0 +1,206 @@
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+
+import bcrypt as bcrypt_lib
+from flask import current_app
+
+# Pool de procesos compartido por los hilos del proceso actual; se crea de forma perezosa
+_executor = None
+_executor_pid = None
+_pending = None
+_lock = threading.Lock()
+
+# Duración media de las verificaciones reales (media móvil exponencial), para igualar con ella
+# el tiempo de respuesta de los usuarios inexistentes
+_check_seconds = None
+_CHECK_SECONDS_WEIGHT = 0.1
+
+# Sal y resultado fijos del hash de `reject_password` (alfabeto base64 de bcrypt); el resultado no
+# necesita ser correcto, porque `checkpw` calcula el hash completo antes de compararlo
+_DUMMY_SALT_AND_CHECKSUM = 'rejectpasswordrejectp.' + 'u' * 31
+
+
+class HasherBusyError(RuntimeError):
+    """Se lanza cuando el pool de bcrypt tiene demasiados trabajos pendientes."""
+
+
+def _hash_password(password, rounds):
+    """Genera el hash bcrypt de una contraseña (se ejecuta en un proceso del pool)."""
+    return bcrypt_lib.hashpw(password, bcrypt_lib.gensalt(rounds)).decode('utf-8')
+
+
+def _check_password(pw_hash, password):
+    """Verifica una contraseña contra su hash bcrypt (se ejecuta en un proceso del pool)."""
+    try:
+        return bcrypt_lib.checkpw(password, pw_hash)
+    except ValueError:
+        # El valor guardado no es un hash bcrypt válido
+        return False
+
+
+def bcrypt_pool_size(config):
+    """Obtener el número de procesos del pool de bcrypt de cada worker.
+
+    Cada worker del servidor tiene su propio pool: por defecto los núcleos se reparten
+    entre los `SERVER_WORKERS`, de modo que entre todos no haya más procesos de bcrypt
+    que núcleos.
+
+    Args:
+        config (Config): Configuración de la aplicación.
+
+    Returns:
+        int: `BCRYPT_POOL_SIZE` si está definido; si no, núcleos / `SERVER_WORKERS` (al menos 1).
+    """
+    if config['BCRYPT_POOL_SIZE'] is not None:
+        return config['BCRYPT_POOL_SIZE']
+    return max(1, (os.cpu_count() or 1) // max(1, config['SERVER_WORKERS']))
+
+
+def _get_executor():
+    """Obtener el pool de procesos, creándolo si no existe en este proceso."""
+    global _executor, _executor_pid, _pending
+    with _lock:
+        # Tras un fork (por ejemplo, en los workers del servidor) el pool del padre no sirve
+        if _executor is None or _executor_pid != os.getpid():
+            workers = bcrypt_pool_size(current_app.config)
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+            _executor = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+            _executor_pid = os.getpid()
+            _pending = threading.BoundedSemaphore(workers * current_app.config['BCRYPT_POOL_QUEUE_FACTOR'])
+        return _executor, _pending
+
+
+def _admit(timeout):
+    """Reservar un hueco en la cola del pool de bcrypt.
+
+    Args:
+        timeout (float): Segundos máximos de espera por un hueco.
+
+    Returns:
+        tuple: Pool de procesos y semáforo de la cola; el llamador libera el hueco.
+
+    Raises:
+        HasherBusyError: Si no hay hueco en la cola dentro de `timeout`.
+    """
+    executor, pending = _get_executor()
+    # Acotar el número de trabajos en cola para no acumular solicitudes sin límite
+    if not pending.acquire(timeout=timeout):
+        raise HasherBusyError('Password hasher is busy')
+    return executor, pending
+
+
+def _run(func, *args):
+    """Ejecutar una función de bcrypt en el pool o, si está desactivado, en el hilo actual.
+
+    Raises:
+        HasherBusyError: Si no hay hueco en la cola del pool o el resultado no llega dentro de
+            `BCRYPT_POOL_TIMEOUT`, que acota ambas esperas juntas.
+    """
+    if bcrypt_pool_size(current_app.config) <= 0:
+        return func(*args)
+
+    deadline = time.monotonic() + current_app.config['BCRYPT_POOL_TIMEOUT']
+    executor, pending = _admit(current_app.config['BCRYPT_POOL_TIMEOUT'])
+    try:
+        return executor.submit(func, *args).result(timeout=max(0, deadline - time.monotonic()))
+    except FutureTimeoutError:
+        raise HasherBusyError('Password hasher timed out')
+    finally:
+        pending.release()
+
+
+def hash_password(password):
+    """Generar el hash bcrypt de una contraseña con el coste configurado.
+
+    Args:
+        password (str): Contraseña en texto plano.
+
+    Returns:
+        str: Hash bcrypt.
+    """
+    return _run(_hash_password, password.encode('utf-8'), current_app.config['BCRYPT_LOG_ROUNDS'])
+
+
+def check_password(pw_hash, password):
+    """Verificar una contraseña contra su hash bcrypt.
+
+    Args:
+        pw_hash (str): Hash guardado del usuario.
+        password (str): Contraseña en texto plano.
+
+    Returns:
+        bool: True si la contraseña es correcta.
+    """
+    global _check_seconds
+    started = time.perf_counter()
+    valid = _run(_check_password, pw_hash.encode('utf-8'), password.encode('utf-8'))
+    elapsed = time.perf_counter() - started
+    _check_seconds = elapsed if _check_seconds is None else (
+        _check_seconds + _CHECK_SECONDS_WEIGHT * (elapsed - _check_seconds)
+    )
+    return valid
+
+
+def reject_password():
+    """Rechazar un inicio de sesión de un usuario inexistente en el mismo tiempo que una verificación.
+
+    Espera la duración media de las verificaciones reales (`check_password`) sin ejecutar
+    bcrypt, de modo que la respuesta no revela si el usuario existe y no consume CPU. La
+    espera ocupa un hueco de la cola del pool igual que una verificación real, así que con
+    el pool saturado también lanza `HasherBusyError`. Antes de la primera verificación real
+    del proceso no hay duración que imitar, así que se verifica una contraseña contra un
+    hash fijo con el coste configurado.
+
+    Returns:
+        bool: Siempre False.
+
+    Raises:
+        HasherBusyError: Si el pool de bcrypt no tiene hueco, como en `check_password`.
+    """
+    if _check_seconds is None:
+        check_password(_dummy_hash(), 'dummy-password')
+        return False
+    if bcrypt_pool_size(current_app.config) <= 0:
+        time.sleep(_check_seconds)
+        return False
+    _, pending = _admit(current_app.config['BCRYPT_POOL_TIMEOUT'])
+    try:
+        time.sleep(_check_seconds)
+    finally:
+        pending.release()
+    return False
+
+
+def _dummy_hash():
+    """Hash bcrypt fijo con el coste configurado; se construye sin calcular ningún hash."""
+    return f"$2b${current_app.config['BCRYPT_LOG_ROUNDS']:02d}${_DUMMY_SALT_AND_CHECKSUM}"
+
+
+def needs_rehash(pw_hash):
+    """Indicar si un hash se generó con un coste menor al configurado actualmente.
+
+    Args:
+        pw_hash (str): Hash bcrypt con formato `$2b$<coste>$...`.
+
+    Returns:
+        bool: True si el hash debe regenerarse.
+    """
+    try:
+        rounds = int(pw_hash.split('$')[2])
+    except (IndexError, ValueError):
+        return True
+    return rounds < current_app.config['BCRYPT_LOG_ROUNDS']
+
+
+def shutdown():
+    """Detener el pool de procesos del proceso actual, si existe."""
+    global _executor, _executor_pid
+    with _lock:
+        if _executor is not None and _executor_pid == os.getpid():
+            _executor.shutdown(wait=True)
+        _executor = None
+        _executor_pid = None
@@ -0,0 +1,127 @@
+import math
+import threading
+import time
+from collections import namedtuple
+
+from flask import current_app
+from werkzeug.utils import import_string
+
+from app.utils.ttl_cache import TTLCache
+
+# Estado de un cubo: fichas disponibles y momento (time.monotonic) de la última recarga
+_Bucket = namedtuple('_Bucket', ['tokens', 'updated_at'])
+
+
+class RateLimitBackend:
+    """Interfaz de los almacenes de cubos de fichas (token bucket).
+
+    Cada clave tiene un cubo de `capacity` fichas que se recarga a `rate` fichas por
+    segundo; cada solicitud consume una. Un almacén compartido entre procesos (por
+    ejemplo, sobre Redis) se configura con `RATE_LIMIT_BACKEND` indicando su ruta de
+    importación y debe implementar `take`.
+    """
+
+    @classmethod
+    def from_app(cls, app):
+        """Crear el almacén a partir de la configuración de la aplicación.
+
+        Args:
+            app (Flask): Aplicación actual.
+
+        Returns:
+            RateLimitBackend: Almacén configurado.
+        """
+        return cls(app.config['RATE_LIMIT_MAX_KEYS'])
+
+    def take(self, key, capacity, rate):
+        """Consumir una ficha del cubo de una clave.
+
+        Args:
+            key (str): Clave del cubo.
+            capacity (int): Fichas máximas del cubo (ráfaga permitida).
+            rate (float): Fichas que se recargan por segundo.
+
+        Returns:
+            float: 0 si se consumió la ficha, o los segundos que faltan para que haya una.
+        """
+        raise NotImplementedError
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """Almacén de cubos en memoria del proceso.
+
+    Los cubos se guardan en un `TTLCache` que caduca cada uno cuando ya estaría lleno,
+    de modo que solo ocupan memoria las claves con actividad reciente, hasta `maxsize`.
+    Con varios procesos (workers de gunicorn) cada uno limita por separado.
+    """
+
+    def __init__(self, maxsize):
+        self._buckets = TTLCache(maxsize=maxsize, ttl=0)
+        self._lock = threading.Lock()
+
+    def take(self, key, capacity, rate):
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            tokens = capacity if bucket is None else min(capacity, bucket.tokens + (now - bucket.updated_at) * rate)
+            if tokens < 1:
+                return (1 - tokens) / rate
+            tokens -= 1
+            # Pasado este tiempo el cubo volvería a estar lleno: la entrada ya no hace falta
+            self._buckets.set(key, _Bucket(tokens, now), ttl=(capacity - tokens) / rate)
+            return 0
+
+
+# Almacenes disponibles por nombre en `RATE_LIMIT_BACKEND`
+RATE_LIMIT_BACKENDS = {
+    'memory': MemoryRateLimitBackend
+}
+
+
+def get_rate_limiter():
+    """Obtener el almacén de cubos de la aplicación actual.
+
+    Returns:
+        RateLimitBackend: Almacén de `RATE_LIMIT_BACKEND`, un nombre de
+        `RATE_LIMIT_BACKENDS` o una ruta de importación (`paquete.modulo:Clase`).
+    """
+    limiter = current_app.extensions.get('rate_limit')
+    if limiter is None:
+        backend = current_app.config['RATE_LIMIT_BACKEND']
+        limiter_class = RATE_LIMIT_BACKENDS.get(backend) or import_string(backend)
+        limiter = current_app.extensions['rate_limit'] = limiter_class.from_app(current_app)
+    return limiter
+
+
+def login_retry_after(username, client_ip):
+    """Consumir una ficha de los cubos de inicio de sesión del usuario y de la IP.
+
+    Primero se consulta el cubo de la IP, de modo que un cliente que prueba muchos
+    usuarios se limita sin vaciar los cubos de esos usuarios. Con
+    `LOGIN_RATE_LIMIT_ENABLED` desactivado no limita nada, y un cubo con `BURST` o
+    `PER_MINUTE` a 0 no se aplica.
+
+    Args:
+        username (str): Nombre de usuario enviado (exista o no).
+        client_ip (str): Dirección del cliente.
+
+    Returns:
+        int: 0 si el intento está permitido, o los segundos (para `Retry-After`) que el
+        cliente debe esperar.
+    """
+    config = current_app.config
+    if not config['LOGIN_RATE_LIMIT_ENABLED']:
+        return 0
+    limiter = get_rate_limiter()
+    buckets = (
+        (f'login:ip:{client_ip}', config['LOGIN_RATE_LIMIT_IP_BURST'], config['LOGIN_RATE_LIMIT_IP_PER_MINUTE']),
+        (f'login:user:{username.lower()}', config['LOGIN_RATE_LIMIT_USER_BURST'],
+         config['LOGIN_RATE_LIMIT_USER_PER_MINUTE'])
+    )
+    for key, capacity, per_minute in buckets:
+        if capacity <= 0 or per_minute <= 0:
+            continue
+        wait = limiter.take(key, capacity, per_minute / 60)
+        if wait:
+            return math.ceil(wait)
+    return 0
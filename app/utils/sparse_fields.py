@@ -0,0 +1,98 @@
+from functools import wraps
+
+from flask import request
+from flask_restx import marshal
+from flask_restx.utils import unpack
+
+# Descripción del parámetro `fields` para la documentación de los endpoints
+FIELDS_DOC = 'Campos a devolver, separados por comas (por defecto, todos)'
+
+
+def get_fields(model):
+    """Lee de la URL los campos pedidos con `?fields=id,title,...`.
+
+    Args:
+        model (Model): Modelo de respuesta del endpoint; define los campos válidos.
+
+    Returns:
+        tuple: Campos pedidos en el orden del modelo, o None si no se envía `fields`.
+
+    Raises:
+        ValueError: Si la lista está vacía o algún campo no pertenece al modelo.
+    """
+    value = request.args.get('fields')
+    if value is None:
+        return None
+    names = {name.strip() for name in value.split(',')}
+    names.discard('')
+    if not names:
+        raise ValueError('Invalid fields')
+    unknown = sorted(names.difference(model))
+    if unknown:
+        raise ValueError(f'Unknown fields: {", ".join(unknown)}')
+    return tuple(name for name in model if name in names)
+
+
+def restrict(model, names):
+    """Reducir un modelo de respuesta a los campos pedidos.
+
+    Args:
+        model (Model): Modelo de respuesta completo.
+        names (tuple): Campos pedidos (de `get_fields`), o None para todos.
+
+    Returns:
+        dict: Campos del modelo que se serializan, en el orden del modelo.
+    """
+    if names is None:
+        return model
+    return {name: model[name] for name in names}
+
+
+def pick(data, names):
+    """Quedarse con los campos pedidos de un diccionario ya serializado.
+
+    Args:
+        data (dict): Elemento serializado con todos los campos del modelo.
+        names (tuple): Campos pedidos (de `get_fields`), o None para todos.
+
+    Returns:
+        dict: El elemento con solo los campos pedidos, en el mismo orden.
+    """
+    if names is None:
+        return data
+    return {name: value for name, value in data.items() if name in names}
+
+
+def marshal_fields_with(namespace, model, as_list=False):
+    """Decorador equivalente a `namespace.marshal_with(model)` que respeta `?fields=`.
+
+    Sin `fields` se comporta exactamente como `marshal_with`; con `fields` serializa
+    solo los campos pedidos y responde 400 si alguno no pertenece al modelo. El endpoint
+    lee los campos con `get_fields` para cargar únicamente lo que se va a serializar.
+    También documenta el parámetro `fields` del endpoint.
+
+    Args:
+        namespace (Namespace): Namespace del endpoint.
+        model (Model): Modelo de respuesta.
+        as_list (bool, opcional): Si la respuesta es una lista de elementos.
+
+    Returns:
+        Función decoradora.
+    """
+
+    def decorator(func):
+        marshalled = namespace.marshal_with(model, as_list=as_list)(func)
+
+        @wraps(marshalled)  # Conserva la documentación del modelo de respuesta
+        def wrapper(*args, **kwargs):
+            try:
+                names = get_fields(model)
+            except ValueError as e:
+                namespace.abort(400, str(e))
+            if names is None:
+                return marshalled(*args, **kwargs)
+            data, code, headers = unpack(func(*args, **kwargs))
+            return marshal(data, restrict(model, names)), code, headers
+
+        return namespace.doc(params={'fields': FIELDS_DOC})(wrapper)
+    return decorator
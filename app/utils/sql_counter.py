@@ -0,0 +1,75 @@
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from app import db
+
+
+class QueryCounter:
+    """Acumula las sentencias SQL ejecutadas por el engine mientras está activo.
+
+    Atributos:
+        statements (list): Sentencias SQL ejecutadas, en orden.
+    """
+
+    def __init__(self):
+        self.statements = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        # Listener de `before_cursor_execute`: registra cada sentencia enviada a la base de datos
+        self.statements.append(statement)
+
+    @property
+    def count(self):
+        """int: Número de sentencias ejecutadas."""
+        return len(self.statements)
+
+
+@contextmanager
+def count_queries(engine=None):
+    """Cuenta las sentencias SQL ejecutadas dentro del bloque.
+
+    Debe usarse dentro de un contexto de aplicación.
+
+    Args:
+        engine (Engine, opcional): Engine a observar, por defecto `db.engine`.
+
+    Yields:
+        QueryCounter: Contador con las sentencias ejecutadas.
+    """
+    engine = engine or db.engine
+    counter = QueryCounter()
+    event.listen(engine, 'before_cursor_execute', counter)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, 'before_cursor_execute', counter)
+
+
+@contextmanager
+def assert_max_queries(max_statements, engine=None):
+    """Falla si el bloque ejecuta más sentencias SQL de las permitidas.
+
+    Pensado para las pruebas de los endpoints, de modo que una regresión N+1 se detecte
+    en cuanto aparezca. Ejemplo::
+
+        with app.app_context(), assert_max_queries(3):
+            client.get('/tasks/', headers=headers)
+
+    Args:
+        max_statements (int): Número máximo de sentencias permitidas.
+        engine (Engine, opcional): Engine a observar, por defecto `db.engine`.
+
+    Yields:
+        QueryCounter: Contador con las sentencias ejecutadas.
+
+    Raises:
+        AssertionError: Si se ejecutaron más sentencias de las permitidas.
+    """
+    with count_queries(engine) as counter:
+        yield counter
+    if counter.count > max_statements:
+        listing = '\n'.join(counter.statements)
+        raise AssertionError(
+            f'Expected at most {max_statements} SQL statements, got {counter.count}:\n{listing}'
+        )
@@ -0,0 +1,98 @@
+import json
+import logging
+import time
+
+from flask import g, request
+from sqlalchemy import event
+
+from app import db
+
+logger = logging.getLogger(__name__)
+
+
+class RequestProfile:
+    """Sentencias SQL y tiempo de base de datos acumulados durante una solicitud.
+
+    Atributos:
+        started_at (float): Momento de inicio de la solicitud (`time.perf_counter`).
+        statements (int): Número de sentencias ejecutadas.
+        db_time (float): Segundos totales dentro de la base de datos.
+    """
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.statements = 0
+        self.db_time = 0.0
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # El inicio se guarda en el contexto de ejecución de la sentencia: si la sentencia falla no
+    # llega `after_cursor_execute`, pero el valor desaparece con el contexto y no afecta a las siguientes
+    context._profiler_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = g.get('_sql_profile') if g else None
+    if profile is not None:
+        profile.statements += 1
+        profile.db_time += time.perf_counter() - context._profiler_start
+
+
+def _start_profile():
+    g._sql_profile = RequestProfile()
+
+
+def _finish_profile(app):
+    def finish(response):
+        profile = g.pop('_sql_profile', None)
+        if profile is None:
+            return response
+
+        total_ms = (time.perf_counter() - profile.started_at) * 1000
+        db_ms = profile.db_time * 1000
+        response.headers.add(
+            'Server-Timing',
+            f'db;dur={db_ms:.2f};desc="{profile.statements} queries", app;dur={total_ms:.2f}'
+        )
+
+        # Marcar las solicitudes que superan el presupuesto de sentencias o de tiempo en base de datos
+        over_budget = (
+            profile.statements > app.config['SQL_PROFILER_MAX_STATEMENTS']
+            or db_ms > app.config['SQL_PROFILER_MAX_DB_MS']
+        )
+        record = {
+            'event': 'sql_profile',
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'statements': profile.statements,
+            'db_ms': round(db_ms, 2),
+            'total_ms': round(total_ms, 2),
+            'over_budget': over_budget
+        }
+        logger.log(logging.WARNING if over_budget else logging.INFO, json.dumps(record))
+        return response
+    return finish
+
+
+def init_sql_profiler(app):
+    """Activar el perfilador SQL por solicitud si `SQL_PROFILER_ENABLED` está activo.
+
+    Cuenta las sentencias y el tiempo en base de datos de cada solicitud mediante los
+    eventos del engine, los devuelve en la cabecera `Server-Timing` y escribe una línea
+    de log en JSON, con nivel WARNING si se superan `SQL_PROFILER_MAX_STATEMENTS` o
+    `SQL_PROFILER_MAX_DB_MS`.
+
+    Args:
+        app (Flask): Aplicación ya inicializada con `db`.
+    """
+    if not app.config['SQL_PROFILER_ENABLED']:
+        return
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+
+    app.before_request(_start_profile)
+    app.after_request(_finish_profile(app))
@@ -0,0 +1,38 @@
+from sqlalchemy import event
+
+from app import db
+
+
+def apply_sqlite_pragmas(engine, pragmas):
+    """Ejecutar los PRAGMA indicados en cada conexión nueva de un engine SQLite.
+
+    Los PRAGMA de SQLite se aplican por conexión, por lo que se registran en el evento
+    `connect` del engine. Con otros dialectos, o sin PRAGMA configurados, no hace nada.
+
+    Args:
+        engine (Engine): Engine síncrono (o `sync_engine` de un engine asíncrono).
+        pragmas (dict): Nombre y valor de cada PRAGMA, en el orden en que se ejecutan.
+    """
+    if engine.dialect.name != 'sqlite' or not pragmas:
+        return
+
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name}={value}')
+        cursor.close()
+
+    event.listen(engine, 'connect', set_pragmas)
+
+
+def init_sqlite_pragmas(app):
+    """Aplicar `SQLITE_PRAGMAS` a las conexiones de la aplicación si la base de datos es SQLite.
+
+    Debe llamarse justo después de inicializar `db`, antes de abrir ninguna conexión.
+
+    Args:
+        app (Flask): Aplicación ya inicializada con `db`.
+    """
+    with app.app_context():
+        engine = db.engine
+    apply_sqlite_pragmas(engine, app.config.get('SQLITE_PRAGMAS'))
@@ -0,0 +1,56 @@
+from contextlib import contextmanager
+
+from app import db
+
+# Clave de `db.session.info` que marca que la sesión está ejecutando un lote
+_BATCH_KEY = 'batch'
+
+
+def in_batch():
+    """Indica si la sesión actual está dentro de `batch()`.
+
+    Returns:
+        bool: True si las escrituras de los servicios se confirman al final del lote.
+    """
+    return db.session.info.get(_BATCH_KEY, False)
+
+
+def commit():
+    """Confirmar las escrituras de una operación de servicio.
+
+    Fuera de un lote hace `commit`; dentro de `batch()` solo `flush`, de modo que las
+    sentencias se envían (y los errores de integridad aparecen en la operación que los
+    causa) pero la transacción se confirma una sola vez al final del lote.
+    """
+    if in_batch():
+        db.session.flush()
+    else:
+        db.session.commit()
+
+
+def rollback():
+    """Deshacer la transacción tras un error de una operación de servicio.
+
+    Dentro de `batch()` no hace nada: el error llega hasta el lote, que deshace todas
+    sus operaciones.
+    """
+    if not in_batch():
+        db.session.rollback()
+
+
+@contextmanager
+def batch():
+    """Ejecutar varias operaciones de servicios en una sola transacción.
+
+    Las operaciones del bloque se confirman con un único commit al salir; si alguna
+    lanza una excepción se deshacen todas y la excepción se propaga.
+    """
+    db.session.info[_BATCH_KEY] = True
+    try:
+        yield
+        db.session.info.pop(_BATCH_KEY)
+        db.session.commit()
+    except BaseException:
+        db.session.info.pop(_BATCH_KEY, None)
+        db.session.rollback()
+        raise
@@ -0,0 +1,78 @@
+import threading
+import time
+from collections import OrderedDict
+
+# Valor centinela para distinguir "no está en la caché" de un valor None guardado
+_MISSING = object()
+
+
+class TTLCache:
+    """Caché en memoria acotada por tamaño (LRU) y con caducidad por tiempo (TTL).
+
+    Es segura entre hilos. Cuando se alcanza `maxsize` se descarta la entrada usada
+    hace más tiempo; las entradas caducadas se descartan al leerlas.
+
+    Atributos:
+        maxsize (int): Número máximo de entradas.
+        ttl (float): Segundos que vive cada entrada.
+    """
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Obtener una entrada si existe y no ha caducado.
+
+        Args:
+            key: Clave de la entrada.
+            default: Valor devuelto si la entrada no existe o caducó.
+
+        Returns:
+            El valor guardado o `default`.
+        """
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING:
+                return default
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        """Guardar una entrada.
+
+        Args:
+            key: Clave de la entrada.
+            value: Valor a guardar.
+            ttl (float, opcional): Segundos de vida de esta entrada; por defecto `self.ttl`.
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key):
+        """Eliminar una entrada si existe.
+
+        Args:
+            key: Clave de la entrada.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        """Eliminar todas las entradas."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
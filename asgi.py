@@ -0,0 +1,7 @@
+from app import create_app
+from app.asgi import create_asgi_app
+
+# Punto de entrada ASGI: las lecturas de tareas, categorías y prioridades usan el engine
+# asíncrono y el resto de rutas se atienden con la aplicación Flask síncrona.
+# Ejecutar con: uvicorn asgi:app
+app = create_asgi_app(create_app())
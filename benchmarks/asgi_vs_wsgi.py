@@ -0,0 +1,218 @@
+"""Comparación de concurrencia entre las lecturas síncronas (hilos) y asíncronas (asyncio).
+
+Levanta el mismo servidor ASGI (uvicorn, un proceso) en dos modos y lanza GET /tasks/
+con varios niveles de concurrencia:
+
+- wsgi: todas las rutas se atienden con la aplicación Flask en un pool de N hilos.
+- asgi: las lecturas usan el engine asíncrono (aiosqlite) y el pool de hilos solo atiende el resto.
+
+La base de datos es un archivo SQLite sembrado con tareas. Como SQLite es local, la latencia
+de red de MySQL se simula con `--db-latency-ms`: cada sentencia duerme ese tiempo en el
+hilo del driver (el de la solicitud en modo wsgi y el de aiosqlite en modo asgi), igual
+que esperaría la respuesta del servidor de base de datos.
+
+Para cada modo se informa el rendimiento, la latencia p50/p99 y la memoria máxima (RSS)
+del proceso servidor, de modo que se pueden comparar a igual memoria.
+
+Uso:
+    python benchmarks/asgi_vs_wsgi.py --tasks 10000 --concurrency 8,32,128 --db-latency-ms 5
+"""
+import argparse
+import http.client
+import os
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class SlowCursor(sqlite3.Cursor):
+    """Cursor de sqlite3 que simula la latencia de red antes de cada sentencia."""
+
+    latency = float(os.environ.get('BENCH_DB_LATENCY_MS', 0)) / 1000
+
+    def execute(self, *args, **kwargs):
+        if self.latency:
+            time.sleep(self.latency)
+        return super().execute(*args, **kwargs)
+
+
+class SlowConnection(sqlite3.Connection):
+    """Conexión de sqlite3 cuyos cursores simulan la latencia de red."""
+
+    def cursor(self, factory=SlowCursor):
+        return super().cursor(factory)
+
+
+def make_config(database, threads, pool_size):
+    from app.config import Config
+
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{database}'
+        ASYNC_SQLALCHEMY_DATABASE_URI = None
+        SQLALCHEMY_ECHO = False
+        SQLALCHEMY_ENGINE_OPTIONS = dict(
+            Config.SQLALCHEMY_ENGINE_OPTIONS,
+            pool_size=pool_size,
+            max_overflow=0,
+            connect_args={'factory': SlowConnection, 'check_same_thread': False}
+        )
+        ASGI_WSGI_THREADS = threads
+
+    return BenchConfig
+
+
+def seed(database, tasks):
+    """Crear la base de datos de prueba con `tasks` tareas y 10 categorías."""
+    from app import create_app, db
+    from app.models.category import Category
+    from app.models.priority import Priority
+    from app.models.task import Task, task_category
+
+    if os.path.exists(database):
+        os.remove(database)
+    app = create_app(make_config(database, 1, 1))
+    with app.app_context():
+        db.create_all()
+        db.session.add_all([Priority('Alta'), Priority('Media'), Priority('Baja')])
+        db.session.add_all([Category(f'Categoría {i}') for i in range(10)])
+        db.session.flush()
+        db.session.execute(Task.__table__.insert(), [
+            {'title': f'Tarea {i}', 'description': 'Descripción de prueba', 'completed': i % 3 == 0, 'priority_id': 1 + i % 3}
+            for i in range(tasks)
+        ])
+        db.session.execute(task_category.insert(), [
+            {'task_id': i + 1, 'category_id': 1 + i % 10} for i in range(tasks)
+        ])
+        db.session.commit()
+
+
+def serve(args):
+    """Ejecutar el servidor en el modo indicado (se llama en un subproceso)."""
+    import uvicorn
+    from app import create_app
+    from app.asgi import create_asgi_app
+
+    asgi_app = create_asgi_app(create_app(make_config(args.database, args.threads, args.pool_size)))
+    if args.serve == 'wsgi':
+        # Sin rutas asíncronas: todo pasa por el pool de hilos de la aplicación Flask
+        asgi_app.routes = []
+    uvicorn.run(asgi_app, host='127.0.0.1', port=args.port, log_level='warning', lifespan='on')
+
+
+def token(database):
+    from flask_jwt_extended import create_access_token
+    from app import create_app
+
+    app = create_app(make_config(database, 1, 1))
+    with app.app_context():
+        return create_access_token(identity='bench', additional_claims={'uid': 1, 'priority': None})
+
+
+def load(port, path, headers, concurrency, total):
+    """Lanzar `total` solicitudes con `concurrency` clientes con conexiones persistentes."""
+    latencies = []
+    errors = []
+    remaining = [total]
+    lock = threading.Lock()
+
+    def client():
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+        while True:
+            with lock:
+                if remaining[0] <= 0:
+                    break
+                remaining[0] -= 1
+            start = time.perf_counter()
+            connection.request('GET', path, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+                if response.status != 200:
+                    errors.append(response.status)
+        connection.close()
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    duration = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'rps': total / duration,
+        'p50_ms': latencies[len(latencies) // 2] * 1000,
+        'p99_ms': latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        'errors': len(errors)
+    }
+
+
+def peak_rss_mb(pid):
+    with open(f'/proc/{pid}/status') as status:
+        for line in status:
+            if line.startswith('VmHWM:'):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def wait_for_port(port, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            http.client.HTTPConnection('127.0.0.1', port, timeout=1).request('GET', '/swagger.json')
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError('Server did not start')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--database', default='/tmp/bench_asgi.db')
+    parser.add_argument('--tasks', type=int, default=10000)
+    parser.add_argument('--concurrency', default='8,32,128')
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--threads', type=int, default=16, help='Hilos del pool WSGI en ambos modos')
+    parser.add_argument('--pool-size', type=int, default=16, help='Conexiones del pool de base de datos en ambos modos')
+    parser.add_argument('--db-latency-ms', type=float, default=5.0)
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--serve', choices=['wsgi', 'asgi'], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        return serve(args)
+
+    seed(args.database, args.tasks)
+    headers = {'Authorization': f'Bearer {token(args.database)}'}
+    path = '/tasks/?limit=20'
+    env = dict(os.environ, BENCH_DB_LATENCY_MS=str(args.db_latency_ms))
+
+    print(f'{args.tasks} tareas, {args.requests} solicitudes por nivel, latencia simulada {args.db_latency_ms} ms')
+    print(f'{"modo":<6}{"concurrencia":>14}{"req/s":>10}{"p50 ms":>10}{"p99 ms":>10}{"errores":>9}{"RSS MB":>9}')
+    for mode in ('wsgi', 'asgi'):
+        server = subprocess.Popen(
+            [sys.executable, __file__, '--serve', mode, '--database', args.database, '--port', str(args.port),
+             '--threads', str(args.threads), '--pool-size', str(args.pool_size)],
+            env=env
+        )
+        try:
+            wait_for_port(args.port)
+            load(args.port, path, headers, 4, 100)  # Calentamiento
+            for concurrency in (int(value) for value in args.concurrency.split(',')):
+                result = load(args.port, path, headers, concurrency, args.requests)
+                print(f'{mode:<6}{concurrency:>14}{result["rps"]:>10.0f}{result["p50_ms"]:>10.1f}'
+                      f'{result["p99_ms"]:>10.1f}{result["errors"]:>9}{peak_rss_mb(server.pid):>9.1f}')
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,381 @@
+"""Pruebas de carga reproducibles de la API contra una base de datos SQLite local.
+
+Para cada tamaño de la tabla de tareas (por defecto 10k, 100k y 1M) se siembra un archivo
+SQLite, se levanta la aplicación con el servidor de producción (`app.server`, gunicorn)
+en un subproceso y se lanzan con varios clientes concurrentes los escenarios:
+
+- auth_login: POST /auth/login (bcrypt con `--bcrypt-rounds`).
+- tasks_list: GET /tasks/?limit=50 desde una página aleatoria de la tabla.
+- tasks_create: POST /tasks/ con dos categorías.
+- categories_create / _get / _update / _delete: CRUD de categorías.
+- priorities_create / _get / _update / _delete: CRUD de prioridades.
+
+De cada escenario se informa el rendimiento (req/s), la latencia p50/p95/p99, los
+errores y las sentencias SQL y el tiempo en base de datos por solicitud, que se leen de
+la cabecera `Server-Timing` del perfilador SQL (`SQL_PROFILER_ENABLED`).
+
+Los resultados se escriben en un archivo JSON; con `--baseline` se comparan con los de
+una ejecución anterior. Las bases de datos sembradas se reutilizan entre ejecuciones
+(`--reseed` las regenera) y la semilla aleatoria es fija, de modo que dos ejecuciones
+envían las mismas solicitudes.
+
+Uso:
+    python benchmarks/load.py --rows 10000,100000,1000000 --concurrency 16 --output load.json
+    python benchmarks/load.py --rows 10000 --baseline load.json --output load_new.json
+"""
+import argparse
+import datetime
+import http.client
+import json
+import os
+import platform
+import random
+import re
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+USERNAME = 'bench'
+PASSWORD = 'bench-password'
+CATEGORIES = 20
+SEED_BATCH = 50000
+
+SERVER_TIMING = re.compile(r'db;dur=(?P<db_ms>[\d.]+);desc="(?P<statements>\d+) queries"')
+
+
+def make_config(database, args):
+    from app.config import Config, DevelopmentConfig
+    from app.server import ServerConfig
+
+    class LoadConfig(ServerConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{database}'
+        SQLALCHEMY_ECHO = False
+        # Las escrituras concurrentes esperan al bloqueo de SQLite en lugar de fallar
+        SQLALCHEMY_ENGINE_OPTIONS = dict(Config.SQLALCHEMY_ENGINE_OPTIONS, connect_args={'timeout': 30})
+        # Mismos PRAGMA (WAL) que el perfil SQLite de desarrollo
+        SQLITE_PRAGMAS = DevelopmentConfig.SQLITE_PRAGMAS
+        SQL_PROFILER_ENABLED = True
+        SQL_PROFILER_MAX_STATEMENTS = 1000
+        SQL_PROFILER_MAX_DB_MS = 10000
+        API_DOCS_ENABLED = False
+        BCRYPT_LOG_ROUNDS = args.bcrypt_rounds
+        # auth_login mide el coste de bcrypt, no la limitación de intentos
+        LOGIN_RATE_LIMIT_ENABLED = False
+        SERVER_BIND = f'127.0.0.1:{args.port}'
+        SERVER_WORKERS = args.workers
+        SERVER_THREADS = args.threads
+
+    return LoadConfig
+
+
+def remove_database(database):
+    """Borrar un archivo SQLite junto con su WAL y su memoria compartida, si existen."""
+    for path in (database, f'{database}-wal', f'{database}-shm'):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def copy_database(source, target):
+    """Copiar una base SQLite con la API de copia de SQLite, que incluye lo que siga en el WAL."""
+    remove_database(target)
+    source_connection, target_connection = sqlite3.connect(source), sqlite3.connect(target)
+    try:
+        source_connection.backup(target_connection)
+    finally:
+        source_connection.close()
+        target_connection.close()
+
+
+def seed(database, rows, args):
+    """Crear la base de datos con `rows` tareas, sus categorías y el usuario de las pruebas."""
+    from app import create_app, db
+    from app.models.category import Category
+    from app.models.priority import Priority
+    from app.models.task import Task, task_category
+    from app.models.user import User
+    from app.services.task_counter_service import TaskCounterService
+    from app.utils.password_hasher import hash_password
+    from sqlalchemy import text
+
+    remove_database(database)
+    app = create_app(make_config(database, args))
+    rng = random.Random(rows)
+    with app.app_context():
+        db.create_all()
+        db.session.add_all([Priority('Alta'), Priority('Media'), Priority('Baja')])
+        db.session.add_all([Category(f'Categoría {i}') for i in range(CATEGORIES)])
+        db.session.add(User(USERNAME, hash_password(PASSWORD)))
+        db.session.flush()
+        for start in range(0, rows, SEED_BATCH):
+            ids = range(start + 1, min(start + SEED_BATCH, rows) + 1)
+            db.session.execute(Task.__table__.insert(), [
+                {'title': f'Tarea {i}', 'description': f'Descripción de la tarea {i}', 'completed': i % 3 == 0,
+                 'priority_id': 1 + i % 3}
+                for i in ids
+            ])
+            db.session.execute(task_category.insert(), [
+                {'task_id': i, 'category_id': category_id}
+                for i in ids for category_id in rng.sample(range(1, CATEGORIES + 1), 2)
+            ])
+        db.session.commit()
+        TaskCounterService.reconcile()
+        # Con WAL los datos confirmados pueden seguir en `-wal`: se pasan al archivo principal
+        # y se cierran las conexiones, para que el archivo sembrado quede completo
+        db.session.execute(text('PRAGMA wal_checkpoint(TRUNCATE)'))
+        db.session.remove()
+        db.engine.dispose()
+
+
+def serve(args):
+    """Ejecutar la aplicación con el servidor de producción (se llama en un subproceso)."""
+    from app import create_app
+    from app.server import ProductionServer, build_options
+
+    application = create_app(make_config(args.database, args))
+    options = dict(build_options(application.config), accesslog=None, loglevel='warning')
+    ProductionServer(application, options).run()
+
+
+def request(connection, method, path, body=None, headers=None):
+    """Enviar una solicitud y devolver el estado, el cuerpo y la cabecera Server-Timing."""
+    headers = dict(headers or {})
+    payload = None
+    if body is not None:
+        payload = json.dumps(body)
+        headers['Content-Type'] = 'application/json'
+    connection.request(method, path, body=payload, headers=headers)
+    response = connection.getresponse()
+    data = response.read()
+    return response.status, data, response.getheader('Server-Timing') or ''
+
+
+def percentile(values, fraction):
+    # Percentil por rango más cercano sobre una lista ordenada
+    return values[max(0, min(len(values) - 1, int(round(fraction * len(values))) - 1))]
+
+
+def load(port, requests, concurrency):
+    """Lanzar `requests` (lista de (método, ruta, cuerpo, cabeceras)) con `concurrency` clientes.
+
+    Returns:
+        dict: Métricas del escenario y cuerpo de cada respuesta correcta, por posición.
+    """
+    latencies = []
+    statements = []
+    db_ms = []
+    errors = {}
+    bodies = [None] * len(requests)
+    position = [0]
+    lock = threading.Lock()
+
+    def client():
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=120)
+        while True:
+            with lock:
+                if position[0] >= len(requests):
+                    break
+                index = position[0]
+                position[0] += 1
+            method, path, body, headers = requests[index]
+            start = time.perf_counter()
+            try:
+                status, data, timing = request(connection, method, path, body, headers)
+            except (http.client.RemoteDisconnected, ConnectionError):
+                # El servidor cerró la conexión keep-alive (inactividad o reciclado del worker)
+                connection.close()
+                connection = http.client.HTTPConnection('127.0.0.1', port, timeout=120)
+                status, data, timing = request(connection, method, path, body, headers)
+            elapsed = time.perf_counter() - start
+            match = SERVER_TIMING.search(timing)
+            with lock:
+                latencies.append(elapsed)
+                if match:
+                    statements.append(int(match.group('statements')))
+                    db_ms.append(float(match.group('db_ms')))
+                if status >= 400:
+                    errors[status] = errors.get(status, 0) + 1
+                else:
+                    bodies[index] = data
+        connection.close()
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    duration = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'requests': len(requests),
+        'concurrency': concurrency,
+        'rps': round(len(requests) / duration, 1),
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 2),
+        'p95_ms': round(percentile(latencies, 0.95) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 2),
+        'statements_per_request': round(sum(statements) / len(statements), 2) if statements else None,
+        'db_ms_per_request': round(sum(db_ms) / len(db_ms), 2) if db_ms else None,
+        'errors': errors
+    }, bodies
+
+
+def run_scenarios(args, rows):
+    """Ejecutar todos los escenarios contra el servidor ya levantado.
+
+    Returns:
+        list: Resultado de cada escenario.
+    """
+    from app.utils.pagination import encode_cursor
+
+    rng = random.Random(rows)
+    count = args.requests
+    results = []
+
+    def scenario(name, requests, concurrency=args.concurrency):
+        result, bodies = load(args.port, requests, concurrency)
+        results.append(dict(result, name=name))
+        print(f'{rows:>9}  {name:<20}{result["rps"]:>9.1f}{result["p50_ms"]:>9.1f}{result["p95_ms"]:>9.1f}'
+              f'{result["p99_ms"]:>9.1f}{result["statements_per_request"] or 0:>8.1f}{sum(result["errors"].values()):>8}')
+        return bodies
+
+    login = ('POST', '/auth/login', {'username': USERNAME, 'password': PASSWORD}, None)
+    bodies = scenario('auth_login', [login] * count)
+    token = next(json.loads(body)['access_token'] for body in bodies if body)
+    auth = {'Authorization': f'Bearer {token}'}
+
+    scenario('tasks_list', [
+        ('GET', f'/tasks/?limit=50&after={encode_cursor(rng.randrange(rows))}', None, auth) for _ in range(count)
+    ])
+    scenario('tasks_create', [
+        ('POST', '/tasks/', {'title': f'Tarea de carga {i}', 'description': 'Creada por benchmarks/load.py',
+                             'category_ids': rng.sample(range(1, CATEGORIES + 1), 2), 'priority_id': 1 + i % 3}, auth)
+        for i in range(count)
+    ])
+
+    for resource, prefix in (('categories', 'Categoría'), ('priorities', 'Prioridad')):
+        bodies = scenario(f'{resource}_create', [
+            ('POST', f'/{resource}/', {'name': f'{prefix} de carga {rows}-{i}'}, auth) for i in range(count)
+        ])
+        ids = [json.loads(body)['id'] for body in bodies if body]
+        scenario(f'{resource}_get', [('GET', f'/{resource}/{item_id}', None, auth) for item_id in ids])
+        scenario(f'{resource}_update', [
+            ('PUT', f'/{resource}/{item_id}', {'name': f'{prefix} actualizada {rows}-{item_id}'}, auth) for item_id in ids
+        ])
+        scenario(f'{resource}_delete', [('DELETE', f'/{resource}/{item_id}', None, auth) for item_id in ids])
+    return results
+
+
+def wait_for_port(port, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=1)
+            connection.request('GET', '/priorities/')
+            connection.getresponse().read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError('Server did not start')
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, cwd=ROOT).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def compare(results, baseline_path):
+    """Mostrar la variación de req/s y p95 respecto a una ejecución anterior."""
+    with open(baseline_path) as baseline_file:
+        baseline = json.load(baseline_file)
+    previous = {
+        (run['rows'], scenario['name']): scenario for run in baseline['runs'] for scenario in run['scenarios']
+    }
+    print(f'\nComparación con {baseline_path} ({baseline.get("git_commit") or "?"})')
+    print(f'{"filas":>9}  {"escenario":<20}{"req/s":>10}{"Δ req/s":>10}{"p95 ms":>10}{"Δ p95":>10}')
+    for run in results['runs']:
+        for scenario in run['scenarios']:
+            old = previous.get((run['rows'], scenario['name']))
+            if not old:
+                continue
+            rps_delta = (scenario['rps'] / old['rps'] - 1) * 100 if old['rps'] else 0
+            p95_delta = (scenario['p95_ms'] / old['p95_ms'] - 1) * 100 if old['p95_ms'] else 0
+            print(f'{run["rows"]:>9}  {scenario["name"]:<20}{scenario["rps"]:>10.1f}{rps_delta:>+9.1f}%'
+                  f'{scenario["p95_ms"]:>10.1f}{p95_delta:>+9.1f}%')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', default='10000,100000,1000000')
+    parser.add_argument('--requests', type=int, default=500, help='Solicitudes por escenario')
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--workers', type=int, default=1, help='Workers de gunicorn')
+    parser.add_argument('--threads', type=int, default=8, help='Hilos por worker')
+    parser.add_argument('--bcrypt-rounds', type=int, default=10)
+    parser.add_argument('--database-dir', default='/tmp')
+    parser.add_argument('--reseed', action='store_true', help='Regenerar las bases de datos aunque existan')
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--output', default='load_results.json')
+    parser.add_argument('--baseline', help='Archivo de resultados anterior con el que comparar')
+    parser.add_argument('--serve', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--database', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        return serve(args)
+
+    results = {
+        'created_at': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'git_commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'settings': {
+            'requests': args.requests, 'concurrency': args.concurrency, 'workers': args.workers,
+            'threads': args.threads, 'bcrypt_rounds': args.bcrypt_rounds
+        },
+        'runs': []
+    }
+
+    print(f'{"filas":>9}  {"escenario":<20}{"req/s":>9}{"p50 ms":>9}{"p95 ms":>9}{"p99 ms":>9}{"SQL":>8}{"errores":>8}')
+    for rows in (int(value) for value in args.rows.split(',')):
+        # Cada tamaño parte de una copia limpia de la base sembrada, que se conserva entre ejecuciones
+        seeded = os.path.join(args.database_dir, f'bench_load_{rows}.seed.db')
+        database = os.path.join(args.database_dir, f'bench_load_{rows}.db')
+        seed_seconds = None
+        if args.reseed or not os.path.exists(seeded):
+            started = time.perf_counter()
+            seed(seeded, rows, args)
+            seed_seconds = round(time.perf_counter() - started, 1)
+        copy_database(seeded, database)
+
+        server = subprocess.Popen(
+            [sys.executable, __file__, '--serve', '--database', database, '--port', str(args.port),
+             '--workers', str(args.workers), '--threads', str(args.threads), '--bcrypt-rounds', str(args.bcrypt_rounds)],
+            cwd=ROOT
+        )
+        try:
+            wait_for_port(args.port)
+            scenarios = run_scenarios(args, rows)
+        finally:
+            server.terminate()
+            server.wait()
+        results['runs'].append({'rows': rows, 'seed_seconds': seed_seconds, 'scenarios': scenarios})
+
+    with open(args.output, 'w') as output:
+        json.dump(results, output, indent=2)
+    print(f'\nResultados en {args.output}')
+
+    if args.baseline:
+        compare(results, args.baseline)
+
+
+if __name__ == '__main__':
+    main()
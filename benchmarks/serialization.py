@@ -0,0 +1,133 @@
+"""Comparación de la serialización de GET /tasks/ con `marshal_list_with` y con la ruta rápida.
+
+Para cada tamaño de página se mide (mediana de varias repeticiones), sobre un archivo
+SQLite sembrado con tareas de dos categorías cada una:
+
+- marshal: consulta del ORM con `selectinload`, `marshal` con `task_response_model` y
+  `output_json` de flask-restx (lo que hace hoy el endpoint).
+- rápida json: `TaskService.get_all_task_dicts` (tuplas) y `fast_json.dumps` con la
+  configuración JSON por defecto (módulo `json`).
+- rápida orjson: lo mismo con `RESTX_JSON` compacto, que se codifica con orjson.
+
+Cada columna incluye la lectura de la base de datos; la columna `solo codificar` mide
+únicamente `marshal` + `json.dumps` frente a `dumps` de los diccionarios ya construidos.
+Antes de medir se comprueba que ambas rutas producen exactamente los mismos bytes.
+
+Uso:
+    python benchmarks/serialization.py --rows 1000,10000,100000 --repeat 5
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask_restx import marshal
+from flask_restx.representations import output_json
+
+
+def make_config(database, max_rows):
+    from app.config import Config
+
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{database}'
+        SQLALCHEMY_ECHO = False
+        LOOKUP_CACHE_PRELOAD = False
+        PAGINATION_MAX_LIMIT = max_rows
+        RESTX_JSON = {}
+
+    return BenchConfig
+
+
+def seed(app, rows):
+    """Crear `rows` tareas, cada una con dos de 10 categorías."""
+    from app import db
+    from app.models.category import Category
+    from app.models.priority import Priority
+    from app.models.task import Task, task_category
+
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        db.session.add_all([Priority('Alta'), Priority('Media'), Priority('Baja')])
+        db.session.add_all([Category(f'Categoría {i}') for i in range(10)])
+        db.session.flush()
+        db.session.execute(Task.__table__.insert(), [
+            {'title': f'Tarea {i}', 'description': 'Descripción de prueba', 'completed': i % 3 == 0, 'priority_id': 1 + i % 3}
+            for i in range(rows)
+        ])
+        db.session.execute(task_category.insert(), [
+            {'task_id': i + 1, 'category_id': 1 + (i + offset) % 10} for i in range(rows) for offset in (0, 5)
+        ])
+        db.session.commit()
+
+
+def timed(func, repeat):
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        durations.append(time.perf_counter() - start)
+        # Cada repetición empieza con la sesión vacía, como una solicitud nueva
+        from app import db
+        db.session.remove()
+    return statistics.median(durations) * 1000, result
+
+
+def bench(app, rows, repeat):
+    from app.controllers.task_controller import task_response_model
+    from app.services.task_service import TaskService
+    from app.utils.fast_json import ORJSON_SETTINGS, dumps
+
+    results = {}
+    with app.test_request_context():
+        def marshalled():
+            page = TaskService.get_all_tasks(limit=rows)
+            return output_json(marshal(page.items, task_response_model), 200).get_data()
+
+        def fast():
+            return dumps(TaskService.get_all_task_dicts(limit=rows).items)
+
+        results['marshal'], expected = timed(marshalled, repeat)
+        results['rápida json'], body = timed(fast, repeat)
+        assert body == expected, 'La ruta rápida no produce los mismos bytes'
+
+        tasks = TaskService.get_all_tasks(limit=rows).items
+        items = TaskService.get_all_task_dicts(limit=rows).items
+        results['solo codificar marshal'] = timed(lambda: output_json(marshal(tasks, task_response_model), 200), repeat)[0]
+        results['solo codificar rápida'] = timed(lambda: dumps(items), repeat)[0]
+
+        app.config['RESTX_JSON'] = dict(ORJSON_SETTINGS)
+        try:
+            results['rápida orjson'], compact = timed(fast, repeat)
+            assert compact == output_json(marshal(tasks, task_response_model), 200).get_data()
+        finally:
+            app.config['RESTX_JSON'] = {}
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--database', default='/tmp/bench_serialization.db')
+    parser.add_argument('--rows', default='1000,10000,100000')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    from app import create_app
+
+    sizes = [int(value) for value in args.rows.split(',')]
+    app = create_app(make_config(args.database, max(sizes)))
+
+    print(f'Mediana de {args.repeat} repeticiones (ms), lectura de la base de datos incluida')
+    print(f'{"filas":>8}{"marshal":>10}{"rápida json":>14}{"rápida orjson":>15}{"codificar marshal":>19}{"codificar rápida":>18}')
+    for rows in sizes:
+        seed(app, rows)
+        result = bench(app, rows, args.repeat)
+        print(f'{rows:>8}{result["marshal"]:>10.1f}{result["rápida json"]:>14.1f}{result["rápida orjson"]:>15.1f}'
+              f'{result["solo codificar marshal"]:>19.1f}{result["solo codificar rápida"]:>18.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""Tiempos de importación y de arranque de la aplicación, y coste de la especificación OpenAPI.
+
+Cada medición se hace en un intérprete nuevo (sin módulos ya importados) y se repite
+varias veces; se informa la mediana:
+
+- import app: importar el paquete y sus dependencias.
+- blueprint api: construir la Api del Blueprint de `app.controllers` (antes se hacía al importar).
+- create_app: crear la aplicación con la documentación activada y desactivada.
+- primer /swagger.json: generarlo en la primera solicitud o leerlo del archivo precalculado.
+
+Uso:
+    python benchmarks/startup.py --repeat 7
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def make_config(docs, spec_file):
+    from app.config import Config
+
+    class StartupConfig(Config):
+        SQLALCHEMY_DATABASE_URI = 'sqlite:////tmp/bench_startup.db'
+        LOOKUP_CACHE_PRELOAD = False
+        API_DOCS_ENABLED = docs
+        API_SPEC_FILE = spec_file
+
+    return StartupConfig
+
+
+def export(path):
+    """Generar el archivo de la especificación como lo hace `flask export-openapi`."""
+    from app import create_app
+    from app.utils.openapi import export_spec
+
+    application = create_app(make_config(True, None))
+    with application.test_request_context():
+        export_spec(application.extensions['restx_api'], path)
+
+
+def measure(docs, spec_file):
+    """Medir en este proceso (recién creado) y devolver los tiempos en milisegundos."""
+    timings = {}
+    start = time.perf_counter()
+    import app
+    timings['import app'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    application = app.create_app(make_config(docs, spec_file))
+    timings['create_app'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    import app.controllers
+    app.controllers.api
+    timings['blueprint api'] = time.perf_counter() - start
+
+    if docs:
+        client = application.test_client()
+        start = time.perf_counter()
+        response = client.get('/swagger.json')
+        timings['first /swagger.json'] = time.perf_counter() - start
+        assert response.status_code == 200
+    return {name: value * 1000 for name, value in timings.items()}
+
+
+def run(docs, spec_file, repeat):
+    results = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, __file__, '--measure', '--docs', str(docs), '--spec-file', spec_file or ''],
+            capture_output=True, text=True, check=True, cwd=ROOT
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    return {name: statistics.median(result[name] for result in results) for name in results[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=7)
+    parser.add_argument('--spec-path', default='/tmp/bench_openapi.json')
+    parser.add_argument('--measure', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--docs', default='True', help=argparse.SUPPRESS)
+    parser.add_argument('--spec-file', default='', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(args.docs == 'True', args.spec_file or None)))
+        return
+
+    export(args.spec_path)
+
+    scenarios = [
+        ('docs, spec generada', True, None),
+        ('docs, spec en archivo', True, args.spec_path),
+        ('sin docs', False, None),
+    ]
+    print(f'Mediana de {args.repeat} procesos nuevos (ms)')
+    print(f'{"escenario":<24}{"import app":>12}{"create_app":>12}{"blueprint api":>15}{"1er swagger":>13}')
+    for label, docs, spec_file in scenarios:
+        result = run(docs, spec_file, args.repeat)
+        swagger = f'{result["first /swagger.json"]:.1f}' if 'first /swagger.json' in result else '-'
+        print(f'{label:<24}{result["import app"]:>12.1f}{result["create_app"]:>12.1f}'
+              f'{result["blueprint api"]:>15.1f}{swagger:>13}')
+
+
+if __name__ == '__main__':
+    main()
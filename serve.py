@@ -0,0 +1,7 @@
+from app.server import main
+
+# Punto de entrada de producción: gunicorn con varios procesos, la aplicación precargada
+# y el modo debug desactivado. Configuración con las variables SERVER_* (ver app/config.py).
+# Recarga sin cortar solicitudes: kill -HUP <pid del maestro>
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+import pytest
+from flask_jwt_extended import create_access_token
+
+from app import create_app, db
+from app.models.category import Category
+from app.models.priority import Priority
+from app.models.task import Task
+from app.utils.lookup_cache import category_cache, priority_cache
+
+
+@pytest.fixture
+def app():
+    """Aplicación con el perfil `testing` (SQLite en memoria) y las tablas creadas."""
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def auth_headers(app):
+    """Cabecera Authorization con un token JWT válido."""
+    return {'Authorization': f'Bearer {create_access_token(identity="tester")}'}
+
+
+@pytest.fixture
+def lookup_caches(app):
+    """Activa las cachés de consulta, vacías al empezar y al terminar la prueba."""
+    app.config['LOOKUP_CACHE_ENABLED'] = True
+    caches = (priority_cache, category_cache)
+    for cache in caches:
+        cache.invalidate()
+    yield caches
+    for cache in caches:
+        cache.invalidate()
+
+
+@pytest.fixture
+def seed_tasks(app):
+    """Devuelve una función que crea `count` tareas con dos categorías cada una."""
+
+    def seed(count):
+        priorities = [Priority('Alta'), Priority('Baja')]
+        categories = [Category(f'Categoría {index}') for index in range(3)]
+        db.session.add_all(priorities + categories)
+        db.session.flush()
+        for index in range(count):
+            task = Task(f'Tarea {index}', 'Descripción', priority_id=priorities[index % 2].id)
+            task.categories = [categories[index % 3], categories[(index + 1) % 3]]
+            db.session.add(task)
+        db.session.commit()
+        return db.session.scalars(db.select(Task.id).order_by(Task.id)).all()
+
+    return seed
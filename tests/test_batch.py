@@ -0,0 +1,34 @@
+import pytest
+
+from app import db
+from app.models.category import Category
+
+
+def test_batch_conflict_reports_failing_operation(client, auth_headers, seed_tasks):
+    seed_tasks(2)
+    operations = [
+        {'resource': 'categories', 'action': 'create', 'data': {'name': 'Nueva'}},
+        # La prioridad 1 está asignada a tareas: la base de datos rechaza el borrado
+        {'resource': 'priorities', 'action': 'delete', 'id': 1}
+    ]
+    response = client.post('/batch', json={'operations': operations}, headers=auth_headers)
+
+    assert response.status_code == 409
+    assert response.get_json()['index'] == 1
+    # El lote se deshizo completo
+    assert db.session.scalars(db.select(Category).where(Category.name == 'Nueva')).first() is None
+
+
+@pytest.mark.parametrize('operation, status', [
+    ({'resource': 'tasks', 'action': 'delete', 'id': 999}, 404),
+    ({'resource': 'categories', 'action': 'update', 'id': 999, 'data': {'name': 'Otra'}}, 404),
+    # Una referencia inexistente en los datos es un error de validación, no un 404
+    ({'resource': 'tasks', 'action': 'create', 'data': {'title': 'Tarea', 'priority_id': 999}}, 400)
+])
+def test_batch_maps_errors_by_type(client, auth_headers, seed_tasks, operation, status):
+    seed_tasks(1)
+    operations = [{'resource': 'categories', 'action': 'create', 'data': {'name': 'Nueva'}}, operation]
+    response = client.post('/batch', json={'operations': operations}, headers=auth_headers)
+
+    assert response.status_code == status
+    assert response.get_json()['index'] == 1
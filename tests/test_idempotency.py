@@ -0,0 +1,16 @@
+def test_unauthenticated_keys_are_scoped_by_client_address(client):
+    headers = {'Idempotency-Key': 'same-key'}
+    first = client.post('/priorities/', json={'name': 'Alta'}, headers=headers,
+                        environ_base={'REMOTE_ADDR': '10.0.0.1'})
+    replay = client.post('/priorities/', json={'name': 'Alta'}, headers=headers,
+                         environ_base={'REMOTE_ADDR': '10.0.0.1'})
+    other = client.post('/priorities/', json={'name': 'Media'}, headers=headers,
+                        environ_base={'REMOTE_ADDR': '10.0.0.2'})
+
+    assert first.status_code == 201
+    assert replay.headers['Idempotent-Replayed'] == 'true'
+    assert replay.get_json() == first.get_json()
+    # Otro cliente con la misma clave no recibe la respuesta del primero (ni un 422)
+    assert other.status_code == 201
+    assert 'Idempotent-Replayed' not in other.headers
+    assert other.get_json()['name'] == 'Media'
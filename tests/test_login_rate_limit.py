@@ -0,0 +1,38 @@
+import pytest
+
+from app import create_app, db
+from app.config import TestConfig
+
+
+class RateLimitConfig(TestConfig):
+    LOGIN_RATE_LIMIT_ENABLED = True
+    LOGIN_RATE_LIMIT_IP_BURST = 2
+    LOGIN_RATE_LIMIT_IP_PER_MINUTE = 1
+    LOGIN_RATE_LIMIT_USER_PER_MINUTE = 0  # Solo el cubo por IP
+    PROXY_FIX_X_FOR = 1
+
+
+@pytest.fixture
+def client():
+    app = create_app(RateLimitConfig)
+    with app.app_context():
+        db.create_all()
+        yield app.test_client()
+        db.session.remove()
+        db.drop_all()
+
+
+def login(client, forwarded_for):
+    # Todas las conexiones llegan desde el balanceador, con la IP del cliente en X-Forwarded-For
+    return client.post('/auth/login', json={'username': 'nadie', 'password': 'x'},
+                       headers={'X-Forwarded-For': forwarded_for}, environ_base={'REMOTE_ADDR': '10.0.0.1'})
+
+
+def test_ip_bucket_uses_forwarded_client_address(client):
+    assert [login(client, '203.0.113.1').status_code for _ in range(3)] == [401, 401, 429]
+    assert login(client, '203.0.113.2').status_code == 401
+
+
+def test_zero_rate_disables_bucket(client):
+    # El cubo por usuario tiene PER_MINUTE 0: no limita (ni divide por cero) pasado su BURST
+    assert [login(client, f'203.0.113.{index}').status_code for index in range(8)] == [401] * 8
@@ -0,0 +1,39 @@
+from app import db
+from app.models.category import Category
+from app.services.table_version_service import TableVersionService
+from app.utils.lookup_cache import category_cache
+
+
+def write_from_another_process(name):
+    # Escritura confirmada por otro worker: incrementa la versión pero no invalida esta caché
+    db.session.add(Category(name))
+    TableVersionService.bump('categories')
+    db.session.commit()
+
+
+def test_cache_reloads_when_table_version_changes(client, auth_headers, seed_tasks, lookup_caches):
+    seed_tasks(1)
+    first = client.get('/categories/', headers=auth_headers)
+    assert category_cache.is_current(TableVersionService.get_versions(['categories'])['categories'])
+
+    write_from_another_process('Remota')
+    second = client.get('/categories/', headers=auth_headers)
+    assert second.headers['ETag'] != first.headers['ETag']
+    assert [category['name'] for category in second.get_json()][-1] == 'Remota'
+
+    new_id = second.get_json()[-1]['id']
+    response = client.post('/tasks/', json={'title': 'Con categoría remota', 'priority_id': 1, 'category_ids': [new_id]},
+                           headers=auth_headers)
+    assert response.status_code == 201
+
+
+def test_testing_profile_reads_lookup_tables_without_cache(client, auth_headers, seed_tasks):
+    seed_tasks(1)
+    client.get('/categories/', headers=auth_headers)
+    assert not category_cache.is_current(TableVersionService.get_versions(['categories'])['categories'])
+
+    # Sin incrementar la versión: solo se ve si la tabla se lee en cada solicitud
+    db.session.add(Category('Sin caché'))
+    db.session.commit()
+    response = client.get('/categories/', headers=auth_headers)
+    assert [category['name'] for category in response.get_json()][-1] == 'Sin caché'
@@ -0,0 +1,63 @@
+import threading
+import time
+
+import pytest
+
+from app.utils import password_hasher
+
+
+@pytest.mark.parametrize('pool_size, workers, cpus, expected', [
+    (None, 4, 8, 2),
+    (None, 8, 4, 1),
+    (3, 8, 4, 3),
+    (0, 8, 4, 0)
+])
+def test_pool_size_shares_cores_between_workers(monkeypatch, pool_size, workers, cpus, expected):
+    monkeypatch.setattr(password_hasher.os, 'cpu_count', lambda: cpus)
+    assert password_hasher.bcrypt_pool_size({'BCRYPT_POOL_SIZE': pool_size, 'SERVER_WORKERS': workers}) == expected
+
+
+def test_pool_timeout_covers_queue_and_result(app, monkeypatch):
+    class Future:
+        def result(self, timeout):
+            waits.append(timeout)
+            return True
+
+    class Executor:
+        def submit(self, func, *args):
+            time.sleep(0.2)  # Tiempo ya consumido del plazo
+            return Future()
+
+    waits = []
+    app.config.update(BCRYPT_POOL_SIZE=1, BCRYPT_POOL_TIMEOUT=1)
+    monkeypatch.setattr(password_hasher, '_get_executor', lambda: (Executor(), threading.BoundedSemaphore(1)))
+    assert password_hasher._run(lambda: None)
+    assert waits[0] <= 0.8
+
+
+@pytest.fixture
+def saturated_pool(app, monkeypatch):
+    """Pool de bcrypt activado y sin huecos en su cola."""
+    pending = threading.BoundedSemaphore(1)
+    pending.acquire()
+    app.config.update(BCRYPT_POOL_SIZE=1, BCRYPT_POOL_TIMEOUT=0.01)
+    monkeypatch.setattr(password_hasher, '_get_executor', lambda: (None, pending))
+    monkeypatch.setattr(password_hasher, '_check_seconds', 0.01)
+
+
+def test_saturated_pool_rejects_known_and_unknown_users_alike(client, saturated_pool):
+    from app import db
+    from app.models.user import User
+
+    db.session.add(User('existe', '$2b$04$' + 'x' * 53))
+    db.session.commit()
+    for username in ('existe', 'no-existe'):
+        response = client.post('/auth/login', json={'username': username, 'password': 'x'})
+        assert response.status_code == 503
+
+
+def test_dummy_hash_costs_a_full_check_without_hashing(app):
+    app.config['BCRYPT_LOG_ROUNDS'] = 4
+    pw_hash = password_hasher._dummy_hash()
+    assert pw_hash.startswith('$2b$04$') and len(pw_hash) == 60
+    assert not password_hasher._check_password(pw_hash.encode(), b'dummy-password')
@@ -0,0 +1,22 @@
+import pytest
+
+from app.utils.sql_counter import assert_max_queries, count_queries
+
+
+@pytest.mark.parametrize('count', [5, 50])
+def test_task_list_statement_count_is_constant(client, auth_headers, seed_tasks, count):
+    seed_tasks(count)
+    with count_queries() as counter:
+        response = client.get('/tasks/?limit=50', headers=auth_headers)
+    assert response.status_code == 200
+    assert len(response.get_json()) == count
+    # Versión de la tabla para el ETag, página de tareas y sus categorías (SELECT ... IN)
+    assert counter.count == 3, counter.statements
+
+
+def test_task_detail_statement_count(client, auth_headers, seed_tasks):
+    task_ids = seed_tasks(5)
+    with assert_max_queries(3):
+        response = client.get(f'/tasks/{task_ids[0]}', headers=auth_headers)
+    assert response.status_code == 200
+    assert len(response.get_json()['categories']) == 2
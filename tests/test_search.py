@@ -0,0 +1,30 @@
+import pytest
+
+from app import db
+from app.models.task import Task
+from app.services.search_service import LikeSearchBackend, SearchBackend
+
+
+def test_search_backend_is_abstract():
+    with pytest.raises(TypeError):
+        SearchBackend()
+
+
+def test_like_backend_matches_every_word(app, seed_tasks):
+    seed_tasks(0)
+    db.session.add_all([
+        Task('Informe anual', 'Revisar 100% de las cifras', priority_id=1),
+        Task('Reunión', 'Preparar el informe anual', priority_id=1),
+        Task('Informe mensual', None, priority_id=1)
+    ])
+    db.session.commit()
+    backend = LikeSearchBackend()
+
+    titles = lambda ids: [db.session.get(Task, task_id).title for task_id in ids]
+    # Primero las tareas con todas las palabras en el título
+    assert titles(backend.search('ANUAL informe', 0, 10)) == ['Informe anual', 'Reunión']
+    assert titles(backend.search('informe', 1, 2)) == ['Informe mensual', 'Reunión']
+    # Los signos se ignoran y `_` (comodín de LIKE) se busca literalmente
+    assert titles(backend.search('100%', 0, 10)) == ['Informe anual']
+    assert backend.search('%', 0, 10) == []
+    assert backend.search('inform_', 0, 10) == []
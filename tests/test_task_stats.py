@@ -0,0 +1,102 @@
+import pytest
+from sqlalchemy import update
+
+from app import db
+from app.models.task import Task
+from app.services.task_counter_service import TaskCounterService
+from app.services.task_service import TaskService
+
+
+@pytest.fixture
+def seeded(seed_tasks):
+    """Cuatro tareas abiertas (prioridades 1, 2, 1, 2) con los contadores recalculados."""
+    task_ids = seed_tasks(4)
+    TaskCounterService.reconcile()
+    return task_ids
+
+
+def summary(stats):
+    return (stats['total'], stats['completed'], [entry['completed'] for entry in stats['by_priority']],
+            [entry['completed'] for entry in stats['by_category']])
+
+
+def assert_counters_consistent():
+    # Los contadores mantenidos en cada escritura coinciden con un recálculo completo
+    maintained = TaskCounterService.get_stats()
+    TaskCounterService.reconcile()
+    assert maintained == TaskCounterService.get_stats()
+
+
+def test_complete_and_reopen_transitions(client, auth_headers, seeded):
+    first = seeded[0]  # Prioridad 1, categorías 1 y 2
+
+    TaskService.mark_task_completed(first)
+    stats = client.get('/tasks/stats', headers=auth_headers).get_json()
+    assert summary(stats) == (4, 1, [1, 0], [1, 1, 0])
+    assert stats['open'] == 3
+
+    # Completar otra vez no cambia los contadores
+    assert TaskService.mark_task_completed(first).completed
+    assert summary(TaskCounterService.get_stats()) == (4, 1, [1, 0], [1, 1, 0])
+
+    assert not TaskService.mark_task_incomplete(first).completed
+    assert summary(TaskCounterService.get_stats()) == (4, 0, [0, 0], [0, 0, 0])
+    assert_counters_consistent()
+
+
+def test_update_task_moves_counters_between_categories(seeded):
+    category_ids = [category.id for category in db.session.get(Task, seeded[1]).categories]  # Categorías 2 y 3
+
+    TaskService.update_task(seeded[1], completed=True, category_ids=[category_ids[0]])
+    stats = TaskCounterService.get_stats()
+    assert summary(stats) == (4, 1, [0, 1], [0, 1, 0])
+    assert [entry['total'] for entry in stats['by_category']] == [3, 3, 1]
+    assert_counters_consistent()
+
+
+def test_stale_task_in_session_is_not_counted_twice(seeded):
+    # La tarea se leyó abierta justo antes de que otra solicitud la completara: la fila y
+    # los contadores cambian en la base de datos, pero la copia de la sesión no
+    task = db.session.get(Task, seeded[0])
+    assert not task.completed
+    state = TaskCounterService.task_state(task)
+    db.session.execute(
+        update(Task).where(Task.id == task.id).values(completed=True).execution_options(synchronize_session=False)
+    )
+    TaskCounterService.apply(TaskCounterService.diff(state, state[:2] + (True,)))
+
+    assert TaskService.mark_task_completed(seeded[0]).completed
+    assert TaskService.update_task(seeded[0], completed=True).completed
+    assert TaskCounterService.get_stats()['completed'] == 1
+    assert_counters_consistent()
+
+
+def test_missing_task_raises(seeded):
+    with pytest.raises(ValueError, match='Task not found'):
+        TaskService.mark_task_completed(999)
+    with pytest.raises(ValueError, match='Task not found'):
+        TaskService.update_task(999, completed=True)
+
+
+def test_complete_by_ids_counts_only_changed_tasks(client, auth_headers, seeded):
+    response = client.post('/tasks/complete', json={'ids': seeded[:2]}, headers=auth_headers)
+    assert response.get_json() == {'updated': 2}
+    assert summary(TaskCounterService.get_stats()) == (4, 2, [1, 1], [1, 2, 1])
+
+    # Las dos primeras ya están completadas: solo cambia la tercera
+    response = client.post('/tasks/complete', json={'ids': seeded[:3]}, headers=auth_headers)
+    assert response.get_json() == {'updated': 1}
+    assert summary(TaskCounterService.get_stats()) == (4, 3, [2, 1], [2, 2, 2])
+    assert_counters_consistent()
+
+
+def test_complete_and_reopen_by_filter(client, auth_headers, seeded):
+    response = client.post('/tasks/complete', json={'filter': {'priority_id': 1}}, headers=auth_headers)
+    assert response.get_json() == {'updated': 2}
+    assert summary(TaskCounterService.get_stats()) == (4, 2, [2, 0], [2, 1, 1])
+
+    # La categoría 1 tiene las tareas 1, 3 y 4; solo la 1 y la 3 estaban completadas
+    response = client.post('/tasks/reopen', json={'filter': {'category_id': 1}}, headers=auth_headers)
+    assert response.get_json() == {'updated': 2}
+    assert summary(TaskCounterService.get_stats()) == (4, 0, [0, 0], [0, 0, 0])
+    assert_counters_consistent()
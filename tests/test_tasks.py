@@ -0,0 +1,20 @@
+import pytest
+
+
+@pytest.mark.parametrize('body, message', [
+    ({'title': 'Sin prioridad'}, 'Priority is required'),
+    ({'title': 'Prioridad inexistente', 'priority_id': 99}, 'Priority not found'),
+    ({'title': 'Categoría inexistente', 'priority_id': 1, 'category_ids': [99]}, 'Some categories do not exist'),
+])
+def test_create_task_rejects_invalid_references(client, auth_headers, seed_tasks, body, message):
+    seed_tasks(1)
+    response = client.post('/tasks/', json=body, headers=auth_headers)
+    assert response.status_code == 400
+    assert response.get_json()['message'] == message
+
+
+def test_create_task(client, auth_headers, seed_tasks):
+    seed_tasks(1)
+    response = client.post('/tasks/', json={'title': 'Nueva', 'priority_id': 1, 'category_ids': [1]}, headers=auth_headers)
+    assert response.status_code == 201
+    assert [category['id'] for category in response.get_json()['categories']] == [1]